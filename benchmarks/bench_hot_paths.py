@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright © 2019, SAS Institute Inc., Cary, NC, USA.  All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Measure throughput and latency of frequently used sasctl operations.
+
+Each benchmark runs against a local `FakeViya` server with a fixed simulated
+network latency so that results reflect client-side behavior such as
+connection pooling, paging concurrency, and upload handling.
+
+    python benchmarks/bench_hot_paths.py
+    python benchmarks/bench_hot_paths.py --only list_models --latency 0.02
+    python benchmarks/bench_hot_paths.py --output new.json --baseline old.json
+
+When `--baseline` is given, any benchmark whose throughput dropped by more
+than `--tolerance` compared to the baseline is reported and the script exits
+with status 1.
+
+"""
+
+import argparse
+import io
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from fake_viya import FakeViya
+
+from sasctl.services import files as _files
+from sasctl.services import microanalytic_score as mas
+from sasctl.services import model_repository as mr
+
+BENCHMARKS = {}
+
+
+def benchmark(name, calls, threads=1):
+    """Register a benchmark.
+
+    The decorated function receives the running `FakeViya` server and returns
+    the operation to time, which is called `calls` times from `threads`
+    threads.
+
+    """
+
+    def decorator(func):
+        BENCHMARKS[name] = (func, calls, threads)
+        return func
+
+    return decorator
+
+
+def _percentile(samples, q):
+    return samples[max(0, int(math.ceil(q / 100.0 * len(samples))) - 1)]
+
+
+def measure(operation, calls, threads):
+    """Call `operation` repeatedly and summarize the latency of each call."""
+
+    def timed(i):
+        start = time.perf_counter()
+        operation(i)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    if threads > 1:
+        with ThreadPoolExecutor(threads) as pool:
+            latencies = list(pool.map(timed, range(calls)))
+    else:
+        latencies = [timed(i) for i in range(calls)]
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "calls": calls,
+        "threads": threads,
+        "seconds": elapsed,
+        "throughput": calls / elapsed,
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p95_ms": _percentile(latencies, 95) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+    }
+
+
+@benchmark("execute_module_step", calls=500, threads=8)
+def bench_execute_module_step(server):
+    mas.clear_module_cache()
+    return lambda i: mas.execute_module_step("bench_module", "score", x1=i, x2=1.5)
+
+
+@benchmark("list_models", calls=5)
+def bench_list_models(server):
+    server.add_models(2000)
+    return lambda i: sum(1 for _ in mr.list_models(limit=100))
+
+
+@benchmark("register_model", calls=20)
+def bench_register_model(server):
+    from sasctl import register_model
+
+    contents = [
+        {"name": "file%d.bin" % n, "file": os.urandom(100 * 1024), "role": "score"}
+        for n in range(5)
+    ]
+
+    def register(i):
+        model = {"name": "model_%d" % i, "function": "classification"}
+        register_model(
+            model, model["name"], "Benchmark", files=list(contents), force=True
+        )
+
+    return register
+
+
+@benchmark("import_model_from_zip", calls=10)
+def bench_import_model_from_zip(server):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as z:
+        z.writestr("model.pkl", os.urandom(5 * 1024 * 1024))
+    project = server.add("/modelRepository/projects", name="Zip Project")
+
+    def import_zip(i):
+        buffer.seek(0)
+        mr.import_model_from_zip("zip_model_%d" % i, project["id"], buffer)
+
+    return import_zip
+
+
+@benchmark("create_file", calls=20)
+def bench_create_file(server):
+    content = os.urandom(1024 * 1024)
+    return lambda i: _files.create_file(io.BytesIO(content), filename="file_%d.bin" % i)
+
+
+@benchmark("download_file", calls=10)
+def bench_download_file(server):
+    file = server.add(
+        "/files/files", name="large.bin", _content=os.urandom(20 * 1024 * 1024)
+    )
+    dest = os.path.join(tempfile.mkdtemp(), "large.bin")
+    return lambda i: _files.download_file(file, dest, resume=False)
+
+
+def run(names, latency):
+    results = {}
+    for name in names:
+        setup, calls, threads = BENCHMARKS[name]
+        with FakeViya(latency=latency, seed=0) as server:
+            with server.session():
+                operation = setup(server)
+                operation(-1)  # Warm up connections and caches
+                results[name] = measure(operation, calls, threads)
+                results[name]["requests"] = sum(server.requests.values())
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Return the benchmarks whose throughput regressed."""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["throughput"]
+        if result["throughput"] < before * (1 - tolerance):
+            regressions.append((name, before, result["throughput"]))
+    return regressions
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--only", action="append", choices=sorted(BENCHMARKS))
+    parser.add_argument(
+        "--latency", type=float, default=0.005, help="simulated latency in seconds"
+    )
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="allowed fractional drop in throughput before failing",
+    )
+    args = parser.parse_args(args)
+
+    results = run(args.only or list(BENCHMARKS), args.latency)
+
+    print(
+        "%-24s %8s %8s %10s %9s %9s %9s"
+        % ("benchmark", "calls", "threads", "calls/s", "p50 ms", "p95 ms", "p99 ms")
+    )
+    for name, r in results.items():
+        print(
+            "%-24s %8d %8d %10.1f %9.1f %9.1f %9.1f"
+            % (
+                name,
+                r["calls"],
+                r["threads"],
+                r["throughput"],
+                r["p50_ms"],
+                r["p95_ms"],
+                r["p99_ms"],
+            )
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for name, before, after in regressions:
+            print("REGRESSION %s: %.1f -> %.1f calls/s" % (name, before, after))
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
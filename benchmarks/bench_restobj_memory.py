@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright © 2019, SAS Institute Inc., Cary, NC, USA.  All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Measure memory used by a 100k item listing of models.
+
+Compares the parsed JSON against `RestObj` instances built the way
+`PageIterator` builds them, with the strings repeated in every resource's
+links interned and links indexed by rel on first lookup.
+
+    python benchmarks/bench_restobj_memory.py
+
+"""
+
+import gc
+import json
+import time
+import tracemalloc
+
+from sasctl.core import RestObj, _compact_links, get_link
+
+N = 100000
+
+# Number of link lookups per item
+REPEAT = 5
+
+LINKS = [
+    ("GET", "self", "application/vnd.sas.models.model"),
+    ("PUT", "update", "application/vnd.sas.models.model"),
+    ("DELETE", "delete", None),
+    ("GET", "contents", "application/vnd.sas.collection"),
+    ("POST", "addContent", "application/vnd.sas.models.model.content"),
+    ("GET", "variables", "application/vnd.sas.collection"),
+    ("GET", "modelVersions", "application/vnd.sas.collection"),
+    ("GET", "score", "application/vnd.sas.score.code.generation.request"),
+]
+
+
+def make_listing():
+    items = []
+    for i in range(N):
+        uri = "/modelRepository/models/%08d-0000-0000-0000-000000000000" % i
+        links = []
+        for method, rel, type_ in LINKS:
+            link = {"method": method, "rel": rel, "href": uri, "uri": uri}
+            if type_:
+                link["type"] = type_
+            links.append(link)
+        items.append(
+            {"id": uri.rsplit("/", 1)[-1], "name": "Model %d" % i, "links": links}
+        )
+    return json.dumps({"items": items})
+
+
+def measure(text, convert):
+    tracemalloc.start()
+    items = [convert(x) for x in json.loads(text)["items"]]
+
+    # Include any link indexes built by lookups
+    for item in items:
+        get_link(item, "self")
+
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    gc.disable()
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        for item in items:
+            get_link(item, "score")
+    elapsed = time.perf_counter() - start
+    gc.enable()
+
+    return size, elapsed
+
+
+def main():
+    text = make_listing()
+
+    for name, convert in (
+        # Plain dictionaries use the previous linear scan in get_link()
+        ("plain", dict),
+        ("compact", lambda x: RestObj(_compact_links(x))),
+    ):
+        size, elapsed = measure(text, convert)
+        print(
+            "%-8s %8.1f MB   get_link: %6.1f ms" % (name, size / 2**20, elapsed * 1000)
+        )
+
+
+if __name__ == "__main__":
+    main()
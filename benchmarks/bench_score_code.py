@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright © 2019, SAS Institute Inc., Cary, NC, USA.  All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compare the per-row latency of generated Python score code.
+
+Generates score code for a scikit-learn model with and without
+`array_input=True` and times calls to the resulting `score()` function with
+a single row of scalar inputs, as SAS Micro Analytic Service does.  Also
+times scoring a large DataFrame with `score()` and with the `score_batch()`
+function written by `batch_function=True`.
+
+    python benchmarks/bench_score_code.py
+    python benchmarks/bench_score_code.py --columns 50 --calls 5000
+    python benchmarks/bench_score_code.py --rows 1000000
+
+Requires numpy, pandas, and scikit-learn.
+
+"""
+
+import argparse
+import codecs
+import json
+import math
+import pickle
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+
+from sasctl.pzmm.write_score_code import ScoreCode
+
+
+def _percentile(samples, q):
+    return samples[max(0, int(math.ceil(q / 100.0 * len(samples))) - 1)]
+
+
+def generate(data, model, function="score", **kwargs):
+    """Generate score code for `model` and return one of its functions."""
+    binary_string = codecs.encode(pickle.dumps(model), "base64").decode()
+    ScoreCode.score_code = ""
+    with warnings.catch_warnings():
+        # No connection to SAS Viya is needed for a binary string model
+        warnings.simplefilter("ignore")
+        code = ScoreCode.write_score_code(
+            "bench",
+            data,
+            [model.predict_proba, [0.5, 0.5]],
+            target_variable="target",
+            target_values=["1", "0"],
+            predict_threshold=0.5,
+            binary_string=binary_string.replace("\n", ""),
+            **kwargs,
+        )["score_bench.py"]
+
+    namespace = {}
+    exec(compile(code, "score_bench.py", "exec"), namespace)
+    return namespace[function]
+
+
+def measure(score, rows):
+    latencies = []
+    for row in rows:
+        start = time.perf_counter()
+        score(*row)
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    return {
+        "calls": len(rows),
+        "mean_us": sum(latencies) / len(latencies) * 1e6,
+        "p50_us": _percentile(latencies, 50) * 1e6,
+        "p99_us": _percentile(latencies, 99) * 1e6,
+    }
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--output", help="write results to this JSON file")
+    args = parser.parse_args(args)
+
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(
+        rng.normal(size=(1000, args.columns)),
+        columns=["x%d" % i for i in range(args.columns)],
+    )
+    model = LogisticRegression().fit(data, data.sum(axis=1) > 0)
+    rows = rng.normal(size=(args.calls, args.columns)).tolist()
+
+    variants = {
+        "dataframe": {},
+        "dataframe+impute": {"missing_values": True},
+        "array_input": {"array_input": True},
+        "array_input+impute": {"array_input": True, "missing_values": True},
+    }
+
+    results = {}
+    with warnings.catch_warnings():
+        # The model was fit with feature names but receives an array
+        warnings.simplefilter("ignore")
+        for name, kwargs in variants.items():
+            score = generate(data, model, **kwargs)
+            score(*rows[0])  # Warm up
+            results[name] = measure(score, rows)
+
+    print(
+        "%-20s %8s %10s %10s %10s" % ("variant", "calls", "mean us", "p50 us", "p99 us")
+    )
+    for name, r in results.items():
+        print(
+            "%-20s %8d %10.1f %10.1f %10.1f"
+            % (name, r["calls"], r["mean_us"], r["p50_us"], r["p99_us"])
+        )
+
+    batch = pd.DataFrame(
+        rng.normal(size=(args.rows, args.columns)), columns=data.columns
+    )
+    score = generate(data, model)
+    score_batch = generate(data, model, "score_batch", batch_function=True)
+    batch_variants = {
+        "score(Series)": lambda: score(*(batch[c] for c in batch.columns)),
+        "score_batch": lambda: score_batch(batch),
+    }
+
+    print("\n%-20s %8s %10s %12s" % ("batch", "rows", "seconds", "rows/s"))
+    for name, run in batch_variants.items():
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        results[name] = {"rows": args.rows, "seconds": elapsed}
+        print(
+            "%-20s %8d %10.3f %12.0f" % (name, args.rows, elapsed, args.rows / elapsed)
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright © 2019, SAS Institute Inc., Cary, NC, USA.  All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Measure the overhead added to each request by `Session.send` logging.
+
+Requests are answered by an in-process adapter so that only the cost of
+`Session.send` itself is measured.
+
+    python benchmarks/bench_send_logging.py
+
+"""
+
+import logging
+import timeit
+from unittest import mock
+
+import requests
+from requests.adapters import BaseAdapter
+
+from sasctl import Session
+
+N = 500
+BODY = b'{"access_token": "abc", "items": [' + b'"x", ' * 500000 + b'"x"]}'
+
+
+class CannedAdapter(BaseAdapter):
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.url = request.url
+        response.request = request
+        response._content = BODY
+        return response
+
+    def close(self):
+        pass
+
+
+def main():
+    with mock.patch("sasctl.core.Session._get_authorization_token"):
+        s = Session("example.com", "user", "password", protocol="http")
+    s.mount("http://", CannedAdapter())
+    request = s.prepare_request(
+        requests.Request("POST", "http://example.com/files", data=BODY)
+    )
+
+    # Silence anything a parent logger might emit.
+    s.message_log.addHandler(logging.NullHandler())
+    s.message_log.propagate = False
+
+    def best(func):
+        return min(timeit.repeat(func, number=N, repeat=5)) / N
+
+    baseline = best(lambda: requests.Session.send(s, request))
+
+    for name, level in (
+        ("disabled", logging.WARNING),
+        ("INFO", logging.INFO),
+        ("DEBUG", logging.DEBUG),
+    ):
+        s.message_log.setLevel(level)
+        t = best(lambda: s.send(request))
+        print(
+            "%-8s  %8.2f us/request  (+%.2f us vs. requests.Session.send)"
+            % (name, t * 1e6, (t - baseline) * 1e6)
+        )
+
+
+if __name__ == "__main__":
+    main()
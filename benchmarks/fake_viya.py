@@ -0,0 +1,495 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright © 2019, SAS Institute Inc., Cary, NC, USA.  All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""A local stand-in for the SAS Viya REST APIs used by sasctl.
+
+Implements just enough of modelRepository, microanalyticScore, files,
+folders, casManagement, and a generic jobs endpoint for sasctl to run against
+it, with configurable latency, page sizes, and error injection.  Intended for
+benchmarks and load tests, not for verifying API compatibility.
+
+    >>> with FakeViya(latency=0.01) as server:
+    ...     with server.session():
+    ...         mr.list_models()
+
+"""
+
+import email.parser
+import itertools
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Collections that items can be created in and listed from.  Nested
+# collections such as model contents are created on demand.
+COLLECTIONS = (
+    "/modelRepository/repositories",
+    "/modelRepository/projects",
+    "/modelRepository/models",
+    "/microanalyticScore/modules",
+    "/files/files",
+    "/folders/folders",
+    "/casManagement/servers",
+    "/jobs",
+)
+
+_FILTER = re.compile(r"eq\((\w+),\s*'?([^')]*)'?\)")
+
+
+class FakeViya:
+    """An in-memory SAS Viya server running in a background thread.
+
+    Parameters
+    ----------
+    latency : float or (float, float), optional
+        Seconds to wait before answering each request.  A tuple gives the
+        bounds of a uniformly distributed random latency.
+    latencies : dict, optional
+        Latency overrides for specific endpoints, keyed by "METHOD /path"
+        prefixes such as "POST /microanalyticScore".
+    page_size : int, optional
+        Number of items returned per page when the client doesn't specify a
+        limit.  Defaults to 20.
+    max_page_size : int, optional
+        Largest page the server will return regardless of the requested
+        limit.  Defaults to 1000.
+    error_rate : float, optional
+        Fraction of requests answered with `error_status` instead of being
+        processed.  Defaults to 0.
+    error_status : int, optional
+        Status code used for injected errors.  Defaults to 503.
+    job_polls : int, optional
+        Number of times a job must be polled before it completes.
+    seed : int, optional
+        Seed for the random number generator used for latency and errors.
+
+    Attributes
+    ----------
+    url : str
+        Base URL of the server once started.
+    requests : collections.Counter
+        Number of requests received per "METHOD /path" with ids replaced by
+        "{id}".
+
+    """
+
+    def __init__(
+        self,
+        latency=0.0,
+        latencies=None,
+        page_size=20,
+        max_page_size=1000,
+        error_rate=0.0,
+        error_status=503,
+        job_polls=2,
+        seed=None,
+    ):
+        self.latency = latency
+        self.latencies = latencies or {}
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.job_polls = job_polls
+        self.requests = Counter()
+
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._collections = {path: OrderedDict() for path in COLLECTIONS}
+        self._server = None
+        self._thread = None
+        self.url = None
+
+        self._seed()
+
+    # -- Lifecycle ---------------------------------------------------------
+
+    def start(self):
+        """Start answering requests on a random local port."""
+        handler = type("Handler", (_Handler,), {"fake": self})
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        self.url = "http://127.0.0.1:%d" % self._server.server_port
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def session(self, **kwargs):
+        """Create a `sasctl.Session` connected to the server.
+
+        Parameters
+        ----------
+        kwargs : any
+            Passed to `sasctl.Session`.
+
+        Returns
+        -------
+        sasctl.Session
+
+        """
+        from sasctl import Session
+
+        kwargs.setdefault("token", "fake-token")
+        return Session("http://127.0.0.1", port=self._server.server_port, **kwargs)
+
+    # -- Data --------------------------------------------------------------
+
+    def add(self, collection, item=None, **attributes):
+        """Add an item to a collection.
+
+        Parameters
+        ----------
+        collection : str
+            Path of the collection, such as "/modelRepository/models".
+        item : dict, optional
+            Attributes of the item.
+        attributes : any
+            Additional attributes of the item.
+
+        Returns
+        -------
+        dict
+            The stored item, including its id and links.
+
+        """
+        item = dict(item or {}, **attributes)
+        item.setdefault("id", str(uuid.uuid4()))
+        item.setdefault("name", item["id"])
+        item.setdefault("creationTimeStamp", time.strftime("%Y-%m-%dT%H:%M:%SZ"))
+
+        href = "%s/%s" % (collection, item["id"])
+        item["links"] = [
+            {"method": "GET", "rel": "self", "href": href, "uri": href},
+            {"method": "PUT", "rel": "update", "href": href, "uri": href},
+            {"method": "DELETE", "rel": "delete", "href": href, "uri": href},
+            {"method": "GET", "rel": "up", "href": collection, "uri": collection},
+        ]
+        if "_content" in item:
+            href += "/content"
+            item["links"].append(
+                {"method": "GET", "rel": "content", "href": href, "uri": href}
+            )
+
+        with self._lock:
+            self._collections.setdefault(collection, OrderedDict())[item["id"]] = item
+        return item
+
+    def add_models(self, count, project=None):
+        """Add `count` models, optionally to a project, and return them."""
+        project = project or self.add(
+            "/modelRepository/projects", name="Project %d" % len(self.requests)
+        )
+        return [
+            self.add(
+                "/modelRepository/models",
+                name="model_%d" % i,
+                projectId=project["id"],
+                projectName=project["name"],
+            )
+            for i in range(count)
+        ]
+
+    def create_job(self, **attributes):
+        """Add a job that completes after it has been polled `job_polls` times."""
+        attributes.setdefault("state", "running")
+        job = self.add("/jobs", _polls=0, **attributes)
+        return _public(job)
+
+    def items(self, collection):
+        with self._lock:
+            return [_public(x) for x in self._collections.get(collection, {}).values()]
+
+    def _seed(self):
+        folder = self.add("/folders/folders", name="My Folder", id="my-folder")
+        self.add("/folders/folders", name="Public", id="public")
+        self.add(
+            "/modelRepository/repositories",
+            name="Repository 1",
+            folderId=folder["id"],
+            defaultRepository=True,
+        )
+        module = self.add(
+            "/microanalyticScore/modules", name="bench_module", id="bench_module"
+        )
+        self.add(
+            "/microanalyticScore/modules/%s/steps" % module["id"],
+            id="score",
+            name="score",
+            inputs=[
+                {"name": "x1", "type": "decimal"},
+                {"name": "x2", "type": "decimal"},
+            ],
+            outputs=[{"name": "score", "type": "decimal"}],
+        )
+        self.add(
+            "/casManagement/servers", name="cas-shared-default", id="cas-shared-default"
+        )
+        self.add(
+            "/casManagement/servers/cas-shared-default/caslibs",
+            name="Public",
+            id="Public",
+        )
+
+    # -- Request handling --------------------------------------------------
+
+    def _delay(self, endpoint):
+        latency = self.latency
+        for prefix, value in self.latencies.items():
+            if endpoint.startswith(prefix):
+                latency = value
+                break
+
+        if isinstance(latency, (tuple, list)):
+            latency = self._random.uniform(*latency)
+        if latency:
+            time.sleep(latency)
+
+    def _inject_error(self):
+        return self.error_rate and self._random.random() < self.error_rate
+
+    def handle(self, method, path, query, headers, body):
+        """Process a request and return (status, headers, body)."""
+        endpoint = "%s %s" % (method, _endpoint(path))
+        with self._lock:
+            self.requests[endpoint] += 1
+
+        self._delay(endpoint)
+
+        if self._inject_error():
+            return self.error_status, {"Retry-After": "0"}, {"errorCode": 0}
+
+        if path == "/SASLogon/oauth/token":
+            return 200, {}, {"access_token": "fake-token", "expires_in": 3600}
+
+        if method == "POST" and re.match(
+            r"^/microanalyticScore/modules/[^/]+/steps/[^/]+$", path
+        ):
+            return self._execute_step(body)
+
+        if path.startswith("/folders/folders/@"):
+            return self._get(
+                "/folders/folders",
+                {"@myfolder": "my-folder", "@public": "public"}.get(
+                    path.rsplit("/", 1)[-1].lower(), ""
+                ),
+            )
+
+        if method == "GET" and path.endswith("/content"):
+            return self._content(path[: -len("/content")], headers)
+
+        collection, item_id = self._resolve(path)
+
+        if method == "GET":
+            if item_id is None:
+                return self._list(collection, query)
+            return self._get(collection, item_id)
+
+        if method == "POST" and item_id is None:
+            return self._create(collection, query, headers, body)
+
+        if method == "PUT" and item_id is not None:
+            return self._update(collection, item_id, body)
+
+        if method == "DELETE" and item_id is not None:
+            with self._lock:
+                removed = self._collections.get(collection, {}).pop(item_id, None)
+            return (204, {}, None) if removed else _not_found(path)
+
+        return 405, {}, {"errorCode": 405, "message": "Method not allowed"}
+
+    def _resolve(self, path):
+        """Split a path into its collection and item id (if any)."""
+        path = path.rstrip("/")
+        with self._lock:
+            if path in self._collections or path.endswith(
+                ("/contents", "/steps", "/caslibs", "/tables")
+            ):
+                return path, None
+        collection, _, item_id = path.rpartition("/")
+        return collection, item_id
+
+    def _list(self, collection, query):
+        with self._lock:
+            items = list(self._collections.get(collection, {}).values())
+
+        match = _FILTER.search(query.get("filter", [""])[0])
+        if match:
+            field, value = match.groups()
+            items = [x for x in items if str(x.get(field)) == value]
+
+        start = int(query.get("start", [0])[0])
+        limit = min(int(query.get("limit", [self.page_size])[0]), self.max_page_size)
+        page = items[start : start + limit]
+
+        links = [{"method": "GET", "rel": "collection", "href": collection}]
+        if start + limit < len(items):
+            href = "%s?start=%d&limit=%d" % (collection, start + limit, limit)
+            links.append({"method": "GET", "rel": "next", "href": href, "uri": href})
+
+        return (
+            200,
+            {},
+            {
+                "name": "items",
+                "start": start,
+                "limit": limit,
+                "count": len(items),
+                "items": [_public(x) for x in page],
+                "links": links,
+            },
+        )
+
+    def _get(self, collection, item_id):
+        with self._lock:
+            item = self._collections.get(collection, {}).get(item_id)
+            if item is None:
+                return _not_found(collection + "/" + item_id)
+
+            # Jobs complete after being polled enough times.
+            if collection == "/jobs" and item["state"] == "running":
+                item["_polls"] += 1
+                if item["_polls"] >= self.job_polls:
+                    item["state"] = "completed"
+            item = _public(item)
+
+        return 200, {"ETag": '"%s"' % hash(json.dumps(item, sort_keys=True))}, item
+
+    def _create(self, collection, query, headers, body):
+        content_type = headers.get("Content-Type", "")
+        item = {k: v[0] for k, v in query.items()}
+
+        if content_type.startswith("multipart/form-data"):
+            for name, filename, data in _parse_multipart(content_type, body):
+                item.setdefault("name", filename or name)
+                item["size"] = len(data)
+                item["_content"] = data
+        elif body and "json" in content_type:
+            item.update(json.loads(body))
+        elif body:
+            item["size"] = len(body)
+            item["_content"] = body
+
+        item = self.add(collection, item)
+        return 201, {"Location": item["links"][0]["href"]}, _public(item)
+
+    def _content(self, path, headers):
+        """Return the content of an item, honoring a "bytes=N-" Range header."""
+        collection, item_id = self._resolve(path)
+        with self._lock:
+            item = self._collections.get(collection, {}).get(item_id)
+        if item is None or "_content" not in item:
+            return _not_found(path + "/content")
+
+        data = item["_content"]
+        match = re.match(r"^bytes=(\d+)-$", headers.get("Range", ""))
+        if not match:
+            return 200, {"Accept-Ranges": "bytes"}, data
+
+        start = int(match.group(1))
+        if start >= len(data):
+            return 416, {"Content-Range": "bytes */%d" % len(data)}, b""
+        return (
+            206,
+            {"Content-Range": "bytes %d-%d/%d" % (start, len(data) - 1, len(data))},
+            data[start:],
+        )
+
+    def _update(self, collection, item_id, body):
+        with self._lock:
+            items = self._collections.get(collection, {})
+            if item_id not in items:
+                return _not_found(collection + "/" + item_id)
+            item = dict(items[item_id], **json.loads(body or b"{}"))
+            items[item_id] = item
+        return 200, {}, _public(item)
+
+    @staticmethod
+    def _execute_step(body):
+        inputs = json.loads(body or b"{}").get("inputs", [])
+        total = sum(
+            x["value"] for x in inputs if isinstance(x.get("value"), (int, float))
+        )
+        return 201, {}, {"outputs": [{"name": "score", "value": total}]}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Keep connections open so client connection pooling can be measured.
+    protocol_version = "HTTP/1.1"
+    fake = None
+
+    def _dispatch(self):
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+
+        status, headers, payload = self.fake.handle(
+            self.command, url.path, parse_qs(url.query), self.headers, body
+        )
+
+        if isinstance(payload, bytes):
+            data, content_type = payload, "application/octet-stream"
+        else:
+            data = b"" if payload is None else json.dumps(payload).encode("utf-8")
+            content_type = "application/json"
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _dispatch
+
+    def log_message(self, *args):
+        pass
+
+
+def _public(item):
+    """Copy of an item without the server's private bookkeeping fields."""
+    return {k: v for k, v in item.items() if not k.startswith("_")}
+
+
+def _not_found(path):
+    return 404, {}, {"errorCode": 404, "message": "%s not found" % path}
+
+
+def _endpoint(path):
+    return "/".join(
+        "{id}" if re.match(r"^[0-9a-f-]{36}$|^\d+$", s) else s for s in path.split("/")
+    )
+
+
+def _parse_multipart(content_type, body):
+    """Yield (field name, filename, bytes) for each part of a multipart body."""
+    message = email.parser.BytesParser().parsebytes(
+        b"Content-Type: " + content_type.encode("latin-1") + b"\r\n\r\n" + body
+    )
+    for part in itertools.islice(message.walk(), 1, None):
+        yield (
+            part.get_param("name", header="content-disposition"),
+            part.get_filename(),
+            part.get_payload(decode=True) or b"",
+        )
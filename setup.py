@@ -47,6 +47,8 @@ setup(
         "swat": ["swat"],
         "GitPython": ["GitPython"],
         "numpy": ["numpy"],
+        "async": ["httpx"],
+        "orjson": ["orjson"],
         "scikit-learn": ["scikit-learn"],
         "kerberos": [
             'kerberos ; platform_system != "Windows"',
@@ -54,6 +56,8 @@ setup(
         ],
         "all": [
             "swat",
+            "httpx",
+            "orjson",
             "GitPython",
             'kerberos ; platform_system != "Windows"',
             'winkerberos ; platform_system == "Windows"',
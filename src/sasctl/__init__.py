@@ -22,7 +22,9 @@ __copyright__ = (
     "Cary, NC, USA.  All Rights Reserved.",
 )
 
+import importlib
 import logging
+import sys
 import warnings
 
 from .core import (
@@ -38,7 +40,42 @@ from .core import (
     put,
     request_link,
 )
-from .tasks import publish_model, register_model, update_model_performance
+
+# Submodules and attributes that are only imported on first access.  `tasks`
+# depends on pandas and `pzmm` on pandas & numpy, neither of which is needed to
+# make REST calls, so loading them here would slow down every `import sasctl`.
+_LAZY_SUBMODULES = ("pzmm", "services", "tasks")
+_LAZY_ATTRIBUTES = {
+    "publish_model": "tasks",
+    "register_model": "tasks",
+    "update_model_performance": "tasks",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module("." + _LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    # Submodules are deliberately left out so that tools that walk `dir()`
+    # (such as the CLI) don't trigger their import.
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+# Module-level __getattr__ (PEP 562) requires Python 3.7, so import everything
+# up front on older versions.
+if sys.version_info < (3, 7):
+    for _name in _LAZY_SUBMODULES + tuple(_LAZY_ATTRIBUTES):
+        globals()[_name] = __getattr__(_name)
+    del _name
+
 
 # Ensure deprecation warnings are shown to users.
 warnings.filterwarnings("always", category=DeprecationWarning, module=r"^sasctl\.")
@@ -5,8 +5,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import os
-from typing import TextIO, Union
+from typing import Callable, Optional, TextIO, Union
 
+from ..core import MultipartStream
 from .service import Service
 
 QUERY_PARAMETERS = "query parameters"
@@ -300,12 +301,15 @@ class CASManagement(Service):
         header: bool = None,
         format_: str = None,
         *,
-        detail: dict = None
+        detail: dict = None,
+        compress: bool = False,
+        progress: Callable[[int, Optional[int]], None] = None
     ):
         """Upload a file to a CAS table.
 
         Uploads the contents of a CSV, XLS, XLSX, SAS7BDT or SASHDAT file to a
-        newly created CAS table.
+        newly created CAS table.  The file is read in chunks as it is
+        uploaded, so memory use does not depend on the size of the file.
 
         Parameters
         ----------
@@ -331,6 +335,12 @@ class CASManagement(Service):
             'varchars', 'scanRows', 'threadCount', 'stripBlanks', 'sheetName',
             'password', 'decryptionKey', 'stringLengthMultiplier',
             'varcharConversionThreshold'.
+        compress : bool, optional
+            Gzip the request as it is uploaded.  Only use if the server
+            accepts gzip-encoded requests.  Defaults to False.
+        progress : callable, optional
+            Called as ``progress(bytes_read, total_bytes)`` as the file is
+            uploaded.  `total_bytes` is None if the size of `file` is unknown.
 
         Returns
         -------
@@ -344,6 +354,7 @@ class CASManagement(Service):
         header = True if header is None else bool(header)
 
         # Not a file-like object, assuming it's a file path
+        path = None
         if not hasattr(file, "read"):
             path = os.path.abspath(os.path.expanduser(file))
             format_ = os.path.splitext(path)[-1].lstrip(".").lower()
@@ -353,9 +364,6 @@ class CASManagement(Service):
             if format_ not in ("csv", "xls", "xlsx", "sas7bdat", "sashdat"):
                 raise ValueError("File '%s' has an unsupported file type." % file)
 
-            with open(path, "rb") as f:
-                file = f.read()
-
         data = {
             "tableName": name,
             "containsHeaderRow": header,
@@ -430,12 +438,23 @@ class CASManagement(Service):
 
             data.update(detail)
 
-        tbl = cls.post(
-            "/servers/%s/caslibs/%s/tables" % (server, caslib),
-            data=data,
-            files={"file": (name, file)},
-        )
-        return tbl
+        def upload(f):
+            body = MultipartStream(
+                {"file": (name, f)},
+                fields=data,
+                compress=compress,
+                progress=progress,
+            )
+            return cls.post(
+                "/servers/%s/caslibs/%s/tables" % (server, caslib),
+                data=body,
+                headers=body.headers,
+            )
+
+        if path is not None:
+            with open(path, "rb") as f:
+                return upload(f)
+        return upload(file)
 
     @classmethod
     def update_state_table(
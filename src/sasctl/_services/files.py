@@ -8,6 +8,8 @@ import os
 
 from sasctl.utils.cli import sasctl_command
 
+from .. import core
+from ..core import MultipartStream
 from .folders import Folders
 from .service import Service
 
@@ -35,9 +37,21 @@ class Files(Service):
 
     @classmethod
     @sasctl_command("files", "create")
-    def create_file(cls, file, folder=None, filename=None, expiration=None):
+    def create_file(
+        cls,
+        file,
+        folder=None,
+        filename=None,
+        expiration=None,
+        *,
+        compress=False,
+        progress=None
+    ):
         """Create a new file on the server by uploading a local file.
 
+        The file is read in chunks as it is uploaded, so memory use does not
+        depend on the size of the file.
+
         Parameters
         ----------
         file : str or file_like
@@ -48,6 +62,12 @@ class Files(Service):
             Name to assign to the uploaded file.  Defaults to the filename if `file` is a path, otherwise required.
         expiration : datetime, optional
             A timestamp that indicates when to expire the file.  Defaults to no expiration.
+        compress : bool, optional
+            Gzip the request as it is uploaded.  Only use if the server
+            accepts gzip-encoded requests.  Defaults to False.
+        progress : callable, optional
+            Called as ``progress(bytes_read, total_bytes)`` as the file is
+            uploaded.  `total_bytes` is None if the size of `file` is unknown.
 
         Returns
         -------
@@ -57,16 +77,8 @@ class Files(Service):
         """
         if isinstance(file, str):
             filename = filename or os.path.splitext(os.path.split(file)[1])[0]
-
-            with open(file, "rb") as f:
-                file = f.read()
-        else:
-            if filename is None:
-                raise ValueError(
-                    "`filename` must be specified if `file` is not a path."
-                )
-
-            file = file.read()
+        elif filename is None:
+            raise ValueError("`filename` must be specified if `file` is not a path.")
 
         params = {}
 
@@ -82,7 +94,19 @@ class Files(Service):
             pass
             # TODO: add 'expirationTimeStamp' to params.  Need to determine correct format
 
-        return cls.post("/files#multipartUpload", files={filename: file}, params=params)
+        def upload(f):
+            body = MultipartStream({filename: f}, compress=compress, progress=progress)
+            return cls.post(
+                "/files#multipartUpload",
+                data=body,
+                headers=body.headers,
+                params=params,
+            )
+
+        if isinstance(file, str):
+            with open(file, "rb") as f:
+                return upload(f)
+        return upload(file)
 
     @classmethod
     @sasctl_command("files", "content")
@@ -113,3 +137,78 @@ class Files(Service):
             return r.content
 
         return r.text
+
+    @classmethod
+    def iter_content(cls, file, chunk_size=None):
+        """Download the contents of a file in chunks.
+
+        Unlike :meth:`get_file_content`, the file is never held in memory.
+
+        Parameters
+        ----------
+        file : str or dict
+            Name or file information as returned by :func:`get_file`.
+        chunk_size : int, optional
+            Maximum number of bytes to yield at a time.
+
+        Yields
+        ------
+        bytes
+
+        """
+        file = cls.get_file(file)
+        link = cls.get_link(file, "content")
+
+        if link is None:
+            raise ValueError("Link 'content' not found in object %s." % file)
+
+        return core.iter_content(link["href"], chunk_size=chunk_size)
+
+    @classmethod
+    def download_file(cls, file, dest, chunk_size=None, resume=False, checksum=None):
+        """Download the contents of a file to disk.
+
+        Parameters
+        ----------
+        file : str or dict
+            Name or file information as returned by :func:`get_file`.
+        dest : str, Path, or file_like
+            Path to save the file to or a writable binary file-like object.
+        chunk_size : int, optional
+            Number of bytes to write at a time.
+        resume : bool, optional
+            Continue an earlier download to `dest` that was interrupted.
+            Defaults to False.
+        checksum : str, optional
+            Expected digest of the file formatted as
+            ``"<algorithm>:<hex digest>"``, such as ``"sha256:9f86d081..."``.
+
+        Returns
+        -------
+        str or file_like
+            The path to the downloaded file, or `dest` if it's a file-like
+            object.
+
+        Raises
+        ------
+        ChecksumMismatchError
+            If the downloaded file doesn't match `checksum`.
+
+        See Also
+        --------
+        :func:`sasctl.core.download`
+
+        """
+        file = cls.get_file(file)
+        link = cls.get_link(file, "content")
+
+        if link is None:
+            raise ValueError("Link 'content' not found in object %s." % file)
+
+        return core.download(
+            link["href"],
+            dest,
+            chunk_size=chunk_size,
+            resume=resume,
+            checksum=checksum,
+        )
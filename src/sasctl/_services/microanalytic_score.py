@@ -6,12 +6,21 @@
 
 """A stateless, memory-resident, high-performance program execution service."""
 
+import concurrent.futures
 import re
-from collections import OrderedDict
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
 from math import isnan
 
+from ..core import current_session, sasctl_command
 from .service import Service
 
+# Number of rows per worker thread that execute_module_step_batch() submits
+# before waiting for results.
+_ROWS_PER_WORKER = 2
+
 
 class MicroAnalyticScore(Service):
     """Micro Analytic Service (MAS) client."""
@@ -44,10 +53,171 @@ class MicroAnalyticScore(Service):
         # MAS id.
         return re.match("^[_a-z][_a-z0-9]+$", id_) is not None
 
-    list_modules, get_module, update_module, delete_module = Service._crud_funcs(
+    list_modules, get_module, _update_module, _delete_module = Service._crud_funcs(
         "/modules", "module"
     )
 
+    # Number of seconds that resolved module & step metadata is reused before
+    # being requested from the server again.  Set to 0 to disable caching.
+    module_cache_ttl = 300
+
+    # Cached metadata is stored separately for each Session instance and is
+    # discarded along with the session.  The lock guards both the mapping of
+    # sessions and each session's cache, and is reentrant since reading or
+    # changing a cache also looks it up.
+    _module_cache = weakref.WeakKeyDictionary()
+    _module_cache_lock = threading.RLock()
+
+    @classmethod
+    def _get_cache(cls, create=False):
+        """Get the module metadata cache for the current session."""
+        session = current_session()
+
+        if session is None:
+            return None
+
+        with cls._module_cache_lock:
+            cache = cls._module_cache.get(session)
+            if cache is None and create:
+                cache = cls._module_cache[session] = {}
+        return cache
+
+    @classmethod
+    def _cache_lookup(cls, key):
+        """Return a cached value or None if not cached or expired."""
+        with cls._module_cache_lock:
+            cache = cls._get_cache()
+            if not cache:
+                return None
+
+            entry = cache.get(key)
+            if entry is None:
+                return None
+
+            expiration, value = entry
+            if expiration < time.monotonic():
+                cache.pop(key, None)
+                return None
+            return value
+
+    @classmethod
+    def _cache_store(cls, key, value):
+        """Cache `value` for `module_cache_ttl` seconds."""
+        if value is None or not cls.module_cache_ttl:
+            return value
+
+        with cls._module_cache_lock:
+            cache = cls._get_cache(create=True)
+            if cache is not None:
+                cache[key] = (time.monotonic() + cls.module_cache_ttl, value)
+        return value
+
+    @classmethod
+    def _get_cached_module(cls, module):
+        """Resolve a module using the cache when possible.
+
+        Parameters
+        ----------
+        module : str or dict
+            Name, id, or dictionary representation of a module
+
+        Returns
+        -------
+        RestObj or None
+
+        """
+        if module is None:
+            return None
+
+        # Module already contains the id so no lookup is necessary
+        if isinstance(module, dict) and "id" in module:
+            return module
+
+        key = ("module", str(module))
+        result = cls._cache_lookup(key)
+
+        if result is None:
+            result = cls.get_module(module)
+
+            if result is not None:
+                cls._cache_store(key, result)
+                cls._cache_store(("module", result["id"]), result)
+
+        return result
+
+    @classmethod
+    def clear_module_cache(cls, module=None):
+        """Discard cached module and step metadata for the current session.
+
+        Parameters
+        ----------
+        module : str or dict, optional
+            Name, id, or dictionary representation of a module.  If not
+            specified, all cached metadata is discarded.
+
+        Returns
+        -------
+        None
+
+        """
+        if isinstance(module, dict):
+            names = {module.get("id"), module.get("name")}
+        else:
+            names = {str(module)}
+
+        with cls._module_cache_lock:
+            cache = cls._get_cache()
+            if not cache:
+                return
+
+            if module is None:
+                cache.clear()
+                return
+
+            # Modules may be cached under their name as well as their id
+            for key, (_, value) in list(cache.items()):
+                if key[0] == "module" and key[1] in names:
+                    names.update((value.get("id"), value.get("name")))
+
+            for key, (_, value) in list(cache.items()):
+                module_id = value.get("id") if key[0] == "module" else key[1]
+                if key[1] in names or module_id in names:
+                    cache.pop(key, None)
+
+    @classmethod
+    @sasctl_command("modules", "update")
+    def update_module(cls, item):
+        """Update a module instance.
+
+        Parameters
+        ----------
+        item : dict
+
+        Returns
+        -------
+        None
+
+        """
+        cls.clear_module_cache(item)
+        return cls._update_module(item)
+
+    @classmethod
+    @sasctl_command("modules", "delete")
+    def delete_module(cls, item):
+        """Delete a module instance.
+
+        Parameters
+        ----------
+        item
+
+        Returns
+        -------
+        None
+
+        """
+        cls.clear_module_cache(item)
+        return cls._delete_module(item)
+
     @classmethod
     def get_module_step(cls, module, step):
         """Details of a single step in a given module.
@@ -63,10 +233,20 @@ class MicroAnalyticScore(Service):
         -------
         RestObj
 
+        Notes
+        -----
+        Results are cached for `module_cache_ttl` seconds.  Use
+        `clear_module_cache` to force the step to be requested again.
+
         """
-        module = cls.get_module(module)
+        module = cls._get_cached_module(module)
 
-        r = cls.get("/modules/{}/steps/{}".format(module.id, step))
+        key = ("step", module["id"], step)
+        r = cls._cache_lookup(key)
+
+        if r is None:
+            r = cls.get("/modules/{}/steps/{}".format(module["id"], step))
+            cls._cache_store(key, r)
         return r
 
     @classmethod
@@ -84,9 +264,9 @@ class MicroAnalyticScore(Service):
             List of :class:`.RestObj` instances representing each step.
 
         """
-        module = cls.get_module(module)
+        module = cls._get_cached_module(module)
 
-        steps = cls.get("/modules/{}/steps".format(module.id))
+        steps = cls.get("/modules/{}/steps".format(module["id"]))
         return steps if isinstance(steps, list) else [steps]
 
     @classmethod
@@ -112,15 +292,88 @@ class MicroAnalyticScore(Service):
             `return_dict` is True, otherwise returned as a tuple if more
             than one value is returned, otherwise the single value.
 
+        Notes
+        -----
+        Modules referenced by name are only looked up on the first call and
+        then cached for `module_cache_ttl` seconds, so subsequent calls
+        require a single request to the server.
+
         """
         module_name = module.name if hasattr(module, "name") else str(module)
-        module = cls.get_module(module)
+        module = cls._get_cached_module(module)
 
         if module is None:
             raise ValueError("Module '{}' was not found.".format(module_name))
-        module = module.id
+        module = module["id"]
         step = step.id if hasattr(step, "id") else step
 
+        body = cls._build_inputs(kwargs)
+
+        r = cls.post("/modules/{}/steps/{}".format(module, step), json=body)
+
+        return cls._format_outputs(r, return_dict)
+
+    @classmethod
+    async def execute_module_step_async(
+        cls, module, step, return_dict=True, session=None, **kwargs
+    ):
+        """Call a module step with the given parameters without blocking.
+
+        Parameters
+        ----------
+        module : str or dict
+            Name, id, or dictionary representation of a module
+        step : str
+            Name of the step
+        return_dict : bool, optional
+            Whether the results should be returned as a dictionary instead
+            of a tuple
+        session : AsyncSession or Session, optional
+            Defaults to an `AsyncSession` using `current_session()`.
+        kwargs : any
+            Passed as arguments to the module step
+
+        Returns
+        -------
+        any
+            Results of the step execution.  See `execute_module_step`.
+
+        Notes
+        -----
+        If `module` must be looked up by name, the lookup is performed
+        synchronously in a worker thread the first time and cached thereafter.
+
+        """
+        module_name = module.name if hasattr(module, "name") else str(module)
+
+        if not (isinstance(module, dict) and "id" in module):
+            cached = cls._cache_lookup(("module", str(module)))
+            if cached is None:
+                import asyncio
+
+                # Returns the running loop; get_running_loop() requires Python 3.7
+                loop = asyncio.get_event_loop()
+                cached = await loop.run_in_executor(
+                    None, cls._get_cached_module, module
+                )
+            module = cached
+
+        if module is None:
+            raise ValueError("Module '{}' was not found.".format(module_name))
+        module = module["id"]
+        step = step.id if hasattr(step, "id") else step
+
+        body = cls._build_inputs(kwargs)
+
+        r = await cls.post_async(
+            "/modules/{}/steps/{}".format(module, step), json=body, session=session
+        )
+
+        return cls._format_outputs(r, return_dict)
+
+    @staticmethod
+    def _build_inputs(kwargs):
+        """Build the request body for executing a step."""
         # Make sure all inputs are JSON serializable
         # Common types such as numpy.int64 and numpy.float64 are NOT
         # serializable
@@ -141,18 +394,12 @@ class MicroAnalyticScore(Service):
             except TypeError:
                 pass
 
-        r = cls.post("/modules/{}/steps/{}".format(module, step), json=body)
-
-        # Convert list of name/value pair dictionaries to single dict
-        outputs = OrderedDict()
-        for output in r.get("outputs", []):
-            k, v = output["name"], output.get("value")
-
-            # Remove padding from CHAR columns
-            if isinstance(v, str):
-                v = v.strip()
+        return body
 
-            outputs[k] = v
+    @classmethod
+    def _format_outputs(cls, response, return_dict=True):
+        """Convert step results to a dict, tuple, or single value."""
+        outputs = cls._parse_outputs(response)
 
         if return_dict:
             # Return results as k=v pairs
@@ -164,6 +411,112 @@ class MicroAnalyticScore(Service):
             return outputs[0]
         return outputs
 
+    @staticmethod
+    def _parse_outputs(response):
+        """Convert list of name/value pair dictionaries to single dict."""
+        outputs = OrderedDict()
+        for output in response.get("outputs", []):
+            k, v = output["name"], output.get("value")
+
+            # Remove padding from CHAR columns
+            if isinstance(v, str):
+                v = v.strip()
+
+            outputs[k] = v
+        return outputs
+
+    @classmethod
+    def execute_module_step_batch(cls, module, step, data, max_workers=8):
+        """Call a module step once for each row of the input data.
+
+        Parameters
+        ----------
+        module : str or dict
+            Name, id, or dictionary representation of a module
+        step : str
+            Name of the step
+        data : pandas.DataFrame, list of dict, or numpy.ndarray
+            Input values with one row per step execution.  Column names (or
+            dictionary keys) are matched to the step's input names ignoring
+            case, and columns that are not step inputs are ignored.  If a 2-D
+            array is provided, columns are assumed to be in the same order as
+            the step's inputs.
+        max_workers : int, optional
+            Maximum number of requests to execute concurrently.  Defaults to 8.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The outputs of each step execution, aligned to the index of `data`.
+
+        """
+        import pandas as pd
+
+        module_name = module.name if hasattr(module, "name") else str(module)
+        module = cls._get_cached_module(module)
+
+        if module is None:
+            raise ValueError("Module '{}' was not found.".format(module_name))
+        step = step.id if hasattr(step, "id") else step
+        inputs = cls.get_module_step(module, step).get("inputs", [])
+
+        if not isinstance(data, pd.DataFrame):
+            if hasattr(data, "ndim") and data.ndim == 2:
+                # Array columns are mapped to step inputs by position
+                data = pd.DataFrame(data, columns=[i["name"] for i in inputs])
+            else:
+                data = pd.DataFrame.from_records(data)
+
+        # MAS always lower-cases variable names
+        lookup = {str(c).lower(): c for c in data.columns}
+
+        # Convert each column to JSON serializable Python types only once
+        # instead of checking each individual value.  NaN becomes None (null).
+        # MAS does not attempt any type conversions, so values are cast to the
+        # type of each input.
+        names = []
+        columns = []
+        for i in inputs:
+            col = lookup.get(i["name"].lower())
+            if col is None:
+                continue
+            values = data[col]
+            values = values.astype(object).where(values.notna(), None).tolist()
+            cast = {"decimal": float, "integer": int}.get(i.get("type"))
+            if cast is not None:
+                values = [None if v is None else cast(v) for v in values]
+            names.append(i["name"])
+            columns.append(values)
+
+        url = "/modules/{}/steps/{}".format(module["id"], step)
+
+        def score_row(row):
+            body = {"inputs": [{"name": k, "value": v} for k, v in zip(names, row)]}
+            return cls._parse_outputs(cls.post(url, json=body))
+
+        # Only a few rows per worker are submitted ahead of the results being
+        # collected so a large input doesn't queue a request for every row at
+        # once.  Results are collected in input order so they can be aligned to
+        # the index.
+        window = max_workers * _ROWS_PER_WORKER
+        rows = zip(*columns) if columns else [()] * len(data)
+        results = []
+        pending = deque()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            try:
+                for row in rows:
+                    if len(pending) >= window:
+                        results.append(pending.popleft().result())
+                    pending.append(pool.submit(score_row, row))
+                while pending:
+                    results.append(pending.popleft().result())
+            finally:
+                # Don't send the remaining requests if one of them failed
+                for future in pending:
+                    future.cancel()
+
+        return pd.DataFrame(results, index=data.index)
+
     @classmethod
     def create_module(
         cls,
@@ -192,6 +545,9 @@ class MicroAnalyticScore(Service):
             raise ValueError("The `source` parameter is required.")
         source = str(source)
 
+        # Any cached metadata for a module of the same name is now stale
+        cls.clear_module_cache(name)
+
         if language == "python":
             t = "text/x-python"
         elif language == "ds2":
@@ -227,6 +583,12 @@ class MicroAnalyticScore(Service):
         RestObj
             The module with additional methods defined.
 
+        Notes
+        -----
+        If a method is called with a DataFrame containing multiple rows, each
+        row is scored using `execute_module_step_batch` and a DataFrame of
+        results is returned.
+
         """
         import types
 
@@ -263,7 +625,9 @@ class MicroAnalyticScore(Service):
                     "try:",
                     "    import pandas as pd",
                     "    if isinstance(first_input, pd.DataFrame):",
-                    "        assert first_input.shape[0] == 1",
+                    "        if first_input.shape[0] > 1:",
+                    "            r = execute_module_step_batch(module, step, first_input)",
+                    "            return r.drop(columns=['rc', 'msg'], errors='ignore')",
                     "        first_input = first_input.iloc[0]",
                     "    is_pandas = isinstance(first_input, pd.Series)",
                     "except ImportError:",
@@ -338,10 +702,13 @@ class MicroAnalyticScore(Service):
             )
             compiled = compile(code, "<string>", "exec")
 
+            # Generated methods pass the module object itself, which already
+            # contains the module id, so no lookup is required when scoring.
             env = globals().copy()
             env.update(
                 {
                     "execute_module_step": cls.execute_module_step,
+                    "execute_module_step_batch": cls.execute_module_step_batch,
                     "module": module,
                     "step": step,
                 }
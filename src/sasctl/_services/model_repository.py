@@ -6,12 +6,28 @@
 
 """The Model Repository service supports registering and managing models."""
 
+import concurrent.futures
 import datetime
+import os
+import time
 from warnings import warn
 
-from ..core import HTTPError, current_session, delete, get, sasctl_command
+import requests.exceptions
+
+from ..core import (
+    HTTPError,
+    current_session,
+    delete,
+    download,
+    get,
+    sasctl_command,
+)
+from ..exceptions import ContentUploadError, DeleteError
 from .service import Service
 
+# Status codes indicating an upload may succeed if attempted again.
+_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
 FUNCTIONS = {
     "Analytical",
     "Classification",
@@ -26,6 +42,15 @@ FUNCTIONS = {
 }
 
 
+def _check_deletes(results, return_exceptions=False):
+    """Raise a `DeleteError` for failed deletes unless they're to be returned."""
+    if not return_exceptions:
+        failed = [r for r in results if isinstance(r, Exception)]
+        if failed:
+            raise DeleteError(results) from failed[0]
+    return results
+
+
 class ModelRepository(Service):
     """Implements the Model Repository REST API.
 
@@ -374,11 +399,13 @@ class ModelRepository(Service):
         model["outputVariables"] = output_variables or model.get("outputVariables", [])
         model["version"] = 2
 
-        return cls.post(
+        model = cls.post(
             "/models",
             json=model,
             headers={"Content-Type": "application/vnd.sas.models.model+json"},
         )
+        cls._index_created_item("/models", model)
+        return model
 
     @classmethod
     def add_model_content(
@@ -405,6 +432,21 @@ class ModelRepository(Service):
         str
             The model content schema.
 
+        """
+        return cls._add_model_content(model, file, name, role, content_type)[0]
+
+    @classmethod
+    def _add_model_content(
+        cls, model, file, name, role=None, content_type="multipart/form-data"
+    ):
+        """Add a file to the model.
+
+        Returns
+        -------
+        (RestObj, bool)
+            The model content schema and whether it replaced existing content
+            with the same name.
+
         """
         if cls.is_uuid(model):
             id_ = model
@@ -431,8 +473,9 @@ class ModelRepository(Service):
 
         # If the file already exists, a 409 error will be returned
         try:
-            return cls.post(
-                "/models/{}/contents".format(id_), files=files, params=params
+            return (
+                cls.post("/models/{}/contents".format(id_), files=files, params=params),
+                False,
             )
         # Deletes the duplicate content and reruns the API call
         except HTTPError as e:
@@ -446,13 +489,151 @@ class ModelRepository(Service):
                         if hasattr(files["files"][1], "seek"):
                             files["files"][1].seek(0)
 
-                        return cls.post(
+                        content = cls.post(
                             "/models/{}/contents".format(id_),
                             files=files,
                             params=params,
                         )
+                        return content, True
             else:
                 raise e
+        return None, False
+
+    @classmethod
+    def add_model_contents(
+        cls, model, files, max_workers=4, retries=2, backoff=0.5, rollback=True
+    ):
+        """Upload multiple files to a model concurrently.
+
+        Parameters
+        ----------
+        model : str or dict
+            The name or id of the model, or a dictionary representation of
+            the model.
+        files : iterable
+            The files to upload.  Each may be a dict of arguments for
+            :meth:`add_model_content` (`file`, `name`, and optionally `role`
+            and `content_type`) or an open file, which is named after the file
+            on disk.
+        max_workers : int, optional
+            Maximum number of files to upload at once.  Defaults to 4.
+        retries : int, optional
+            Number of times to retry a file after a connection error or a
+            429, 500, 502, 503, or 504 response.  Defaults to 2.
+        backoff : float, optional
+            Seconds to wait before the first retry of a file.  The wait
+            doubles with each subsequent retry.  Defaults to 0.5.
+        rollback : bool, optional
+            Whether to delete the files that were uploaded if any file fails.
+            Files that replaced existing content are kept since the original
+            content can't be restored.  Defaults to True.
+
+        Returns
+        -------
+        list of RestObj
+            The model content created for each file, in the order given.
+
+        Raises
+        ------
+        ContentUploadError
+            If any file could not be uploaded.  The `results` attribute
+            contains the content created or the exception raised for each
+            file.
+
+        """
+        uploads = []
+        for file in files:
+            if isinstance(file, dict):
+                uploads.append(file)
+            elif hasattr(file, "read") and hasattr(file, "name"):
+                uploads.append({"file": file, "name": os.path.basename(file.name)})
+            else:
+                raise TypeError(
+                    "Expected a dict or an open file but received '%r'." % file
+                )
+
+        if not uploads:
+            return []
+
+        # Resolve the model once instead of once per file.
+        if cls.is_uuid(model):
+            id_ = model
+        elif isinstance(model, dict) and "id" in model:
+            id_ = model["id"]
+        else:
+            model = cls.get_model(model)
+            if model is None:
+                raise ValueError("Unable to find model.")
+            id_ = model["id"]
+
+        # Content that replaced an existing file must not be deleted during
+        # rollback.
+        replaced = set()
+
+        def upload(kwargs):
+            file = kwargs.get("file")
+            position = file.tell() if hasattr(file, "seek") else None
+
+            for attempt in range(retries + 1):
+                try:
+                    content, existed = cls._add_model_content({"id": id_}, **kwargs)
+                    if existed:
+                        replaced.add(kwargs["name"])
+                    return content
+                except (HTTPError, requests.exceptions.ConnectionError) as e:
+                    transient = getattr(e, "code", None) in _RETRY_STATUS_CODES or (
+                        isinstance(e, requests.exceptions.ConnectionError)
+                    )
+                    if not transient or attempt == retries:
+                        raise
+
+                    cls.log.warning(
+                        "Retrying upload of '%s' after error: %s", kwargs["name"], e
+                    )
+                    time.sleep(backoff * 2**attempt)
+                    if position is not None:
+                        file.seek(position)
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(uploads))
+        ) as pool:
+            futures = [pool.submit(upload, kwargs) for kwargs in uploads]
+
+            # Don't start any more uploads once one has failed.
+            for future in concurrent.futures.as_completed(futures):
+                if future.exception() is not None:
+                    for f in futures:
+                        f.cancel()
+                    break
+
+        results = []
+        for future in futures:
+            if future.cancelled():
+                results.append(concurrent.futures.CancelledError())
+            elif future.exception() is not None:
+                results.append(future.exception())
+            else:
+                results.append(future.result())
+
+        if not any(isinstance(r, BaseException) for r in results):
+            return results
+
+        rolled_back = []
+        if rollback:
+            for kwargs, result in zip(uploads, results):
+                if isinstance(result, BaseException) or not result:
+                    continue
+                if kwargs["name"] in replaced:
+                    continue
+                try:
+                    cls.delete("/models/{}/contents/{}".format(id_, result["id"]))
+                    rolled_back.append(kwargs["name"])
+                except HTTPError:
+                    cls.log.exception(
+                        "Unable to remove '%s' from model %s.", kwargs["name"], id_
+                    )
+
+        raise ContentUploadError(results, rolled_back)
 
     @classmethod
     def default_repository(cls):
@@ -505,11 +686,13 @@ class ModelRepository(Service):
         project["folderId"] = repository["folderId"]
 
         project.update(kwargs)
-        return cls.post(
+        project = cls.post(
             "/projects",
             json=project,
             headers={"Content-Type": "application/vnd.sas.models.project+json"},
         )
+        cls._index_created_item("/projects", project)
+        return project
 
     @classmethod
     def import_model_from_zip(
@@ -559,6 +742,65 @@ class ModelRepository(Service):
         )
         return r
 
+    @classmethod
+    def export_model_to_zip(
+        cls, model, dest, chunk_size=None, resume=False, checksum=None
+    ):
+        """Download a model and its contents as a ZIP file.
+
+        The ZIP file is written to `dest` as it is received and is never held
+        in memory.
+
+        Parameters
+        ----------
+        model : str or dict
+            The name, id, or dictionary representation of a model.
+        dest : str, Path, or file_like
+            Path to save the ZIP file to or a writable binary file-like
+            object.
+        chunk_size : int, optional
+            Number of bytes to write at a time.
+        resume : bool, optional
+            Continue an earlier download to `dest` that was interrupted.
+            Defaults to False.
+        checksum : str, optional
+            Expected digest of the ZIP file formatted as
+            ``"<algorithm>:<hex digest>"``.
+
+        Returns
+        -------
+        str or file_like
+            The path to the ZIP file, or `dest` if it's a file-like object.
+
+        Raises
+        ------
+        ChecksumMismatchError
+            If the downloaded file doesn't match `checksum`.
+
+        See Also
+        --------
+        import_model_from_zip
+
+        """
+        if cls.is_uuid(model):
+            id_ = model
+        elif isinstance(model, dict) and "id" in model:
+            id_ = model["id"]
+        else:
+            model_obj = cls.get_model(model)
+            if model_obj is None:
+                raise ValueError("Model `%s` could not be found." % str(model))
+            id_ = model_obj["id"]
+
+        return download(
+            cls._SERVICE_ROOT + "/models/%s" % id_,
+            dest,
+            chunk_size=chunk_size,
+            resume=resume,
+            checksum=checksum,
+            params={"format": "zip"},
+        )
+
     @classmethod
     def create_model_version(cls, model, minor=False):
         """Create a new version of an existing model.
@@ -651,24 +893,101 @@ class ModelRepository(Service):
         return cls.request_link(model, "copyAnalyticStore")
 
     @classmethod
-    def delete_model_contents(cls, model):
+    def delete_model_contents(cls, model, max_workers=4, return_exceptions=False):
         """Deletes all contents (files) in the model.
 
         Parameters
         ----------
         model : str or dict
             The name, id, or dictionary representation of a model.
+        max_workers : int, optional
+            Maximum number of files to delete at once.  Defaults to 4.
+        return_exceptions : bool, optional
+            Return the exception raised for each file that could not be
+            deleted instead of raising a `DeleteError`.  Defaults to False.
 
         Returns
         -------
+        list
+            For each file, the server's response (usually None) or the
+            exception raised while deleting it.
+
+        Raises
+        ------
+        DeleteError
+            If any file could not be deleted and `return_exceptions` is False.
+            The remaining files are still deleted.
 
         """
         rel = "delete"
 
-        filelist = cls.get_model_contents(model)
-        for delfile in filelist:
+        def delete_file(delfile):
             modelfileuri = cls.get_link(delfile, rel)
-            delete(modelfileuri["uri"])
+            return delete(modelfileuri["uri"])
+
+        filelist = cls.get_model_contents(model)
+        results = cls._map_concurrently(delete_file, filelist, max_workers)
+        return _check_deletes(results, return_exceptions)
+
+    @classmethod
+    def delete_models(cls, models, max_workers=4, return_exceptions=False):
+        """Delete multiple models at once.
+
+        Parameters
+        ----------
+        models : iterable of str or dict
+            The name, id, or dictionary representation of each model.
+        max_workers : int, optional
+            Maximum number of models to delete at once.  Defaults to 4.
+        return_exceptions : bool, optional
+            Return the exception raised for each model that could not be
+            deleted instead of raising a `DeleteError`.  Defaults to False.
+
+        Returns
+        -------
+        list
+            For each model, the server's response (usually None) or the
+            exception raised while deleting it.
+
+        Raises
+        ------
+        DeleteError
+            If any model could not be deleted and `return_exceptions` is False.
+            The remaining models are still deleted.
+
+        """
+        results = cls._map_concurrently(cls.delete_model, models, max_workers)
+        return _check_deletes(results, return_exceptions)
+
+    @classmethod
+    def delete_projects(cls, projects, max_workers=4, return_exceptions=False):
+        """Delete multiple projects at once.
+
+        Parameters
+        ----------
+        projects : iterable of str or dict
+            The name, id, or dictionary representation of each project.
+        max_workers : int, optional
+            Maximum number of projects to delete at once.  Defaults to 4.
+        return_exceptions : bool, optional
+            Return the exception raised for each project that could not be
+            deleted instead of raising a `DeleteError`.  Defaults to False.
+
+        Returns
+        -------
+        list
+            For each project, the server's response (usually None) or the
+            exception raised while deleting it.
+
+        Raises
+        ------
+        DeleteError
+            If any project could not be deleted and `return_exceptions` is False.
+            The remaining projects are still deleted.
+
+        """
+        results = cls._map_concurrently(cls.delete_project, projects, max_workers)
+        return _check_deletes(results, return_exceptions)
 
     @classmethod
     def copy_python_resources(cls, model):
@@ -6,9 +6,13 @@
 
 """Base functionality for all services."""
 
+import concurrent.futures
 import logging
+import threading
 import time
 import warnings
+import weakref
+from collections import Counter
 from urllib.parse import quote
 
 from .. import core
@@ -16,6 +20,313 @@ from ..core import HTTPError, PagedItemIterator, sasctl_command
 from ..exceptions import JobTimeoutError
 
 
+class _NameIndex:
+    """Maps item names to ids for each CRUD collection of a session."""
+
+    # Marks names shared by multiple items, which must always be resolved by
+    # the server so the user is warned about the duplicates.
+    AMBIGUOUS = object()
+
+    def __init__(self):
+        self._ids = {}
+        self._names = {}
+        self._lock = threading.Lock()
+        self.stats = Counter()
+
+    def get(self, collection, name):
+        id_ = self._ids.get((collection, name))
+        return None if id_ is self.AMBIGUOUS else id_
+
+    def add(self, collection, name, id_):
+        key = (collection, name)
+        with self._lock:
+            existing = self._ids.get(key)
+            if existing is not None and existing != id_:
+                id_ = self.AMBIGUOUS
+            else:
+                self._names[(collection, id_)] = name
+            self._ids[key] = id_
+
+    def discard(self, collection, name=None, id_=None):
+        with self._lock:
+            if id_ is not None:
+                name = self._names.pop((collection, id_), name)
+            if name is None:
+                return
+
+            # Other items may still share an ambiguous name.
+            key = (collection, name)
+            if self._ids.get(key) is not self.AMBIGUOUS:
+                self._names.pop((collection, self._ids.pop(key, None)), None)
+
+    def record(self, stat):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def created(self, collection, name, id_):
+        # A new item only needs to be recorded if an item with the same name
+        # is already known, in which case the name is now ambiguous.  Items
+        # that haven't been indexed may still have duplicates on the server.
+        if (collection, name) in self._ids:
+            self.add(collection, name, id_)
+
+
+def _job_completed(job):
+    return job["state"].lower() in ("completed", "failed")
+
+
+def _notify_job(session, job, started, polls, error=None):
+    """Report how long a job was polled to the session's metrics listeners."""
+    session = session or core.current_session()
+    if not getattr(session, "listeners", None):
+        return
+
+    link = core.get_link(job, "self")
+    endpoint = core._endpoint_name("GET", link["href"]) if link else "job"
+    core._notify(
+        session,
+        core.MetricsEvent(
+            "job",
+            endpoint,
+            time.monotonic() - started,
+            status=job.get("state"),
+            retries=polls,
+            error=error,
+        ),
+    )
+
+
+def _job_poll_limits(max_retries, timeout, interval, max_interval):
+    """Get the deadline, maximum number of polls, and maximum interval."""
+    if max_retries is not None and timeout is None:
+        # Preserve the previous behavior of polling at a fixed interval up to
+        # `max_retries` times.
+        return float("inf"), max_retries, interval
+
+    if timeout is None:
+        timeout = JobMonitor.DEFAULT_TIMEOUT
+    return time.monotonic() + timeout, max_retries, max_interval
+
+
+def _resolve(future, result=None, error=None):
+    """Set the outcome of a future unless the caller already cancelled it."""
+    try:
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+    except getattr(concurrent.futures, "InvalidStateError", RuntimeError):
+        pass
+
+
+class _WatchedJob:
+    __slots__ = (
+        "job",
+        "future",
+        "session",
+        "deadline",
+        "interval",
+        "next_poll",
+        "started",
+        "polls",
+    )
+
+    def __init__(self, job, future, session, deadline, interval):
+        self.job = job
+        self.future = future
+        self.session = session
+        self.deadline = deadline
+        self.interval = interval
+        self.started = time.monotonic()
+        self.next_poll = min(self.started + interval, deadline)
+        self.polls = 0
+
+
+class JobMonitor:
+    """Polls any number of jobs from a single background thread.
+
+    Each job is polled with exponential backoff until it completes, fails, or
+    its deadline passes.
+
+    Parameters
+    ----------
+    interval : float, optional
+        Seconds to wait before first polling a job.  Defaults to 0.5.
+    max_interval : float, optional
+        Maximum seconds to wait between polls of a job.  Defaults to 10.
+    backoff : float, optional
+        Factor by which the wait between polls increases.  Defaults to 2.
+    timeout : float, optional
+        Default number of seconds to wait for a job.  Defaults to
+        `DEFAULT_TIMEOUT`.
+
+    Examples
+    --------
+    Wait for several jobs at once
+
+    >>> monitor = JobMonitor()
+    >>> futures = [monitor.watch(job) for job in jobs]
+    >>> results = [f.result() for f in futures]
+
+    """
+
+    DEFAULT_TIMEOUT = 300
+
+    def __init__(self, interval=0.5, max_interval=10, backoff=2, timeout=None):
+        self.interval = interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.timeout = self.DEFAULT_TIMEOUT if timeout is None else timeout
+        self._jobs = []
+        self._cond = threading.Condition()
+        self._thread = None
+        self._closed = False
+
+    def watch(self, job, timeout=None, callback=None, session=None):
+        """Start monitoring a job.
+
+        Parameters
+        ----------
+        job : dict
+            Dictionary representation of a job with a `self` link.
+        timeout : float, optional
+            Seconds to wait for the job to finish.  Defaults to `timeout`.
+        callback : callable, optional
+            Called with the returned future once the job finishes.  Runs on
+            the monitoring thread, so should return quickly.
+        session : Session, optional
+            Defaults to `current_session()`.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves to the final state of the job, or raises
+            `JobTimeoutError` if `timeout` is reached first.
+
+        """
+        if core.get_link(job, "self") is None:
+            raise ValueError("Link 'self' not found on %s" % job)
+
+        future = concurrent.futures.Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+
+        if _job_completed(job):
+            future.set_result(job)
+            return future
+
+        timeout = self.timeout if timeout is None else timeout
+        entry = _WatchedJob(
+            job,
+            future,
+            session or core.current_session(),
+            time.monotonic() + timeout,
+            self.interval,
+        )
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Cannot watch jobs after the monitor is closed.")
+            self._jobs.append(entry)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="sasctl-job-monitor", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+        return future
+
+    def wait(self, jobs, timeout=None):
+        """Wait for multiple jobs to finish.
+
+        Parameters
+        ----------
+        jobs : iterable of dict
+        timeout : float, optional
+            Seconds to wait for each job.  Defaults to `timeout`.
+
+        Returns
+        -------
+        list
+            Final state of each job, in the same order as `jobs`.
+
+        Raises
+        ------
+        JobTimeoutError
+            If any job didn't finish before `timeout`.
+
+        """
+        futures = [self.watch(job, timeout=timeout) for job in jobs]
+        return [f.result() for f in futures]
+
+    def close(self):
+        """Stop monitoring.  Jobs still being watched are cancelled.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._cond:
+            self._closed = True
+            for entry in self._jobs:
+                entry.future.cancel()
+            self._jobs = []
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._jobs and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+
+                now = time.monotonic()
+                due = [e for e in self._jobs if e.next_poll <= now]
+                if not due:
+                    self._cond.wait(min(e.next_poll for e in self._jobs) - now)
+                    continue
+
+            # Poll outside the lock so new jobs can be added meanwhile.
+            finished = [e for e in due if not self._poll(e)]
+
+            with self._cond:
+                self._jobs = [e for e in self._jobs if e not in finished]
+
+    def _poll(self, entry):
+        """Refresh a job.  Returns False once the job no longer needs polling."""
+        # The caller may cancel the future at any time, including while the
+        # job is being refreshed.
+        if entry.future.done():
+            return False
+
+        entry.polls += 1
+        try:
+            entry.job = core.request_link(entry.job, "self", session=entry.session)
+        except Exception as e:  # skipcq PYL-W0703
+            _notify_job(entry.session, entry.job, entry.started, entry.polls, e)
+            _resolve(entry.future, error=e)
+            return False
+
+        if _job_completed(entry.job):
+            _notify_job(entry.session, entry.job, entry.started, entry.polls)
+            _resolve(entry.future, entry.job)
+            return False
+
+        now = time.monotonic()
+        if now >= entry.deadline:
+            error = JobTimeoutError("Timeout while waiting on job %s" % entry.job)
+            _notify_job(entry.session, entry.job, entry.started, entry.polls, error)
+            _resolve(entry.future, error=error)
+            return False
+
+        entry.interval = min(entry.interval * self.backoff, self.max_interval)
+        entry.next_poll = min(now + entry.interval, entry.deadline)
+        return True
+
+
 class Service(object):  # skipcq PYL-R0205
     """Base class for all services.  Should not be used directly."""
 
@@ -24,13 +335,67 @@ class Service(object):  # skipcq PYL-R0205
     is_uuid = staticmethod(core.is_uuid)
     get_link = staticmethod(core.get_link)
     request_link = staticmethod(core.request_link)
+    request_link_async = staticmethod(core.request_link_async)
 
     log = logging.getLogger(__name__)
 
+    # Name -> id lookups for items returned by the CRUD functions, per session.
+    _name_index = weakref.WeakKeyDictionary()
+    _name_index_lock = threading.Lock()
+
     @property
     def _SERVICE_ROOT(self):
         raise NotImplementedError()
 
+    @classmethod
+    def _get_name_index(cls):
+        """Get the name -> id index for the current session, if enabled."""
+        session = core.current_session()
+
+        if not getattr(session, "index_names", False):
+            return None
+
+        with Service._name_index_lock:
+            index = Service._name_index.get(session)
+            if index is None:
+                index = Service._name_index[session] = _NameIndex()
+        return index
+
+    @classmethod
+    def name_index_stats(cls):
+        """Hit rate of the name -> id index used to look up items by name.
+
+        Returns
+        -------
+        dict
+            Number of lookups resolved using the index (`hits`), lookups
+            that required searching by name (`misses`), and the fraction of
+            lookups that were hits (`hit_rate`) for the current session.
+
+        """
+        index = cls._get_name_index()
+        hits = index.stats["hits"] if index else 0
+        misses = index.stats["misses"] if index else 0
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else 0.0,
+        }
+
+    @classmethod
+    def clear_name_index(cls):
+        """Discard all name -> id lookups for the current session.
+
+        Returns
+        -------
+        None
+
+        """
+        session = core.current_session()
+        with Service._name_index_lock:
+            Service._name_index.pop(session, None)
+
     @classmethod
     def is_available(cls):
         """Check if the service is currently available.
@@ -122,6 +487,171 @@ class Service(object):  # skipcq PYL-R0205
         """Send a DELETE request."""
         return cls.request("delete", *args, **kwargs)
 
+    @classmethod
+    async def request_async(cls, verb, path, session=None, format_="auto", **kwargs):
+        """Send an HTTP request asynchronously.
+
+        Parameters
+        ----------
+        verb : str
+            A valid HTTP request verb.
+        path : str
+            Path portion of URL to request.  Assumed to be relative to
+            `_SERVICE_ROOT`.
+        session : AsyncSession or Session, optional
+            Defaults to an `AsyncSession` using `current_session()`.
+        format_ : {'auto', 'response', 'content', 'json', 'text'}
+            The format of the return response.  See :meth:`request`.
+        kwargs : any
+            Additional arguments are passed to the session `request` method.
+
+        Returns
+        -------
+
+        """
+        if path.startswith("/"):
+            path = cls._SERVICE_ROOT + path
+        else:
+            path = cls._SERVICE_ROOT + "/" + path
+
+        return await core.request_async(verb, path, session, format_, **kwargs)
+
+    @classmethod
+    async def get_async(cls, *args, **kwargs):
+        """Send a GET request asynchronously."""
+        try:
+            return await cls.request_async("get", *args, **kwargs)
+        except HTTPError as e:
+            if e.code == 404:
+                return None  # Resource not found
+            raise e
+
+    @classmethod
+    async def post_async(cls, *args, **kwargs):
+        """Send a POST request asynchronously."""
+        return await cls.request_async("post", *args, **kwargs)
+
+    @classmethod
+    async def put_async(cls, *args, **kwargs):
+        """Send a PUT request asynchronously."""
+        return await cls.request_async("put", *args, **kwargs)
+
+    @classmethod
+    async def delete_async(cls, *args, **kwargs):
+        """Send a DELETE request asynchronously."""
+        return await cls.request_async("delete", *args, **kwargs)
+
+    @classmethod
+    def _index_items(cls, path, items):
+        """Record the name and id of each item in a collection.
+
+        Parameters
+        ----------
+        path : str
+            Path to the collection, relative to `_SERVICE_ROOT`.
+        items : iterable of dict
+
+        Returns
+        -------
+        None
+
+        """
+        index = cls._get_name_index()
+        if index is None:
+            return
+
+        collection = cls._SERVICE_ROOT + path
+        for item in items:
+            if isinstance(item, dict) and "name" in item and "id" in item:
+                index.add(collection, str(item["name"]), item["id"])
+
+    @classmethod
+    def _index_created_item(cls, path, item):
+        """Update the name -> id index after an item is created.
+
+        Parameters
+        ----------
+        path : str
+            Path to the collection, relative to `_SERVICE_ROOT`.
+        item : dict
+            The newly created item.
+
+        Returns
+        -------
+        None
+
+        """
+        index = cls._get_name_index()
+        if index is not None and isinstance(item, dict) and "id" in item:
+            index.created(cls._SERVICE_ROOT + path, str(item.get("name")), item["id"])
+
+    @classmethod
+    def _map_concurrently(cls, func, items, max_workers=4):
+        """Call `func` on each item using a pool of threads.
+
+        Parameters
+        ----------
+        func : callable
+            Called with each item.
+        items : iterable
+        max_workers : int, optional
+            Maximum number of items to process at once.
+
+        Returns
+        -------
+        list
+            For each item, in order, the value returned by `func` or the
+            exception it raised.
+
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        def call(item):
+            try:
+                return func(item)
+            except Exception as e:  # skipcq PYL-W0703
+                return e
+
+        if max_workers <= 1 or len(items) == 1:
+            return [call(item) for item in items]
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(items))
+        ) as pool:
+            return list(pool.map(call, items))
+
+    @classmethod
+    def _stream_items(cls, path, **kwargs):
+        """Yield each item in a collection as pages are received.
+
+        Parameters
+        ----------
+        path : str
+            Path to the collection.
+        kwargs : any
+            Passed to `get`.
+
+        Yields
+        ------
+        RestObj
+
+        """
+        results = cls.get(path, format_="json", **kwargs)
+        if results is None:
+            return
+
+        if "items" not in results:
+            yield core.RestObj(results)
+            return
+
+        pager = PagedItemIterator(core.RestObj(results))
+        try:
+            yield from pager
+        finally:
+            pager.close()
+
     @staticmethod
     def _crud_funcs(
         path, single_term=None, plural_term=None, service_name=None, get_filter=None
@@ -170,7 +700,15 @@ class Service(object):  # skipcq PYL-R0205
             get_filter = default_filter
 
         @sasctl_command("list")
-        def list_items(cls, filter=None, start=None, limit=None, **kwargs):
+        def list_items(
+            cls,
+            filter=None,
+            start=None,
+            limit=None,
+            stream=False,
+            fields=None,
+            **kwargs,
+        ):
             """List all {items} available in the environment.
 
             Parameters
@@ -179,12 +717,22 @@ class Service(object):  # skipcq PYL-R0205
             start : int, optional
                 Zero-based index of the first item to return.  Defaults to 0.
             limit : int, optional
-                The maximum number of items to return.  Defaults to 20.
+                The maximum number of items to return.  Defaults to 20.  When
+                `stream` is set, the number of items to request per page.
+            stream : bool, optional
+                Return a generator that yields each {item} as pages are
+                received instead of a list.  Items are not retained once
+                yielded, so memory use does not grow with the number of
+                {items}.  Defaults to False.
+            fields : str or list of str, optional
+                Names of the attributes to include in each {item}.  Defaults to
+                all attributes.
 
             Returns
             -------
-            list
-                A list of dictionaries containing the {items}.
+            list or generator
+                A list of dictionaries containing the {items}, or a generator
+                of the same if `stream` is set.
 
             Notes
             -----
@@ -199,18 +747,29 @@ class Service(object):  # skipcq PYL-R0205
                 kwargs["start"] = int(start)
             if limit is not None:
                 kwargs["limit"] = int(limit)
+            if fields is not None:
+                if not isinstance(fields, str):
+                    fields = ",".join(fields)
+                kwargs["fields"] = fields
 
             params = "&".join(
                 "%s=%s" % (k, quote(str(v), safe='/(),"')) for k, v in kwargs.items()
             )
 
+            if stream:
+                return cls._stream_items(path, params=params)
+
             results = cls.get(path, params=params)
             if results is None:
                 return []
-            if isinstance(results, (list, PagedItemIterator)):
-                return results
+            if not isinstance(results, (list, PagedItemIterator)):
+                results = [results]
+
+            # Record the ids of any items that have already been downloaded.
+            if isinstance(results, list):
+                cls._index_items(path, list.__iter__(results))
 
-            return [results]
+            return results
 
         @sasctl_command("get")
         def get_item(cls, item, refresh=False):
@@ -248,6 +807,23 @@ class Service(object):  # skipcq PYL-R0205
 
             if cls.is_uuid(item):
                 return cls.get(path + "/{id}".format(id=item))
+
+            # Go straight to the item if its id is already known
+            collection = cls._SERVICE_ROOT + path
+            index = cls._get_name_index()
+            id_ = index.get(collection, str(item)) if index else None
+            if id_ is not None:
+                match = cls.get(path + "/{id}".format(id=id_))
+                if match is not None and match.get("name") == str(item):
+                    index.record("hits")
+                    return match
+
+                # Item was renamed or deleted
+                index.discard(collection, str(item))
+
+            if index is not None:
+                index.record("misses")
+
             results = list_items(cls, **get_filter(item))
 
             match = None
@@ -303,6 +879,11 @@ class Service(object):  # skipcq PYL-R0205
                 "Content-Type": item._headers.get("content-type"),
             }
 
+            # Name may be changing
+            index = cls._get_name_index()
+            if index is not None:
+                index.discard(cls._SERVICE_ROOT + path, id_=id_)
+
             return cls.put(path + "/%s" % id_, json=item, headers=headers)
 
         @sasctl_command("delete")
@@ -331,6 +912,10 @@ class Service(object):  # skipcq PYL-R0205
                 item = item["id"]
 
             if cls.is_uuid(item):
+                index = cls._get_name_index()
+                if index is not None:
+                    index.discard(cls._SERVICE_ROOT + path, name=item_name, id_=item)
+
                 response = cls.delete(path + "/{id}".format(id=item))
                 # Response generally seems to be an empty string.  If so, just return None
                 # BUT, if the service provides an actual response, return it.
@@ -395,16 +980,32 @@ class Service(object):  # skipcq PYL-R0205
 
         return [resources]
 
+    # Shared by all services to monitor jobs in the background.
+    _job_monitor = None
+    _job_monitor_lock = threading.Lock()
+
     @classmethod
-    def _monitor_job(cls, job, max_retries=60):
+    def _monitor_job(
+        cls, job, max_retries=None, timeout=None, interval=0.5, max_interval=10
+    ):
         """Continually poll a job until it reaches the desired status.
 
         Parameters
         ----------
         job : dict
             Dictionary representation of a currently execution job
-        max_retries : int
-            Maximum number of ties to refresh `job` before failing.
+        max_retries : int, optional
+            Deprecated.  Maximum number of times to poll the job.  If
+            `timeout` is not specified, polls at a fixed `interval` instead of
+            backing off.
+        timeout : float, optional
+            Maximum number of seconds to wait for the job.  Defaults to
+            `JobMonitor.DEFAULT_TIMEOUT`.
+        interval : float, optional
+            Seconds to wait before the first poll.  The wait doubles after
+            each poll.
+        max_interval : float, optional
+            Maximum number of seconds to wait between polls.
 
         Returns
         -------
@@ -412,25 +1013,124 @@ class Service(object):  # skipcq PYL-R0205
 
         Raises
         ------
-        TimeoutError
-            `max_retries` reached with a successful status check
+        JobTimeoutError
+            `timeout` reached before the job completed.
+
+        """
+        if cls.get_link(job, "self") is None:
+            raise ValueError("Link 'self' not found on %s" % job)
+
+        deadline, max_polls, max_interval = _job_poll_limits(
+            max_retries, timeout, interval, max_interval
+        )
+        started = time.monotonic()
+        polls = 0
+
+        while not _job_completed(job):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or (max_polls is not None and polls >= max_polls):
+                error = JobTimeoutError("Timeout while waiting on job %s" % job)
+                _notify_job(None, job, started, polls, error)
+                raise error
+
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, max_interval)
+            polls += 1
+            job = cls.request_link(job, "self")
+
+        if polls:
+            _notify_job(None, job, started, polls)
+        return job
+
+    @classmethod
+    def _watch_job(cls, job, timeout=None, callback=None):
+        """Monitor a job in the background.
+
+        Parameters
+        ----------
+        job : dict
+            Dictionary representation of a currently execution job
+        timeout : float, optional
+            Maximum number of seconds to wait for the job.  Defaults to
+            `JobMonitor.DEFAULT_TIMEOUT`.
+        callback : callable, optional
+            Called with the future once the job finishes.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves to the final state of the job.
+
+        See Also
+        --------
+        JobMonitor
 
         """
+        with Service._job_monitor_lock:
+            if Service._job_monitor is None:
+                Service._job_monitor = JobMonitor()
+            monitor = Service._job_monitor
+        return monitor.watch(job, timeout=timeout, callback=callback)
+
+    @classmethod
+    async def _monitor_job_async(
+        cls,
+        job,
+        max_retries=None,
+        session=None,
+        timeout=None,
+        interval=0.5,
+        max_interval=10,
+    ):
+        """Poll a job until it reaches the desired status without blocking.
+
+        Parameters
+        ----------
+        job : dict
+            Dictionary representation of a currently execution job
+        max_retries : int, optional
+            Deprecated.  Maximum number of times to poll the job.  If
+            `timeout` is not specified, polls at a fixed `interval` instead of
+            backing off.
+        session : AsyncSession or Session, optional
+            Defaults to an `AsyncSession` using `current_session()`.
+        timeout : float, optional
+            Maximum number of seconds to wait for the job.  Defaults to
+            `JobMonitor.DEFAULT_TIMEOUT`.
+        interval : float, optional
+            Seconds to wait before the first poll.  The wait doubles after
+            each poll.
+        max_interval : float, optional
+            Maximum number of seconds to wait between polls.
 
-        def completed(job):
-            return job["state"].lower() in ("completed", "failed")
+        Returns
+        -------
+        job
 
-        retries = 0
+        Raises
+        ------
+        JobTimeoutError
+            `timeout` reached before the job completed.
 
+        """
         if cls.get_link(job, "self") is None:
             raise ValueError("Link 'self' not found on %s" % job)
 
-        # TODO: Log
-        while not completed(job) and retries < max_retries:
-            time.sleep(0.5)
-            retries += 1
-            job = cls.request_link(job, "self")
+        deadline, max_polls, max_interval = _job_poll_limits(
+            max_retries, timeout, interval, max_interval
+        )
+        polls = 0
+
+        import asyncio
+
+        while not _job_completed(job):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or (max_polls is not None and polls >= max_polls):
+                raise JobTimeoutError("Timeout while waiting on job %s" % job)
+
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * 2, max_interval)
+            polls += 1
+            job = await cls.request_link_async(job, "self", session=session)
 
-        if completed(job):
-            return job
-        raise JobTimeoutError("Timeout while waiting on job %s" % job)
+        return job
@@ -4,15 +4,28 @@
 # Copyright © 2019, SAS Institute Inc., Cary, NC, USA.  All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import codecs
+import collections
 import concurrent.futures
-import copy
+import contextlib
+import hashlib
+import io
 import json
 import logging
+import math
 import netrc
 import os
+import random
 import re
+import socket
 import ssl
+import sys
+import threading
+import time
 import warnings
+import weakref
+import zlib
+from collections import Counter
 from datetime import datetime, timedelta
 from urllib.error import HTTPError
 from urllib.parse import urlsplit, urlunsplit
@@ -20,14 +33,16 @@ from uuid import UUID, uuid4
 
 import requests
 import requests.exceptions
-import yaml
 from packaging import version
 from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
 
 try:
-    import swat
+    import orjson
 except ImportError:
-    swat = None
+    orjson = None
 
 try:
     import kerberos
@@ -46,6 +61,61 @@ logger = logging.getLogger(__name__)
 _session = None
 
 
+def _import_swat():
+    """Import `swat` on first use.
+
+    SWAT pulls in pandas and is slow to load, so it is only imported by the
+    code paths that actually talk to CAS.
+
+    Returns
+    -------
+    module or None
+        The `swat` module, or None if it is not installed.
+
+    """
+    try:
+        import swat
+    except ImportError:
+        return None
+    return swat
+
+
+# Files read by `swat.utils.authinfo.query_authinfo` that the standard library
+# `netrc` module can't parse.
+_AUTHINFO_FILES = (
+    "~/_authinfo.gpg",
+    "~/.authinfo.gpg",
+    "~/_netrc.gpg",
+    "~/.netrc.gpg",
+    "~/_authinfo",
+    "~/.authinfo",
+)
+
+
+def _has_authinfo(path=None):
+    """Check whether there is an authinfo file for SWAT to read.
+
+    Parameters
+    ----------
+    path : str or list of str, optional
+        Path(s) to the authinfo file(s).  If not specified, the environment
+        variable AUTHINFO and the default file locations are checked.
+
+    Returns
+    -------
+    bool
+
+    """
+    if path is None:
+        paths = [os.environ.get("AUTHINFO")] + list(_AUTHINFO_FILES)
+    elif isinstance(path, str):
+        paths = [path]
+    else:
+        paths = list(path)
+
+    return any(p and os.path.isfile(os.path.expanduser(p)) for p in paths)
+
+
 def _pformat(text):
     from pprint import pformat
 
@@ -59,6 +129,9 @@ def _pformat(text):
 
 
 def _redact(pattern, repl, string):
+    if not isinstance(string, (bytes, str)):
+        return string
+
     is_bytes = isinstance(string, bytes)
 
     try:
@@ -76,7 +149,7 @@ def _filter_password(r):
         r.body = _redact(r"(?<=&password=)([^&]*)\b", "*****", r.body)
 
         # Filter client secret {"client_secret": "<password>"}
-        r.body = _redact('(?<=client_secret": ")[^"]*', "*****", r.body)
+        r.body = _redact(r'("client_secret"\s*:\s*")[^"]*', r"\1*****", r.body)
     return r
 
 
@@ -97,9 +170,14 @@ def _filter_token(r):
     if hasattr(r, "headers") and "X-Consul-Token" in r.headers:
         r.headers["X-Consul-Token"] = "[redacted]"
 
-    # Redact "access_token":"<token>" in response from SASLogon service
+    # Redact "access_token":"<token>" and "refresh_token":"<token>" in
+    # responses from SASLogon service
     if hasattr(r, "_content"):
-        r._content = _redact('(?<=access_token":")[^"]*', "[redacted]", r._content)
+        r._content = _redact(
+            r'("(?:access|refresh)_token"\s*:\s*")[^"]*',
+            r"\1[redacted]",
+            r._content,
+        )
 
     return r
 
@@ -107,6 +185,98 @@ def _filter_token(r):
 DEFAULT_FILTERS = [_filter_password, _filter_token]
 
 
+class _HttpLogMessage:
+    """Deferred DEBUG log message for an HTTP request or response.
+
+    Holds references to the message parts instead of copies.  The body is
+    truncated and the filters are applied only when a handler actually
+    formats the record, so redaction runs on just the emitted bytes.
+
+    """
+
+    __slots__ = (
+        "_line",
+        "_target",
+        "_headers",
+        "_body",
+        "_filters",
+        "_limit",
+        "_text",
+    )
+
+    def __init__(self, line, target, headers, body, filters, limit=None):
+        self._line = line
+        self._target = target
+        self._headers = headers
+        self._body = body
+        self._filters = filters
+        self._limit = limit
+        self._text = None
+
+    def __str__(self):
+        if self._text is None:
+            self._text = self._format()
+        return self._text
+
+    def _format(self):
+        body = self._body
+        truncated = 0
+        if (
+            self._limit is not None
+            and isinstance(body, (bytes, str))
+            and len(body) > self._limit
+        ):
+            truncated = len(body) - self._limit
+            body = body[: self._limit]
+
+        # Filters expect a request or response object and modify it in place,
+        # so give them a throwaway view of the emitted parts.
+        view = _LogView(self._target, self._headers, body)
+        for f in self._filters:
+            view = f(view)
+            # Request filters edit `body`, response filters edit `_content`.
+            # Keep both in sync so every filter sees prior redactions.
+            if view.body is not body:
+                body = view._content = view.body
+            else:
+                body = view.body = view._content
+
+        if truncated:
+            if isinstance(body, bytes):
+                body = body.decode("utf-8", errors="replace")
+            body = "%s... [%d more bytes]" % (body, truncated)
+        else:
+            body = _pformat(body)
+
+        headers = "\n".join("{}: {}".format(k, v) for k, v in view.headers.items())
+        return "{}\n{}\nBody:\n{}".format(self._line, headers, body)
+
+
+class _LogView:
+    """Request or response passed to `Session.filters` when logging.
+
+    Filters can modify `headers`, `body`, and `_content` without changing the
+    real request or response.  Other attributes are read from the wrapped
+    object.
+
+    """
+
+    def __init__(self, target, headers, body):
+        self._target = target
+        self.headers = requests.structures.CaseInsensitiveDict(headers or {})
+        self.body = body
+        self._content = body
+
+    def __getattr__(self, name):
+        return getattr(self._target, name)
+
+    @property
+    def text(self):
+        if isinstance(self._content, bytes):
+            return self._content.decode("utf-8", errors="replace")
+        return self._content
+
+
 def current_session(*args, **kwargs):
     """Gets and sets the current session.
 
@@ -153,76 +323,1153 @@ def current_session(*args, **kwargs):
     elif args:
         _session = Session(*args, **kwargs)
 
-    return _session
+    return _session
+
+
+class OAuth2Token(requests.auth.AuthBase):
+    def __init__(
+        self,
+        access_token,
+        refresh_token=None,
+        expiration=None,
+        expires_in=None,
+        **kwargs,
+    ):
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self.expiration = expiration
+
+        if expires_in is not None:
+            self.expiration = datetime.now() + timedelta(seconds=expires_in)
+
+    def __call__(self, r):
+        r.headers["Authorization"] = "Bearer " + self.access_token
+        return r
+
+    @property
+    def is_expired(self):
+        if self.expiration is None:
+            return False
+
+        return self.expiration < datetime.now()
+
+    def expires_within(self, seconds):
+        """Check whether the token will expire in the next `seconds` seconds.
+
+        Parameters
+        ----------
+        seconds : float
+
+        Returns
+        -------
+        bool
+
+        """
+        if self.expiration is None:
+            return False
+
+        return self.expiration < datetime.now() + timedelta(seconds=seconds)
+
+
+# Link attributes whose values repeat across every resource returned by a
+# service.  These are interned so large listings share one copy of each.
+_INTERNED_LINK_KEYS = ("method", "rel", "type", "responseType", "itemType")
+
+
+def _compact_links(obj):
+    """Intern repeated strings in the links of a JSON resource, in place."""
+    links = obj.get("links")
+    if isinstance(links, list):
+        intern = sys.intern
+        for link in links:
+            if isinstance(link, dict):
+                for key in _INTERNED_LINK_KEYS:
+                    value = link.get(key)
+                    if type(value) is str:
+                        link[key] = intern(value)
+    return obj
+
+
+# Maps a sequence of link rels to the position(s) of each rel in the sequence.
+# Resources of the same type share a layout, so each object only needs a
+# reference to look up its links in O(1).
+_MAX_LINK_LAYOUTS = 1024
+_link_layouts = {}
+
+
+def _link_layout(links):
+    rels = tuple(link.get("rel") for link in links)
+    layout = _link_layouts.get(rels)
+
+    if layout is None:
+        positions = {}
+        for i, rel in enumerate(rels):
+            positions.setdefault(rel, []).append(i)
+        layout = {
+            rel: idx[0] if len(idx) == 1 else tuple(idx)
+            for rel, idx in positions.items()
+        }
+
+        if len(_link_layouts) < _MAX_LINK_LAYOUTS:
+            _link_layouts[rels] = layout
+
+    return layout
+
+
+class RestObj(dict):
+    def __getattr__(self, item):
+        # Only called when __getattribute__ failed to find the attribute
+        # Return the item from underlying dictionary if possible.
+        if item in self:
+            result = self[item]
+
+            # Wrap nested objects on first access and store the wrapper in
+            # place of the original so later lookups don't wrap it again.
+            if isinstance(result, dict) and not isinstance(result, RestObj):
+                result = RestObj(result)
+                self[item] = result
+
+            return result
+
+        raise AttributeError(
+            "'%s' object has no attribute '%s'" % (self.__class__.__name__, item)
+        )
+
+    def __repr__(self):
+        headers = getattr(self, "_headers", {})
+
+        return "%s(headers=%r, data=%s)" % (
+            self.__class__,
+            headers,
+            super(RestObj, self).__repr__(),
+        )
+
+    def __str__(self):
+        if "name" in self:
+            return str(self["name"])
+        if "id" in self:
+            return str(self["id"])
+        return repr(self)
+
+    def _get_links(self, rel):
+        """Look up links by rel using a layout index shared between objects."""
+        links = self["links"]
+        try:
+            indexed, length, layout = self.__dict__["_link_index"]
+        except KeyError:
+            indexed = None
+
+        # Rebuild the index if the links have been replaced or modified.
+        if indexed is not links or length != len(links):
+            layout = _link_layout(links)
+            self.__dict__["_link_index"] = (links, len(links), layout)
+
+        position = layout.get(rel)
+        if position is None:
+            return None
+        if isinstance(position, int):
+            return links[position]
+
+        # Multiple links with the same rel are returned as a list
+        return [links[i] for i in position]
+
+
+def _json_default(obj):
+    # Convert NumPy scalars and arrays without requiring NumPy to be imported.
+    if type(obj).__module__ == "numpy" and hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError("Object of type %s is not JSON serializable" % type(obj).__name__)
+
+
+class JSONCodec:
+    """Encodes and decodes JSON request and response bodies.
+
+    Uses the standard library `json` module.  Documents are written without
+    optional whitespace, and NumPy scalars and arrays are serialized as the
+    equivalent Python numbers and lists.
+
+    See Also
+    --------
+    OrjsonCodec
+
+    """
+
+    name = "json"
+
+    def dumps(self, obj):
+        """Serialize an object to a JSON document.
+
+        Parameters
+        ----------
+        obj : any
+
+        Returns
+        -------
+        bytes
+
+        """
+        return json.dumps(obj, default=_json_default, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+    def loads(self, data, object_pairs_hook=None):
+        """Deserialize a JSON document.
+
+        Parameters
+        ----------
+        data : bytes or str
+        object_pairs_hook : callable, optional
+            Called with the key/value pairs of each JSON object to construct
+            it, as in `json.loads`.  Used to decode responses directly into
+            `RestObj` instances.
+
+        Returns
+        -------
+        any
+
+        Raises
+        ------
+        ValueError
+            If `data` is not a valid JSON document.
+
+        """
+        return json.loads(data, object_pairs_hook=object_pairs_hook)
+
+
+class OrjsonCodec(JSONCodec):
+    """Encodes and decodes JSON bodies using the `orjson` package.
+
+    Significantly faster than the standard library for large documents and
+    serializes NumPy arrays natively.  Not used unless requested, since it
+    differs from the standard library in a few ways:
+
+     - NaN and infinite floats are serialized as ``null`` instead of the
+       non-standard ``NaN`` and ``Infinity`` tokens.
+     - Only UTF-8 documents can be decoded.  Responses that declare a
+       different charset are decoded to text before they're parsed.
+     - `object_pairs_hook` is only applied to the outermost object, and
+       nested objects are returned as `dict`.
+
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise RuntimeError("The orjson package is required to use OrjsonCodec.")
+
+    def dumps(self, obj):
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+
+    def loads(self, data, object_pairs_hook=None):
+        obj = orjson.loads(data)
+        if object_pairs_hook is not None and isinstance(obj, dict):
+            obj = object_pairs_hook(obj.items())
+        return obj
+
+
+def default_json_codec():
+    """Get the JSON codec used by sessions that don't specify one.
+
+    The standard library codec is used unless the SASCTL_JSON_CODEC
+    environment variable is set to ``orjson``.  See `OrjsonCodec` for how its
+    output differs.
+
+    Returns
+    -------
+    JSONCodec
+
+    Raises
+    ------
+    RuntimeError
+        If SASCTL_JSON_CODEC is ``orjson`` but the orjson package is not
+        installed.
+
+    """
+    if os.environ.get("SASCTL_JSON_CODEC", "").lower() == "orjson":
+        return OrjsonCodec()
+    return JSONCodec()
+
+
+_MULTIPART_ESCAPES = {ord('"'): "%22", ord("\r"): "%0D", ord("\n"): "%0A"}
+
+
+def _file_size(file):
+    """Number of bytes remaining in a binary file, or None if unknown."""
+    if isinstance(file, io.TextIOBase) or "b" not in getattr(file, "mode", "b"):
+        # Encoded size of text isn't known until it's read.
+        return None
+    try:
+        position = file.tell()
+        end = file.seek(0, os.SEEK_END)
+        file.seek(position)
+    except (AttributeError, OSError, ValueError):
+        return None
+    return max(0, end - position)
+
+
+class MultipartStream:
+    """A multipart/form-data request body that reads files as it's sent.
+
+    Passing `files=` to :meth:`Session.request` reads each file into memory
+    before anything is sent.  A `MultipartStream` is passed as `data=`
+    instead and reads file contents in chunks as the request is transmitted,
+    so memory use stays constant regardless of file size.
+
+    Parameters
+    ----------
+    files : dict
+        Maps each field name to a binary or text file-like object, bytes, or
+        a tuple of ``(filename, file)`` or ``(filename, file, content_type)``.
+        If no filename is given the field name is used.
+    fields : dict, optional
+        Additional form fields and their string values.  Sent before files.
+    compress : bool, optional
+        Gzip the body as it's sent and set the ``Content-Encoding`` header.
+        Only use with servers that accept compressed requests.  Defaults to
+        False.
+    progress : callable, optional
+        Called as ``progress(bytes_read, total_bytes)`` after each chunk of
+        file content is read.  `total_bytes` is None if the size of any file
+        can't be determined in advance.
+    chunk_size : int, optional
+        Number of bytes to read from a file at a time.
+
+    Attributes
+    ----------
+    headers : dict
+        The ``Content-Type`` and, if compressed, ``Content-Encoding`` headers
+        that must be sent with the body.
+    len : int
+        Size of the body in bytes.  Only set if it's known in advance, in
+        which case ``Content-Length`` is sent.  Otherwise the body is sent
+        with chunked transfer encoding.
+
+    Examples
+    --------
+    >>> with open('data.csv', 'rb') as f:
+    ...     body = MultipartStream({'file': ('data.csv', f)})
+    ...     session.post('/files/files', data=body, headers=body.headers)
+
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self, files, fields=None, compress=False, progress=None, chunk_size=None
+    ):
+        self.boundary = uuid4().hex
+        self.compress = bool(compress)
+        self.progress = progress
+        self.chunk_size = chunk_size or self.CHUNK_SIZE
+        self.headers = {
+            "Content-Type": "multipart/form-data; boundary=%s" % self.boundary
+        }
+        if self.compress:
+            self.headers["Content-Encoding"] = "gzip"
+
+        # Each part is (header bytes, content, start position of content)
+        self._parts = []
+        length = 0
+        for name, value in (fields or {}).items():
+            value = value if isinstance(value, bytes) else str(value).encode("utf-8")
+            header = self._part_header(name)
+            self._parts.append((header, value, None))
+            length += len(header) + len(value) + 2
+
+        self.total_bytes = 0
+        for name, value in files.items():
+            if isinstance(value, (tuple, list)):
+                filename, file = value[0], value[1]
+                content_type = value[2] if len(value) > 2 else None
+            else:
+                filename, file, content_type = name, value, None
+
+            if isinstance(file, (bytes, bytearray)):
+                file = io.BytesIO(file)
+            size = _file_size(file)
+            if size is None or self.total_bytes is None:
+                self.total_bytes = None
+            else:
+                self.total_bytes += size
+
+            try:
+                start = file.tell()
+            except (AttributeError, OSError, ValueError):
+                start = None
+            header = self._part_header(name, filename, content_type)
+            self._parts.append((header, file, start))
+            length += len(header) + 2
+
+        self._closing = ("--%s--\r\n" % self.boundary).encode("utf-8")
+
+        if self.total_bytes is not None and not self.compress:
+            self.len = length + self.total_bytes + len(self._closing)
+
+        self.bytes_read = 0
+        self._buffer = bytearray()
+        self._chunks = None
+
+    def __repr__(self):
+        return "<%s %d parts, %s bytes>" % (
+            type(self).__name__,
+            len(self._parts),
+            getattr(self, "len", "unknown"),
+        )
+
+    def __iter__(self):
+        return iter(lambda: self.read(self.chunk_size), b"")
+
+    def _part_header(self, name, filename=None, content_type=None):
+        header = '--%s\r\nContent-Disposition: form-data; name="%s"' % (
+            self.boundary,
+            str(name).translate(_MULTIPART_ESCAPES),
+        )
+        if filename is not None:
+            header += '; filename="%s"' % str(filename).translate(_MULTIPART_ESCAPES)
+        if content_type:
+            header += "\r\nContent-Type: %s" % content_type
+        return (header + "\r\n\r\n").encode("utf-8")
+
+    def _iter_parts(self):
+        for header, content, _ in self._parts:
+            yield header
+            if isinstance(content, bytes):
+                yield content
+            else:
+                while True:
+                    chunk = content.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode("utf-8")
+                    self.bytes_read += len(chunk)
+                    if self.progress is not None:
+                        self.progress(self.bytes_read, self.total_bytes)
+                    yield chunk
+            yield b"\r\n"
+        yield self._closing
+
+    def _iter_body(self):
+        if not self.compress:
+            yield from self._iter_parts()
+            return
+
+        # wbits=31 writes a gzip header and trailer around the deflate stream.
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        for chunk in self._iter_parts():
+            chunk = compressor.compress(chunk)
+            if chunk:
+                yield chunk
+        yield compressor.flush()
+
+    def read(self, size=-1):
+        """Read up to `size` bytes of the encoded body.
+
+        Parameters
+        ----------
+        size : int, optional
+            Maximum number of bytes to return.  Reads the rest of the body if
+            negative.
+
+        Returns
+        -------
+        bytes
+            An empty bytes object once the whole body has been read.
+
+        """
+        if self._chunks is None:
+            self._chunks = self._iter_body()
+
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+
+        size = len(self._buffer) if size < 0 else size
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def rewind(self):
+        """Return to the start of the body so it can be sent again.
+
+        Raises
+        ------
+        io.UnsupportedOperation
+            If a file has already been read and can't be seeked back to its
+            starting position.
+
+        """
+        if self._chunks is not None:
+            for _, content, start in self._parts:
+                if isinstance(content, bytes):
+                    continue
+                if start is None:
+                    raise io.UnsupportedOperation(
+                        "Unable to rewind %r to resend the request." % content
+                    )
+                content.seek(start)
+
+        self.bytes_read = 0
+        self._buffer = bytearray()
+        self._chunks = None
+
+
+class _CacheEntry:
+    """The parts of a cached response needed to rebuild it.
+
+    Responses are mutable, so each cache hit gets its own copy built by
+    `to_response()` instead of sharing the original between callers.
+
+    """
+
+    __slots__ = (
+        "status_code",
+        "headers",
+        "content",
+        "encoding",
+        "reason",
+        "url",
+        "etag",
+        "path",
+        "expires",
+    )
+
+    def __init__(self, response, etag, path, expires):
+        self.status_code = response.status_code
+        self.headers = dict(response.headers)
+        self.content = response.content
+        self.encoding = response.encoding
+        self.reason = response.reason
+        self.url = response.url
+        self.etag = etag
+        self.path = path
+        self.expires = expires
+
+    @property
+    def expired(self):
+        return time.monotonic() >= self.expires
+
+    def to_response(self, request=None):
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers = requests.structures.CaseInsensitiveDict(self.headers)
+        response._content = self.content
+        response.encoding = self.encoding
+        response.reason = self.reason
+        response.url = self.url
+        response.request = request
+        return response
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of GET responses.
+
+    Cached responses are returned without contacting the server until their
+    TTL expires.  After that the request is sent with an `If-None-Match`
+    header containing the response's ETag and the cached response is reused
+    if the server responds with HTTP 304.
+
+    Cached copies of a resource, its sub-resources, and the collection
+    containing it are discarded when a PUT, POST, PATCH, or DELETE request is
+    made to the resource.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of responses to store.  Defaults to 256.
+    ttl : float, optional
+        Number of seconds a response is used without revalidating it with the
+        server.  Defaults to 0, meaning every request is revalidated.
+    ttls : dict, optional
+        TTL overrides for specific services, keyed by URL path prefix.  For
+        example, ``{'/modelRepository': 60}``.  The longest matching prefix is
+        used.
+    max_entry_size : int, optional
+        Responses with bodies larger than this many bytes are not cached.
+        Defaults to 1 MB.
+
+    Attributes
+    ----------
+    stats : collections.Counter
+        Number of cache `hits`, successful `revalidations`, and `misses`.
+
+    """
+
+    def __init__(self, maxsize=256, ttl=0, ttls=None, max_entry_size=2**20):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.max_entry_size = max_entry_size
+        self.stats = Counter()
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def ttl_for(self, path):
+        """Get the TTL for responses from a path.
+
+        Parameters
+        ----------
+        path : str
+            Path portion of the URL.
+
+        Returns
+        -------
+        float
+
+        """
+        matches = [p for p in self.ttls if path.startswith(p)]
+        if matches:
+            return self.ttls[max(matches, key=len)]
+        return self.ttl
+
+    def record(self, stat):
+        """Increment one of the `stats` counters."""
+        with self._lock:
+            self.stats[stat] += 1
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, response):
+        etag = response.headers.get("ETag")
+        path = urlsplit(key[0]).path
+        ttl = self.ttl_for(path)
+
+        # Nothing to gain from caching a response that can't be revalidated
+        # and must be revalidated immediately.
+        if not etag and ttl <= 0:
+            return
+        if len(response.content or b"") > self.max_entry_size:
+            return
+
+        entry = _CacheEntry(response, etag, path, time.monotonic() + ttl)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def refresh(self, key, response):
+        """Extend the TTL of a cached response the server revalidated.
+
+        Parameters
+        ----------
+        key : tuple
+            Cache key of the response.
+        response : requests.Response
+            The HTTP 304 response from the server.  Its ETag, if any, replaces
+            the cached ETag.
+
+        Returns
+        -------
+        _CacheEntry or None
+            The refreshed entry, or None if it's no longer cached.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.etag = response.headers.get("ETag") or entry.etag
+            entry.expires = time.monotonic() + self.ttl_for(entry.path)
+            self._entries.move_to_end(key)
+            return entry
+
+    def invalidate(self, path=None):
+        """Discard cached responses.
+
+        Parameters
+        ----------
+        path : str, optional
+            Discard responses for this resource, its sub-resources, and the
+            collection containing it.  Defaults to discarding all responses.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+
+            path = path.rstrip("/")
+            parent = path.rsplit("/", 1)[0]
+            stale = [
+                k
+                for k, e in self._entries.items()
+                if e.path.rstrip("/") in (path, parent) or e.path.startswith(path + "/")
+            ]
+            for k in stale:
+                del self._entries[k]
+
+
+class ConnectionStats:
+    """Thread-safe counters describing connection pool and retry behavior.
+
+    Attributes
+    ----------
+    retries : int
+        Number of requests that were retried after a connection error or a
+        retryable status code (429, 502, 503, 504).
+    pool_waits : int
+        Number of times a connection was requested from a pool with no idle
+        connections available.  When the pool is blocking the request waits
+        for a connection, otherwise a new connection is opened and discarded
+        after use.  A high count indicates `pool_maxsize` should be increased.
+
+    """
+
+    def __init__(self):
+        self._counts = Counter()
+        self._lock = threading.Lock()
+
+    def increment(self, name, value=1):
+        with self._lock:
+            self._counts[name] += value
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+
+    @property
+    def retries(self):
+        return self._counts["retries"]
+
+    @property
+    def pool_waits(self):
+        return self._counts["pool_waits"]
+
+    def as_dict(self):
+        with self._lock:
+            return {"retries": self.retries, "pool_waits": self.pool_waits}
+
+    def __repr__(self):
+        return "%s(%s)" % (
+            self.__class__.__name__,
+            ", ".join("%s=%s" % (k, v) for k, v in self.as_dict().items()),
+        )
+
+
+_ID_SEGMENT = re.compile(
+    r"^(?:\d+|[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12})$", re.I
+)
+
+
+def _endpoint_name(method, url):
+    """Group requests for different items of the same resource.
+
+    Path segments that are ids are replaced with "{id}" and the query string
+    is dropped, so "GET /files/files/0b7a...?limit=10" becomes
+    "GET /files/files/{id}".
+
+    """
+    path = urlsplit(url).path if "://" in url else url.split("?", 1)[0]
+    path = "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")
+    )
+    return "%s %s" % (method, path) if method else path
+
+
+class MetricsEvent:
+    """Describes one instrumented operation.
+
+    Attributes
+    ----------
+    kind : str
+        "request" for each HTTP request sent by a `Session`, "token" when an
+        access token is refreshed, "page" when a `PageIterator` worker
+        downloads a page of items, and "job" when polling of a job ends.
+    endpoint : str
+        HTTP method and path of the resource, with ids replaced by "{id}".
+    service : str
+        Name of the service called, taken from the first segment of the path.
+    elapsed : float
+        Duration of the operation in seconds.
+    status : int or str
+        HTTP status code for requests and pages, final state for jobs, or None
+        if the operation raised an exception.
+    bytes_sent : int
+        Size of the request body, if known.
+    bytes_received : int
+        Size of the response body, if known.
+    retries : int
+        Number of times the request was retried, or the number of polls made
+        for a job.
+    error : Exception
+        Exception raised by the operation, if any.
+    details : dict
+        Additional information specific to `kind`, such as the number of
+        items in a page.
+
+    """
+
+    __slots__ = (
+        "kind",
+        "endpoint",
+        "service",
+        "elapsed",
+        "status",
+        "bytes_sent",
+        "bytes_received",
+        "retries",
+        "error",
+        "details",
+    )
+
+    def __init__(
+        self,
+        kind,
+        endpoint,
+        elapsed,
+        status=None,
+        bytes_sent=None,
+        bytes_received=None,
+        retries=0,
+        error=None,
+        **details,
+    ):
+        self.kind = kind
+        self.endpoint = endpoint
+        path = endpoint.rsplit(" ", 1)[-1]
+        self.service = path.strip("/").split("/", 1)[0]
+        self.elapsed = elapsed
+        self.status = status
+        self.bytes_sent = bytes_sent
+        self.bytes_received = bytes_received
+        self.retries = retries
+        self.error = error
+        self.details = details
+
+    def __repr__(self):
+        return "<%s %s %s %s %.1fms>" % (
+            self.__class__.__name__,
+            self.kind,
+            self.endpoint,
+            self.status,
+            self.elapsed * 1000,
+        )
+
+
+def _body_size(body):
+    """Size of a request body in bytes, or None if it is a stream."""
+    if body is None:
+        return 0
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    # A MultipartStream knows its length unless it's compressed.
+    return getattr(body, "len", None)
+
+
+def _notify(session, event):
+    """Pass `event` to each of the session's listeners."""
+    for listener in getattr(session, "listeners", ()):
+        try:
+            listener(event)
+        except Exception:  # skipcq PYL-W0703
+            # Instrumentation must never break the operation being measured.
+            logger.exception("Metrics listener %r failed.", listener)
+
+
+class MetricsRecorder:
+    """Aggregates `MetricsEvent` latencies by endpoint.
+
+    Register the recorder with `Session.add_listener()` or use
+    `Session.instrument()`.
+
+    Parameters
+    ----------
+    max_samples : int, optional
+        Maximum number of latencies retained per endpoint.  Once reached, a
+        random sample of latencies is kept.  Defaults to 10,000.
+
+    Examples
+    --------
+    >>> with Session('example.com') as s:
+    ...     with s.instrument() as metrics:
+    ...         register_model(...)
+    ...     print(metrics.report())
+
+    """
+
+    def __init__(self, max_samples=10000):
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def __call__(self, event):
+        key = (event.kind, event.endpoint)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = {
+                    "count": 0,
+                    "errors": 0,
+                    "total": 0.0,
+                    "bytes_sent": 0,
+                    "bytes_received": 0,
+                    "retries": 0,
+                    "samples": [],
+                }
+
+            stats["count"] += 1
+            stats["total"] += event.elapsed
+            stats["retries"] += event.retries or 0
+            stats["bytes_sent"] += event.bytes_sent or 0
+            stats["bytes_received"] += event.bytes_received or 0
+            if event.error is not None or (
+                isinstance(event.status, int) and event.status >= 400
+            ):
+                stats["errors"] += 1
+
+            # Reservoir sampling keeps memory bounded for long-running sessions
+            samples = stats["samples"]
+            if len(samples) < self.max_samples:
+                samples.append(event.elapsed)
+            else:
+                i = random.randrange(stats["count"])
+                if i < self.max_samples:
+                    samples[i] = event.elapsed
+
+    @staticmethod
+    def _percentile(samples, q):
+        # Nearest-rank percentile of sorted samples
+        index = max(0, int(math.ceil(q / 100.0 * len(samples))) - 1)
+        return samples[index]
+
+    def summary(self, kind=None):
+        """Latency and volume statistics for each endpoint.
+
+        Parameters
+        ----------
+        kind : str, optional
+            Only include events of this kind, such as "request".
+
+        Returns
+        -------
+        dict
+            Maps (kind, endpoint) to a dict with `count`, `errors`, `total`,
+            `mean`, `p50`, `p95`, `p99`, and `max` (all in seconds), and the
+            `bytes_sent`, `bytes_received`, and `retries` totals.
+
+        """
+        with self._lock:
+            items = [
+                (key, dict(stats, samples=sorted(stats["samples"])))
+                for key, stats in self._stats.items()
+                if kind is None or key[0] == kind
+            ]
+
+        result = {}
+        for key, stats in items:
+            samples = stats.pop("samples")
+            stats["mean"] = stats["total"] / stats["count"]
+            for q in (50, 95, 99):
+                stats["p%d" % q] = self._percentile(samples, q)
+            stats["max"] = samples[-1]
+            result[key] = stats
+        return result
+
+    def slowest(self, n=5, by="p95", kind="request"):
+        """Endpoints with the highest latency.
+
+        Parameters
+        ----------
+        n : int, optional
+            Number of endpoints to return.
+        by : str, optional
+            Statistic to sort by.  Defaults to "p95".
+        kind : str, optional
+            Kind of events to consider.  Defaults to "request".
+
+        Returns
+        -------
+        list of (str, dict)
+            Endpoint and its statistics, slowest first.
+
+        """
+        summary = self.summary(kind)
+        ranked = sorted(summary.items(), key=lambda x: x[1][by], reverse=True)
+        return [(key[1], stats) for key, stats in ranked[:n]]
+
+    def report(self, kind=None):
+        """Format the summary as a table sorted by total time.
 
+        Returns
+        -------
+        str
 
-class OAuth2Token(requests.auth.AuthBase):
-    def __init__(
-        self,
-        access_token,
-        refresh_token=None,
-        expiration=None,
-        expires_in=None,
-        **kwargs,
-    ):
-        self.access_token = access_token
-        self.refresh_token = refresh_token
-        self.expiration = expiration
+        """
+        rows = sorted(
+            self.summary(kind).items(), key=lambda x: x[1]["total"], reverse=True
+        )
+        lines = [
+            "%-8s %-60s %7s %7s %9s %9s %9s %9s"
+            % (
+                "kind",
+                "endpoint",
+                "count",
+                "errors",
+                "p50 ms",
+                "p95 ms",
+                "p99 ms",
+                "total s",
+            )
+        ]
+        for (event_kind, endpoint), stats in rows:
+            lines.append(
+                "%-8s %-60s %7d %7d %9.1f %9.1f %9.1f %9.2f"
+                % (
+                    event_kind,
+                    endpoint,
+                    stats["count"],
+                    stats["errors"],
+                    stats["p50"] * 1000,
+                    stats["p95"] * 1000,
+                    stats["p99"] * 1000,
+                    stats["total"],
+                )
+            )
+        return "\n".join(lines)
 
-        if expires_in is not None:
-            self.expiration = datetime.now() + timedelta(seconds=expires_in)
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
 
-    def __call__(self, r):
-        r.headers["Authorization"] = "Bearer " + self.access_token
-        return r
 
-    @property
-    def is_expired(self):
-        if self.expiration is None:
-            return False
+class RetryPolicy(Retry):
+    """Retry idempotent requests with exponential backoff and random jitter.
 
-        return self.expiration < datetime.now()
+    Requests using idempotent methods (GET, HEAD, PUT, DELETE, OPTIONS, TRACE)
+    are retried after connection errors and when the server responds with 429,
+    502, 503, or 504.  The `Retry-After` header is honored when present.
 
+    Parameters
+    ----------
+    total : int
+        Maximum number of retries.
+    backoff_factor : float, optional
+        Delay before the n-th retry is `backoff_factor * 2 ** (n - 1)` seconds.
+    jitter : float, optional
+        Maximum number of seconds of random delay added to each backoff.
+    stats : ConnectionStats, optional
+        Counters to update whenever a request is retried.
+    kwargs : any
+        Passed to `urllib3.util.retry.Retry`.
 
-class RestObj(dict):
-    def __getattr__(self, item):
-        # Only called when __getattribute__ failed to find the attribute
-        # Return the item from underlying dictionary if possible.
-        if item in self:
-            result = self[item]
+    """
 
-            if isinstance(result, dict):
-                return RestObj(result)
+    RETRY_STATUS_CODES = frozenset([429, 502, 503, 504])
 
-            return result
+    def __init__(self, total=3, backoff_factor=0.5, jitter=0.5, stats=None, **kwargs):
+        kwargs.setdefault("status_forcelist", self.RETRY_STATUS_CODES)
+        kwargs.setdefault("respect_retry_after_header", True)
 
-        raise AttributeError(
-            "'%s' object has no attribute '%s'" % (self.__class__.__name__, item)
+        # Return the last response instead of raising once retries are exhausted
+        kwargs.setdefault("raise_on_status", False)
+        super(RetryPolicy, self).__init__(
+            total=total, backoff_factor=backoff_factor, **kwargs
         )
+        self.jitter = jitter
+        self.stats = stats
+
+    def new(self, **kw):
+        # Retry instances are immutable and copied on each increment, so
+        # ensure the extra attributes are carried over.
+        retry = super(RetryPolicy, self).new(**kw)
+        retry.jitter = self.jitter
+        retry.stats = self.stats
+        return retry
+
+    def increment(self, method=None, url=None, *args, **kwargs):
+        # Name resolution failures won't be fixed by retrying so fail immediately
+        error = kwargs.get("error")
+        cause = getattr(error, "__cause__", None) or getattr(error, "__context__", None)
+        if isinstance(cause, socket.gaierror):
+            raise MaxRetryError(kwargs.get("_pool"), url, error)
+
+        retry = super(RetryPolicy, self).increment(method, url, *args, **kwargs)
+        if self.stats is not None:
+            self.stats.increment("retries")
+        return retry
+
+    def get_backoff_time(self):
+        backoff = super(RetryPolicy, self).get_backoff_time()
+        if backoff <= 0 or not self.jitter:
+            return backoff
+        # urllib3 < 2 only defines the class level DEFAULT_BACKOFF_MAX
+        backoff_max = getattr(self, "backoff_max", Retry.DEFAULT_BACKOFF_MAX)
+        return min(backoff_max, backoff + random.uniform(0, self.jitter))
+
+
+def _pool_class(base, stats):
+    """Create a connection pool class that records pool exhaustion in `stats`."""
+
+    class CountingConnectionPool(base):
+        def _get_conn(self, timeout=None):
+            # Pool is pre-filled with placeholders, so an empty queue means
+            # every connection is currently in use.
+            if stats is not None and self.pool is not None and self.pool.empty():
+                stats.increment("pool_waits")
+            return super(CountingConnectionPool, self)._get_conn(timeout)
+
+    return CountingConnectionPool
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that records connection pool and retry statistics.
 
-    def __repr__(self):
-        headers = getattr(self, "_headers", {})
+    Parameters
+    ----------
+    stats : ConnectionStats, optional
+        Counters to update.
+    args : any
+        Passed to `requests.adapters.HTTPAdapter`.
+    kwargs : any
+        Passed to `requests.adapters.HTTPAdapter`.
 
-        return "%s(headers=%r, data=%s)" % (
-            self.__class__,
-            headers,
-            super(RestObj, self).__repr__(),
-        )
+    """
 
-    def __str__(self):
-        if "name" in self:
-            return str(self["name"])
-        if "id" in self:
-            return str(self["id"])
-        return repr(self)
+    def __init__(self, *args, **kwargs):
+        self.stats = kwargs.pop("stats", None)
+        HTTPAdapter.__init__(self, *args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super(PooledHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _pool_class(HTTPConnectionPool, self.stats),
+            "https": _pool_class(HTTPSConnectionPool, self.stats),
+        }
 
+    def __setstate__(self, state):
+        # Pickled adapters don't include the stats counters
+        self.stats = None
+        super(PooledHTTPAdapter, self).__setstate__(state)
 
-class SSLContextAdapter(HTTPAdapter):
+
+class SSLContextAdapter(PooledHTTPAdapter):
     """HTTPAdapter that uses the default SSL context on the machine."""
 
     def __init__(self, *args, **kwargs):
         self.assert_hostname = kwargs.pop("assert_hostname", True)
-        requests.adapters.HTTPAdapter.__init__(self, *args, **kwargs)
+        PooledHTTPAdapter.__init__(self, *args, **kwargs)
 
     def init_poolmanager(self, *args, **kwargs):
         context = ssl.create_default_context()
@@ -265,6 +1512,32 @@ class Session(requests.Session):
     client_secret : str, optional
         Client secret for client requesting access. Required if `client_id`
         is provided.
+    pool_connections : int, optional
+        Number of connection pools to cache.  Defaults to 10.
+    pool_maxsize : int, optional
+        Maximum number of connections to keep open to the server.  Should be
+        at least the number of threads sharing the session.  Defaults to 10.
+    pool_block : bool, optional
+        Whether requests should wait for an available connection instead of
+        opening additional connections when the pool is full.  Defaults to
+        False.
+    max_retries : int or urllib3.util.retry.Retry, optional
+        Number of times idempotent requests are retried after connection
+        errors or HTTP 429, 502, 503, and 504 responses.  Retries use
+        exponential backoff with jitter and honor the `Retry-After` header.
+        Defaults to 0, which disables retries.
+    json_codec : JSONCodec, optional
+        Used to encode `json` request bodies and decode responses.  Pass an
+        `OrjsonCodec` to use the faster orjson package.  Defaults to
+        `default_json_codec()`.
+    cache : bool or ResponseCache, optional
+        Cache GET responses and revalidate them using ETags.  Pass a
+        `ResponseCache` instance to control the size and TTLs of the cache.
+        Defaults to False.
+    index_names : bool, optional
+        Remember the id of each item returned by the `list_*()` and `get_*()`
+        service functions so later lookups by name can request the item
+        directly instead of searching for it.  Defaults to False.
 
 
     Attributes
@@ -277,10 +1550,32 @@ class Session(requests.Session):
         A collection of functions that will be called with each request and response object *prior* to logging the
         messages, allowing any sensitive information to be removed first.
 
+    connection_stats : ConnectionStats
+        Counts of retried requests and connection pool exhaustion.  Useful for
+        tuning `pool_maxsize` and `max_retries`.
+
+    json_codec : JSONCodec
+        Codec used to encode and decode JSON bodies.
+
+    response_cache : ResponseCache or None
+        Cache of GET responses, if enabled.
+
+    listeners : tuple of callable
+        Functions called with a `MetricsEvent` after each request, token
+        refresh, page download, and job poll.  Use `add_listener()` or
+        `instrument()` to register a listener.
+
     """
 
     PROFILE_PATH = "~/.sas/viya-api-profiles.yaml"
 
+    # Access tokens are refreshed this many seconds before they expire.
+    TOKEN_REFRESH_MARGIN = 30
+
+    # Maximum number of bytes of a request or response body written to the
+    # DEBUG message log.  Set to None to log complete bodies.
+    LOG_BODY_LIMIT = 4096
+
     def __init__(
         self,
         hostname,
@@ -294,6 +1589,13 @@ class Session(requests.Session):
         client_id=None,
         client_secret=None,
         consul_token=None,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_block=False,
+        max_retries=0,
+        json_codec=None,
+        cache=False,
+        index_names=False,
     ):
         super(Session, self).__init__()
 
@@ -305,6 +1607,35 @@ class Session(requests.Session):
         self._id = uuid4().hex
         self.message_log = logger.getChild("session.%s" % self._id)
 
+        self.connection_stats = ConnectionStats()
+        self.json_codec = json_codec or default_json_codec()
+
+        if cache is True:
+            cache = ResponseCache()
+        self.response_cache = cache if isinstance(cache, ResponseCache) else None
+        self.index_names = index_names
+        self.listeners = ()
+
+        # Without retries, leave the default requests behavior unchanged
+        if max_retries and not isinstance(max_retries, Retry):
+            max_retries = RetryPolicy(total=int(max_retries))
+        if isinstance(max_retries, RetryPolicy) and max_retries.stats is None:
+            max_retries.stats = self.connection_stats
+
+        adapter_kwargs = {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+            "max_retries": max_retries,
+            "stats": self.connection_stats,
+        }
+
+        # Replace the default adapters, but leave any custom adapters that were
+        # mounted before the session was initialized (e.g. by test frameworks).
+        for prefix in ("http://", "https://"):
+            if type(self.adapters.get(prefix)) is HTTPAdapter:
+                self.mount(prefix, PooledHTTPAdapter(**adapter_kwargs))
+
         # If certificate path has already been set for SWAT package, make
         # Requests module reuse it.
         for k in ["SSLCALISTLOC", "CAS_CLIENT_SSL_CA_LIST"]:
@@ -327,7 +1658,9 @@ class Session(requests.Session):
                         return re.match(r"^(?:[0-9]{1,3}\.){3}[0-9]{1,3}$", hst)
 
                 verify_hostname = not is_ipaddress(hostname)
-                adapter = SSLContextAdapter(assert_hostname=verify_hostname)
+                adapter = SSLContextAdapter(
+                    assert_hostname=verify_hostname, **adapter_kwargs
+                )
 
                 self.mount("https://", adapter)
 
@@ -340,7 +1673,9 @@ class Session(requests.Session):
 
         self.filters = DEFAULT_FILTERS
 
-        # Reuse an existing CAS connection if possible
+        # Reuse an existing CAS connection if possible.  A `swat.CAS` instance
+        # can only exist if `swat` has already been imported.
+        swat = sys.modules.get("swat")
         if swat and isinstance(hostname, swat.CAS):
             if isinstance(
                 hostname._sw_connection, swat.cas.rest.connection.REST_CASConnection
@@ -389,17 +1724,19 @@ class Session(requests.Session):
         if password is None and client_secret is None:
             # Try to get credentials from .authinfo or .netrc files.
             # If no file path was specified, the default locations will
-            # be checked.
-            try:
-                auth = swat.utils.authinfo.query_authinfo(
-                    domain, user=username, path=authinfo
-                )
-                if auth:
-                    self._settings["username"] = auth.get("user")
-                    self._settings["password"] = auth.get("password")
-            except AttributeError:
-                # If swat package or authinfo module not available
-                pass
+            # be checked.  SWAT (and with it pandas) is only imported when
+            # credentials are needed and there is an authinfo file to read.
+            if token is None and consul_token is None and _has_authinfo(authinfo):
+                try:
+                    auth = _import_swat().utils.authinfo.query_authinfo(
+                        domain, user=username, path=authinfo
+                    )
+                    if auth:
+                        self._settings["username"] = auth.get("user")
+                        self._settings["password"] = auth.get("password")
+                except AttributeError:
+                    # If swat package or authinfo module not available
+                    pass
 
             # Not able to load credentials using SWAT.  Try Netrc.
             if self._settings["password"] is None:
@@ -420,6 +1757,9 @@ class Session(requests.Session):
         # Set this prior authentication attempts
         self.verify = verify_ssl
 
+        # Ensures only one thread at a time attempts to refresh the access token
+        self._auth_lock = threading.RLock()
+
         if consul_token:
             self.auth = self._request_token_with_consul(
                 consul_token, client_id=client_id
@@ -523,6 +1863,7 @@ class Session(requests.Session):
         """
         server = server or "cas-shared-default"
 
+        swat = _import_swat()
         if swat is None:
             raise RuntimeError(
                 "The 'swat' package must be installed to create a SWAT connection."
@@ -570,44 +1911,203 @@ class Session(requests.Session):
     def hostname(self):
         return self._settings.get("domain")
 
+    def prepare_request(self, request):
+        # Encode JSON bodies with the session's codec instead of letting
+        # requests use the standard library.
+        if request.json is not None and not request.data and not request.files:
+            request.data, request.headers = _encode_json(
+                self.json_codec, request.json, request.headers
+            )
+            request.json = None
+
+        return super(Session, self).prepare_request(request)
+
     def send(self, request, **kwargs):
-        if self.message_log.isEnabledFor(logging.DEBUG):
-            r = copy.deepcopy(request)
-            for filter in self.filters:
-                r = filter(r)
-
-            self.message_log.debug(
-                "HTTP/1.1 {verb} {url}\n{headers}\nBody:\n{body}".format(
-                    verb=r.method,
-                    url=r.url,
-                    headers="\n".join(
-                        "{}: {}".format(k, v) for k, v in r.headers.items()
-                    ),
-                    body=_pformat(r.body),
+        cache = getattr(self, "response_cache", None)
+        if cache is None:
+            return self._send(request, **kwargs)
+
+        if request.method != "GET":
+            response = self._send(request, **kwargs)
+
+            # Any change to a resource makes cached copies of it stale.
+            if request.method not in ("HEAD", "OPTIONS") and response.status_code < 400:
+                cache.invalidate(urlsplit(request.url).path)
+            return response
+
+        # Streamed responses can't be cached and requests that are already
+        # conditional must see the server's actual response.
+        if kwargs.get("stream") or "If-None-Match" in request.headers:
+            return self._send(request, **kwargs)
+
+        key = (request.url, request.headers.get("Accept"))
+        entry = cache.get(key)
+
+        if entry is not None:
+            if not entry.expired:
+                cache.record("hits")
+                return entry.to_response(request)
+
+            if entry.etag:
+                request.headers["If-None-Match"] = entry.etag
+
+        response = self._send(request, **kwargs)
+
+        # Resource hasn't changed so reuse the cached copy.
+        if response.status_code == 304 and entry is not None:
+            cache.record("revalidations")
+            entry = cache.refresh(key, response) or entry
+            return entry.to_response(request)
+
+        cache.record("misses")
+        if response.status_code == 200:
+            cache.put(key, response)
+
+        return response
+
+    def add_listener(self, listener):
+        """Register a function to be called with each `MetricsEvent`.
+
+        Parameters
+        ----------
+        listener : callable
+            Called with a single `MetricsEvent`.  May be called from multiple
+            threads simultaneously.
+
+        Returns
+        -------
+        callable
+            The listener.
+
+        See Also
+        --------
+        MetricsRecorder
+
+        """
+        # Replace rather than modify so threads iterating the listeners are
+        # unaffected.
+        self.listeners = self.listeners + (listener,)
+        return listener
+
+    def remove_listener(self, listener):
+        """Stop calling a listener registered with `add_listener()`."""
+        self.listeners = tuple(x for x in self.listeners if x != listener)
+
+    @contextlib.contextmanager
+    def instrument(self, listener=None):
+        """Collect metrics for all operations performed within a block.
+
+        Parameters
+        ----------
+        listener : callable, optional
+            Called with each `MetricsEvent`.  Defaults to a new
+            `MetricsRecorder`.
+
+        Yields
+        ------
+        callable
+            The listener.
+
+        Examples
+        --------
+        >>> with s.instrument() as metrics:
+        ...     mr.list_models()
+        >>> metrics.slowest(1)
+
+        """
+        listener = self.add_listener(listener or MetricsRecorder())
+        try:
+            yield listener
+        finally:
+            self.remove_listener(listener)
+
+    def _send(self, request, **kwargs):
+        if not self.listeners:
+            return self._transmit(request, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            response = self._transmit(request, **kwargs)
+        except Exception as e:
+            _notify(
+                self,
+                MetricsEvent(
+                    "request",
+                    _endpoint_name(request.method, request.url),
+                    time.perf_counter() - start,
+                    bytes_sent=_body_size(request.body),
+                    error=e,
+                ),
+            )
+            raise
+
+        retries = getattr(getattr(response.raw, "retries", None), "history", ())
+        received = response.__dict__.get("_content")
+        if isinstance(received, bytes):
+            received = len(received)
+        else:
+            # Streamed content hasn't been read yet.
+            received = response.headers.get("Content-Length")
+            received = int(received) if received and received.isdigit() else None
+
+        _notify(
+            self,
+            MetricsEvent(
+                "request",
+                _endpoint_name(request.method, request.url),
+                time.perf_counter() - start,
+                status=response.status_code,
+                bytes_sent=_body_size(request.body),
+                bytes_received=received,
+                retries=len(retries or ()),
+            ),
+        )
+        return response
+
+    def _transmit(self, request, **kwargs):
+        log = self.message_log
+
+        # Skip all message formatting when nothing would be emitted.
+        if not log.isEnabledFor(logging.INFO):
+            return super(Session, self).send(request, **kwargs)
+
+        debug = log.isEnabledFor(logging.DEBUG)
+
+        if debug:
+            log.debug(
+                _HttpLogMessage(
+                    "HTTP/1.1 %s %s" % (request.method, request.url),
+                    request,
+                    request.headers,
+                    request.body,
+                    self.filters,
+                    self.LOG_BODY_LIMIT,
                 )
             )
         else:
-            self.message_log.info("HTTP/1.1 %s %s", request.method, request.url)
+            log.info("HTTP/1.1 %s %s", request.method, request.url)
 
         response = super(Session, self).send(request, **kwargs)
 
-        if self.message_log.isEnabledFor(logging.DEBUG):
-            r = copy.deepcopy(response)
-            for filter in self.filters:
-                r = filter(r)
-
-            self.message_log.debug(
-                "HTTP {status} {url}\n{headers}\nBody:\n{body}".format(
-                    status=r.status_code,
-                    url=r.url,
-                    headers="\n".join(
-                        "{}: {}".format(k, v) for k, v in r.headers.items()
-                    ),
-                    body=_pformat(r.text),
+        if debug:
+            # Streamed responses have not been read yet and must not be
+            # consumed by logging.
+            content = getattr(response, "_content", None)
+            if not isinstance(content, (bytes, str)):
+                content = "<streamed content not captured>"
+
+            log.debug(
+                _HttpLogMessage(
+                    "HTTP %s %s" % (response.status_code, response.url),
+                    response,
+                    response.headers,
+                    content,
+                    self.filters,
+                    self.LOG_BODY_LIMIT,
                 )
             )
         else:
-            self.message_log.info("HTTP/1.1 %s %s", response.status_code, response.url)
+            log.info("HTTP/1.1 %s %s", response.status_code, response.url)
 
         return response
 
@@ -633,6 +2133,26 @@ class Session(requests.Session):
         url = self._build_url(url)
         verify = verify or self.verify
 
+        # Token used to authorize this request.  Requests with an explicit
+        # `auth` (e.g. requests for a token) are not refreshed.
+        token = self.auth if auth is None else None
+        if not isinstance(token, OAuth2Token):
+            token = None
+
+        # Refresh the token shortly before it expires to avoid a request
+        # that fails with HTTP 401 and must be repeated.
+        if (
+            token is not None
+            and token.refresh_token
+            and token.expires_within(self.TOKEN_REFRESH_MARGIN)
+        ):
+            try:
+                token = self._refresh_token(token)
+            except (exceptions.AuthorizationError, requests.exceptions.HTTPError):
+                # Send the request anyway.  If the token really has expired
+                # it'll be handled like any other HTTP 401 response.
+                pass
+
         try:
             r = super(Session, self).request(
                 method,
@@ -657,11 +2177,14 @@ class Session(requests.Session):
                 auth_header = r.headers.get("WWW-Authenticate", "").lower()
 
                 # Access token expired, need to refresh it (if we can)
-                if "access token expired" in auth_header:
+                if "access token expired" in auth_header and token is not None:
                     try:
-                        self.auth = self._request_token_with_oauth(
-                            refresh_token=self.auth.refresh_token
-                        )
+                        self._refresh_token(token)
+
+                        # A streamed body has been consumed by the first
+                        # attempt and must be read again from the start.
+                        if isinstance(data, MultipartStream):
+                            data.rewind()
 
                         # Repeat the request
                         r = super(Session, self).request(
@@ -696,6 +2219,51 @@ class Session(requests.Session):
                 )
             raise e
 
+    def _refresh_token(self, token):
+        """Replace an expired access token with a new token.
+
+        If multiple threads attempt to refresh the same token simultaneously
+        only the first one will request a new token from the server.  The
+        remaining threads wait and then reuse the new token.
+
+        Parameters
+        ----------
+        token : OAuth2Token
+            The token that has expired.
+
+        Returns
+        -------
+        OAuth2Token
+            The new token.
+
+        Raises
+        ------
+        AuthorizationError
+            If the refresh token is incorrect, expired, or revoked.
+
+        """
+        start = time.perf_counter()
+        with self._auth_lock:
+            # Another thread already refreshed the token while we were waiting
+            if self.auth is not token:
+                return self.auth
+
+            self.auth = self._request_token_with_oauth(
+                refresh_token=token.refresh_token
+            )
+
+        if self.listeners:
+            _notify(
+                self,
+                MetricsEvent(
+                    "token",
+                    "POST /SASLogon/oauth/token",
+                    time.perf_counter() - start,
+                    status=200,
+                ),
+            )
+        return self.auth
+
     def get(self, url, **kwargs):
         return self.request("GET", url, **kwargs)
 
@@ -1090,6 +2658,8 @@ class Session(requests.Session):
                     f"read/write permissions (equivalent to 600 on Linux systems)."
                 )
 
+            import yaml
+
             with open(yaml_file) as f:
                 return yaml.safe_load(f)
 
@@ -1423,45 +2993,232 @@ class Session(requests.Session):
         if not os.path.exists(sas_dir):
             os.mkdir(sas_dir)
 
-        with open(yaml_file, "w") as f:
-            yaml.dump(profiles, f)
+        import yaml
+
+        with open(yaml_file, "w") as f:
+            yaml.dump(profiles, f)
+
+        # Get bit flags indicating access permissions
+        mode = os.stat(yaml_file).st_mode
+        flags = oct(mode)[-3:]
+
+        # Ensure access to file is restricted
+        if flags != "600":
+            os.chmod(yaml_file, 0o600)
+
+    def __enter__(self):
+        super(Session, self).__enter__()
+
+        # Make this the current session
+        # self._old_session = current_session()
+        # current_session(self)
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # Restore previous current session
+        current_session(self._old_session)
+
+        super(Session, self).__exit__()
+
+    def __str__(self):
+        return (
+            "{class_}(hostname='{hostname}', username='{username}', "
+            "protocol='{protocol}', verify_ssl={verify})".format(
+                class_=type(self).__name__,
+                hostname=self.hostname,
+                username=self.username,
+                protocol=self._settings.get("protocol"),
+                verify=self.verify,
+            )
+        )
+
+
+class AsyncSession:
+    """Asynchronous connection to a SAS Viya server.
+
+    Sends requests using an `httpx.AsyncClient` while sharing hostname, SSL
+    settings and authorization (including token refresh) with an existing
+    :class:`Session`.  A single instance can have many requests in flight
+    concurrently on one event loop.
+
+    Parameters
+    ----------
+    session : Session, optional
+        The `Session` whose settings and credentials should be used.  Defaults
+        to `current_session()`.
+    max_connections : int, optional
+        Maximum number of concurrent connections to the server.  Defaults to
+        100.
+    kwargs : any
+        Additional arguments passed to the `httpx.AsyncClient` constructor.
+
+    Raises
+    ------
+    RuntimeError
+        If the `httpx` package is not installed.
+
+    Examples
+    --------
+    >>> async with AsyncSession(Session('example.com', 'user', 'password')) as s:
+    ...     r = await mas.execute_module_step_async('module', 'score', session=s, x=1)
+
+    """
+
+    def __init__(self, session=None, max_connections=100, **kwargs):
+        try:
+            import httpx
+        except ImportError:
+            raise RuntimeError(
+                "The 'httpx' package must be installed to use an AsyncSession.  "
+                "Run 'pip install sasctl[async]' to install."
+            )
+
+        self._session = session or current_session()
+
+        if self._session is None:
+            raise TypeError("No `Session` instance found.")
+
+        # requests uses REQUESTS_CA_BUNDLE automatically so mimic that behavior
+        verify = self._session.verify
+        if verify and "REQUESTS_CA_BUNDLE" in os.environ:
+            verify = os.environ["REQUESTS_CA_BUNDLE"] or verify
+
+        kwargs.setdefault("verify", verify)
+        kwargs.setdefault(
+            "limits",
+            httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        kwargs.setdefault("timeout", None)
+        self._client = httpx.AsyncClient(**kwargs)
+
+    @property
+    def session(self):
+        """Session: the synchronous session providing settings & credentials."""
+        return self._session
+
+    @property
+    def message_log(self):
+        return self._session.message_log
+
+    async def request(
+        self,
+        method,
+        url,
+        params=None,
+        data=None,
+        headers=None,
+        files=None,
+        json=None,
+        **kwargs,
+    ):
+        url = self._session._build_url(url)
+        if json is not None and data is None and files is None:
+            data, headers = _encode_json(self._session.json_codec, json, headers)
+            json = None
+        headers = dict(headers or {})
+        kwargs.update(params=params, files=files, json=json)
+
+        # httpx expects raw bytes/str bodies to be passed as `content`
+        if isinstance(data, (bytes, str)):
+            kwargs["content"] = data
+        else:
+            kwargs["data"] = data
+
+        import asyncio
+
+        # Returns the running loop; get_running_loop() requires Python 3.7
+        loop = asyncio.get_event_loop()
+        auth = self._session.auth
+        if isinstance(auth, OAuth2Token):
+            # Refresh the token shortly before it expires.  Token requests use
+            # the synchronous session so they're run in a thread.
+            if auth.refresh_token and auth.expires_within(
+                self._session.TOKEN_REFRESH_MARGIN
+            ):
+                try:
+                    auth = await loop.run_in_executor(
+                        None, self._session._refresh_token, auth
+                    )
+                except (exceptions.AuthorizationError, requests.exceptions.HTTPError):
+                    pass
+            headers["Authorization"] = "Bearer " + auth.access_token
+
+        self.message_log.info("HTTP/1.1 %s %s", method.upper(), url)
+        r = await self._client.request(method, url, headers=headers, **kwargs)
+        self.message_log.info("HTTP/1.1 %s %s", r.status_code, r.url)
+
+        if r.status_code == 401 and isinstance(auth, OAuth2Token):
+            auth_header = r.headers.get("WWW-Authenticate", "").lower()
+
+            # Access token expired, need to refresh it (if we can)
+            if "access token expired" in auth_header:
+                try:
+                    token = await loop.run_in_executor(
+                        None, self._session._refresh_token, auth
+                    )
+                    headers["Authorization"] = "Bearer " + token.access_token
+
+                    # Repeat the request
+                    r = await self._client.request(
+                        method, url, headers=headers, **kwargs
+                    )
+                except exceptions.AuthorizationError:
+                    pass
+
+        return r
+
+    async def get(self, url, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self.request("POST", url, **kwargs)
 
-        # Get bit flags indicating access permissions
-        mode = os.stat(yaml_file).st_mode
-        flags = oct(mode)[-3:]
+    async def put(self, url, **kwargs):
+        return await self.request("PUT", url, **kwargs)
 
-        # Ensure access to file is restricted
-        if flags != "600":
-            os.chmod(yaml_file, 0o600)
+    async def head(self, url, **kwargs):
+        return await self.request("HEAD", url, **kwargs)
 
-    def __enter__(self):
-        super(Session, self).__enter__()
+    async def delete(self, url, **kwargs):
+        return await self.request("DELETE", url, **kwargs)
 
-        # Make this the current session
-        # self._old_session = current_session()
-        # current_session(self)
+    async def close(self):
+        """Close all connections held by the session."""
+        await self._client.aclose()
 
+    async def __aenter__(self):
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        # Restore previous current session
-        current_session(self._old_session)
-
-        super(Session, self).__exit__()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
 
     def __str__(self):
-        return (
-            "{class_}(hostname='{hostname}', username='{username}', "
-            "protocol='{protocol}', verify_ssl={verify})".format(
-                class_=type(self).__name__,
-                hostname=self.hostname,
-                username=self.username,
-                protocol=self._settings.get("protocol"),
-                verify=self.verify,
-            )
+        return "{class_}(session={session})".format(
+            class_=type(self).__name__, session=self._session
         )
 
 
+# Worker threads shared by all PageIterator instances for prefetching pages.
+_PAGING_MAX_WORKERS = 16
+_paging_executor = None
+_paging_executor_lock = threading.Lock()
+
+
+def _get_paging_executor():
+    global _paging_executor
+
+    with _paging_executor_lock:
+        if _paging_executor is None:
+            _paging_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_PAGING_MAX_WORKERS, thread_name_prefix="sasctl-paging"
+            )
+        return _paging_executor
+
+
 class PageIterator:
     """Iterates through a collection that must be "paged" from the server.
 
@@ -1478,102 +3235,170 @@ class PageIterator:
         The `Session` instance to use for requesting additional items.  Defaults
         to current_session()
     threads : int
-        Number of threads allocated to downloading additional pages.
+        Maximum number of page requests to have in flight at once.
+    limit : int, optional
+        Number of items to request per page.  Larger pages require fewer round
+        trips while smaller pages return the first results sooner.  Defaults
+        to the page size used by the server.
 
     Yields
     ------
     List[RestObj]
         Items contained in the current page
 
+    Notes
+    -----
+    Pages are downloaded by a thread pool shared by all iterators.  If the
+    server reports the total number of items, no pages past that count are
+    requested.  Outstanding requests are cancelled by `close()`, which is
+    called automatically once the iterator is exhausted.  Call `close()` or
+    use the iterator in a `with` statement when stopping early.
+
     """
 
-    def __init__(self, obj, session=None, threads=4):
-        self._num_threads = threads
+    def __init__(self, obj, session=None, threads=4, limit=None):
+        self._num_threads = max(1, threads)
 
         # Session to use when requesting items
         self._session = session or current_session()
-        self._pool = None
-        self._requested = []
+
+        # Futures for pages that have been requested, in the order they'll be
+        # returned.
+        self._requested = collections.deque()
+        self._closed = False
 
         link = get_link(obj, "next")
 
         # Dissect the "next" link so it can be reformatted and used by
         # parallel threads
         if link is None:
-            self._min_queue_len = 0
             self._start = 0
             self._limit = 0
         else:
             link = link["href"]
             start = re.search(r"(?<=start=)[\d]+", link)
-            limit = re.search(r"(?<=limit=)[\d]+", link)
+            page_size = re.search(r"(?<=limit=)[\d]+", link)
 
             # Construct a new link with format params
             # Result is "/spam/spam?start={start}&limit={limit}"
             link = (
                 link[: start.start()]
                 + "{start}"
-                + link[start.end() : limit.start()]
+                + link[start.end() : page_size.start()]
                 + "{limit}"
-                + link[limit.end() :]
+                + link[page_size.end() :]
             )
 
             self._start = int(start.group())
-            self._limit = int(limit.group())
-
-            # Length at which to beging requesting new items from the server
-            self._min_queue_len = self._limit
+            self._limit = int(limit or page_size.group())
 
         self._next_link = link
 
+        # Total number of items reported by the server, if available.
+        self._count = int(obj["count"]) if "count" in obj else None
+
         # Store the current items to iterate over
         self._obj = obj
 
     def __next__(self):
-        if self._pool is None:
-            self._pool = concurrent.futures.ThreadPoolExecutor(
-                max_workers=self._num_threads
-            )
-
-        # Send request for new pages if we don't have enough cached
-        num_req_needed = self._num_threads - len(self._requested)
-        for _ in range(num_req_needed):
-            self._requested.append(self._pool.submit(self._request_async, self._start))
-            self._start += self._limit
-
         # If this is the first time next() has been called, return the items
         # contained in the initial page.
         if self._obj is not None:
-            result = [RestObj(x) for x in self._obj["items"]]
+            result = [_as_restobj(_compact_links(x)) for x in self._obj["items"]]
             self._obj = None
+            self._fill()
             return result
 
+        self._fill()
+
         # Make sure the next page has been received
         if self._requested:
-            items = self._requested.pop(0).result()
+            items = self._requested.popleft().result()
 
-            if not items:
-                raise StopIteration
-
-            return items
+            # Pages may be short if some items are inaccessible to the user,
+            # so only an empty page marks the end of the collection.
+            if items:
+                return items
 
+        self.close()
         raise StopIteration
 
     def __iter__(self):
         # All Iterators are also Iterables
         return self
 
-    def _request_async(self, start):
-        """Used by worker threads to retrieve next batch of items."""
+    def __enter__(self):
+        return self
 
-        if self._next_link is None:
-            return []
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        # Pending requests don't reference the iterator, so this also cancels
+        # them if the iterator is discarded without being closed.
+        self.close()
+
+    def close(self):
+        """Cancel any outstanding page requests.
+
+        Returns
+        -------
+        None
+
+        """
+        self._closed = True
+        requested = getattr(self, "_requested", ())
+        while requested:
+            requested.popleft().cancel()
+
+    def _fill(self):
+        """Keep up to `threads` page requests in flight."""
+        if self._closed or self._next_link is None:
+            return
+
+        pool = None
+        while len(self._requested) < self._num_threads:
+            # Don't request pages past the end of the collection.
+            if self._count is not None and self._start >= self._count:
+                break
+
+            pool = pool or _get_paging_executor()
+            link = self._next_link.format(start=self._start, limit=self._limit)
+
+            # Requests must not reference the iterator so that it can still be
+            # garbage collected while pages are pending.
+            self._requested.append(
+                pool.submit(self._request_page, link, self._session, self._start)
+            )
+            self._start += self._limit
 
-        # Format the link to retrieve desired batch
-        link = self._next_link.format(start=start, limit=self._limit)
-        r = get(link, format="json", session=self._session)
-        r = RestObj(r)
-        return [RestObj(x) for x in r["items"]]
+    @staticmethod
+    def _request_page(link, session, start):
+        """Used by worker threads to retrieve next batch of items."""
+        active = session or current_session()
+
+        if not getattr(active, "listeners", None):
+            r = get(link, format="json", session=session)
+            return [RestObj(_compact_links(x)) for x in r["items"]]
+
+        # Time the download and conversion of the page together since the
+        # conversion also occupies the worker thread.
+        begin = time.perf_counter()
+        r = get(link, format="json", session=session)
+        items = [RestObj(_compact_links(x)) for x in r["items"]]
+        _notify(
+            active,
+            MetricsEvent(
+                "page",
+                _endpoint_name("GET", link),
+                time.perf_counter() - begin,
+                status=200,
+                items=len(items),
+                start=start,
+                thread=threading.current_thread().name,
+            ),
+        )
+        return items
 
 
 class PagedItemIterator:
@@ -1592,6 +3417,9 @@ class PagedItemIterator:
         to current_session()
     threads : int
         Number of threads allocated to downloading additional items.
+    limit : int, optional
+        Number of items to request per page.  Defaults to the page size used by
+        the server.
 
     Yields
     ------
@@ -1608,12 +3436,12 @@ class PagedItemIterator:
 
     """
 
-    def __init__(self, obj, session=None, threads=4):
+    def __init__(self, obj, session=None, threads=4, limit=None):
         # Iterates over whole pages of items
-        self._pager = PageIterator(obj, session, threads)
+        self._pager = PageIterator(obj, session, threads, limit=limit)
 
         # Store items from latest page that haven't been returned yet.
-        self._cache = []
+        self._cache = collections.deque()
 
         # Total number of items to iterate over
         if "count" in obj:
@@ -1630,18 +3458,34 @@ class PagedItemIterator:
     def __next__(self):
         # Get next page of items if we're currently out
         if not self._cache:
-            self._cache = next(self._pager)
+            self._cache.extend(next(self._pager))
 
         # Return the next item
         if self._cache:
             self._count -= 1
-            return self._cache.pop(0)
+            return self._cache.popleft()
 
         raise StopIteration()
 
     def __iter__(self):
         return self
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Cancel any outstanding page requests.
+
+        Returns
+        -------
+        None
+
+        """
+        self._pager.close()
+
 
 class PagedListIterator:
     """Iterates over an instance of PagedList
@@ -1686,6 +3530,9 @@ class PagedList(list):
         to current_session()
     threads : int, optional
         Number of threads allocated to loading additional items.
+    limit : int, optional
+        Number of items to request per page.  Defaults to the page size used by
+        the server.
 
     Notes
     -----
@@ -1698,9 +3545,11 @@ class PagedList(list):
 
     """
 
-    def __init__(self, obj, session=None, threads=4):
+    def __init__(self, obj, session=None, threads=4, limit=None):
         super(PagedList, self).__init__()
-        self._paged_items = PagedItemIterator(obj, session=session, threads=threads)
+        self._paged_items = PagedItemIterator(
+            obj, session=session, threads=threads, limit=limit
+        )
 
         # Go ahead and add the items that were initially returned.
         # Do this by "paging" so iterator remains at the correct spot.
@@ -1721,6 +3570,25 @@ class PagedList(list):
     def __iter__(self):
         return PagedListIterator(self)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Cancel any outstanding page requests.
+
+        Items that have already been loaded remain available, but no further
+        items will be retrieved from the server.
+
+        Returns
+        -------
+        None
+
+        """
+        self._paged_items.close()
+
     def __getslice__(self, i, j):
         # Removed from Py3.x but still implemented in CPython built-in list
         # Override to ensure __getitem__ is used instead.
@@ -2038,22 +3906,381 @@ def request(verb, path, session=None, format="auto", **kwargs):
 
     response = session.request(verb, path, **kwargs)
 
+    return _format_response(response, format, getattr(session, "json_codec", None))
+
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Errors raised while reading a response body that can be recovered from by
+# requesting the rest of the content again.
+_RESUMABLE_ERRORS = (
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+
+class _DownloadState:
+    """Progress of a download that may be continued with ``Range`` requests."""
+
+    __slots__ = ("position", "etag")
+
+    def __init__(self, position=0, etag=None):
+        self.position = position
+        self.etag = etag
+
+
+# Yielded by `_iter_ranges` when content received earlier must be discarded.
+_RESTART = object()
+
+
+def _content_length(response):
+    """Total size of a resource as reported by the Content-Range header."""
+    total = response.headers.get("Content-Range", "").rpartition("/")[2]
+    return int(total) if total.isdigit() else None
+
+
+def _iter_ranges(path, session, chunk_size, state, retries, restart=False, **kwargs):
+    """Download a resource from `state.position`, continuing after errors.
+
+    Range requests are only honored if the resource still matches
+    `state.etag`.  Otherwise `_RESTART` is yielded and the content is sent
+    again from the beginning.  If neither the server nor `state` has an
+    ETag, the resource is assumed to be unchanged unless `restart` is set.
+
+    """
+    headers = dict(kwargs.pop("headers", None) or {})
+    failures = 0
+
+    while True:
+        headers.pop("Range", None)
+        headers.pop("If-Range", None)
+        if state.position:
+            headers["Range"] = "bytes=%d-" % state.position
+
+            # Weak validators can't be used with If-Range.
+            if state.etag and not state.etag.startswith("W/"):
+                headers["If-Range"] = state.etag
+
+        response = session.request("get", path, headers=headers, stream=True, **kwargs)
+        try:
+            skip = 0
+            if response.status_code == 416 and state.position:
+                # Requested range starts at the end of the content, unless
+                # the content received so far is longer than the resource.
+                if _content_length(response) == state.position:
+                    return
+                state.position, state.etag = 0, None
+                yield _RESTART
+                continue
+
+            _format_response(response, "response")
+            etag = response.headers.get("ETag")
+
+            # Server is sending everything, either because it ignored the
+            # Range header or because the resource changed.
+            if response.status_code != 206 and state.position:
+                unvalidated = etag is None and state.etag is None
+                if (etag is not None and etag == state.etag) or (
+                    unvalidated and not restart
+                ):
+                    skip = state.position
+                else:
+                    state.position = 0
+                    yield _RESTART
+
+            if state.etag is None or response.status_code != 206:
+                state.etag = etag
+
+            for chunk in response.iter_content(chunk_size):
+                if skip:
+                    if len(chunk) <= skip:
+                        skip -= len(chunk)
+                        continue
+                    chunk, skip = chunk[skip:], 0
+                state.position += len(chunk)
+                yield chunk
+            return
+        except _RESUMABLE_ERRORS as e:
+            failures += 1
+            if failures > retries:
+                raise
+            logger.warning(
+                "Download of %s interrupted after %d bytes (%s).  Resuming.",
+                path,
+                state.position,
+                e,
+            )
+        finally:
+            response.close()
+
+
+def iter_content(
+    path, session=None, chunk_size=None, start=0, retries=3, etag=None, **kwargs
+):
+    """Download a resource in chunks without holding it in memory.
+
+    Parameters
+    ----------
+    path : str
+        Path portion of URL to request.
+    session : Session, optional
+        Defaults to `current_session()`.
+    chunk_size : int, optional
+        Maximum number of bytes to yield at a time.  Defaults to
+        `DOWNLOAD_CHUNK_SIZE`.
+    start : int, optional
+        Offset of the first byte to download.  Requested with a ``Range``
+        header, and skipped locally if the server ignores the header.
+    retries : int, optional
+        Number of times to continue with a ``Range`` request from the last
+        byte received if the connection fails during the download.  Defaults
+        to 3.
+    etag : str, optional
+        ETag of the resource when the content before `start` was received.
+        Sent in an ``If-Range`` header so that the rest of the content is only
+        sent if the resource hasn't changed.
+    kwargs : any
+        Additional arguments are passed to the session `request` method.
+
+    Yields
+    ------
+    bytes
+
+    Raises
+    ------
+    HTTPError
+        If the server responds with a 4xx or 5xx status code.
+    ContentChangedError
+        If the resource changed after some of its content was received.
+
+    """
+    session = session or current_session()
+
+    if session is None:
+        raise TypeError("No `Session` instance found.")
+
+    state = _DownloadState(start, etag)
+    for chunk in _iter_ranges(
+        path, session, chunk_size or DOWNLOAD_CHUNK_SIZE, state, retries, **kwargs
+    ):
+        if chunk is _RESTART:
+            raise exceptions.ContentChangedError(path)
+        yield chunk
+
+
+def download(
+    path,
+    dest,
+    session=None,
+    chunk_size=None,
+    resume=False,
+    checksum=None,
+    **kwargs,
+):
+    """Download a resource to a file without holding it in memory.
+
+    Parameters
+    ----------
+    path : str
+        Path portion of URL to request.
+    dest : str, Path, or file_like
+        File path or writable binary file-like object.  Content for a path
+        is written to ``<dest>.part`` which is renamed once the download is
+        complete.
+    session : Session, optional
+        Defaults to `current_session()`.
+    chunk_size : int, optional
+        Number of bytes to write at a time.  Defaults to
+        `DOWNLOAD_CHUNK_SIZE`.
+    resume : bool, optional
+        Continue an earlier, interrupted download to the same path from the
+        end of its ``.part`` file using a ``Range`` request.  The download
+        starts over if the resource has changed since.  Defaults to False.
+    checksum : str, optional
+        Expected digest of the content formatted as
+        ``"<algorithm>:<hex digest>"`` where algorithm is any algorithm
+        supported by `hashlib`.  For example, ``"sha256:9f86d081..."``.
+    kwargs : any
+        Additional arguments are passed to :func:`iter_content`.
+
+    Returns
+    -------
+    str or file_like
+        The path to the downloaded file, or `dest` if it's a file-like
+        object.
+
+    Raises
+    ------
+    HTTPError
+        If the server responds with a 4xx or 5xx status code.
+    ChecksumMismatchError
+        If the content doesn't match `checksum`.  A partially downloaded
+        file is removed so it isn't resumed.
+
+    """
+    algorithm = expected = None
+    if checksum is not None:
+        algorithm, _, expected = checksum.partition(":")
+        if not expected:
+            raise ValueError(
+                "`checksum` must be formatted as '<algorithm>:<hex digest>'."
+            )
+        hashlib.new(algorithm)
+
+    def verify(digest, partial=None):
+        if digest is None or digest.hexdigest() == expected.lower():
+            return
+        if partial is not None:
+            for file in (partial, partial + ".etag"):
+                if os.path.exists(file):
+                    os.remove(file)
+        raise exceptions.ChecksumMismatchError(
+            path, "%s:%s" % (algorithm, expected), digest.hexdigest()
+        )
+
+    digest = hashlib.new(algorithm) if algorithm else None
+
+    if hasattr(dest, "write"):
+        for chunk in iter_content(
+            path, session=session, chunk_size=chunk_size, **kwargs
+        ):
+            dest.write(chunk)
+            if digest is not None:
+                digest.update(chunk)
+        verify(digest)
+        return dest
+
+    session = session or current_session()
+
+    if session is None:
+        raise TypeError("No `Session` instance found.")
+
+    dest = os.fspath(dest)
+    partial = dest + ".part"
+
+    # The ETag of the partial content is kept alongside it so that resuming
+    # can tell whether the resource changed in the meantime.
+    etag_file = partial + ".etag"
+    state = _DownloadState()
+
+    if resume and os.path.exists(partial):
+        state.position = os.path.getsize(partial)
+        if os.path.exists(etag_file):
+            with open(etag_file) as f:
+                state.etag = f.read().strip() or None
+        if digest is not None:
+            with open(partial, "rb") as f:
+                for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+
+    saved_etag = state.etag
+    chunks = _iter_ranges(
+        path,
+        session,
+        chunk_size or DOWNLOAD_CHUNK_SIZE,
+        state,
+        kwargs.pop("retries", 3),
+        restart=True,
+        **kwargs,
+    )
+
+    with open(partial, "ab" if state.position else "wb") as f:
+        for chunk in chunks:
+            if chunk is _RESTART:
+                f.seek(0)
+                f.truncate()
+                digest = hashlib.new(algorithm) if algorithm else None
+                continue
+
+            if state.etag != saved_etag:
+                saved_etag = state.etag
+                if saved_etag:
+                    with open(etag_file, "w") as e:
+                        e.write(saved_etag)
+                elif os.path.exists(etag_file):
+                    os.remove(etag_file)
+
+            f.write(chunk)
+            if digest is not None:
+                digest.update(chunk)
+
+    verify(digest, partial)
+    os.replace(partial, dest)
+    if os.path.exists(etag_file):
+        os.remove(etag_file)
+    return dest
+
+
+def _encode_json(codec, obj, headers=None):
+    """Encode a JSON request body and set the Content-Type header if needed."""
+    headers = dict(headers or {})
+    if not any(k.lower() == "content-type" for k in headers):
+        headers["Content-Type"] = "application/json"
+    return codec.dumps(obj), headers
+
+
+def _decode_json(response, codec=None, object_pairs_hook=None):
+    """Decode a JSON response body using `codec` if provided."""
+    content = response.content
+    if not isinstance(codec, JSONCodec) or not isinstance(content, (bytes, str)):
+        return response.json(object_pairs_hook=object_pairs_hook)
+
+    # JSON is UTF-8 unless the server says otherwise.  Let the response decode
+    # any other declared charset, as `response.json()` would.
+    match = re.search(
+        r"charset=[\"']?([\w.:-]+)", response.headers.get("Content-Type", ""), re.I
+    )
+    if match and isinstance(content, bytes):
+        try:
+            if codecs.lookup(match.group(1)).name != "utf-8":
+                content = response.text
+        except LookupError:
+            pass
+    return codec.loads(content, object_pairs_hook=object_pairs_hook)
+
+
+def _format_response(response, format="auto", codec=None):
+    """Convert a response to the requested format.
+
+    Parameters
+    ----------
+    response : requests.Response or httpx.Response
+    format : {'auto', 'rest', 'response', 'content', 'json', 'text'}
+        See :func:`request`.
+    codec : JSONCodec, optional
+        Used to decode JSON responses.  Defaults to `response.json()`.
+
+    Returns
+    -------
+    any
+
+    Raises
+    ------
+    HTTPError
+        If the response has a 4xx or 5xx status code.
+
+    """
     if 400 <= response.status_code <= 599:
         raise HTTPError(
-            response.url, response.status_code, response.text, response.headers, None
+            str(response.url),
+            response.status_code,
+            response.text,
+            response.headers,
+            None,
         )
 
     # Return the raw response if requested
     if format == "response":
         return response
     if format == "json":
-        return response.json()
+        return _decode_json(response, codec)
     if format == "text":
         return response.text
     if format == "content":
         return response.content
     try:
-        obj = _unwrap(response.json())
+        obj = _unwrap(_decode_json(response, codec, object_pairs_hook=RestObj))
 
         # ETag is required to update any object
         # May not be returned on all responses (e.g. listing
@@ -2084,6 +4311,9 @@ def get_link(obj, rel):
         if isinstance(obj["links"], dict):
             return obj["links"].get(rel)
 
+        if isinstance(obj, RestObj) and isinstance(obj["links"], list):
+            return obj._get_links(rel)
+
         links = [l for l in obj.get("links", []) if l.get("rel") == rel]
         if not links:
             return None
@@ -2118,6 +4348,109 @@ def request_link(obj, rel, **kwargs):
     return request(link["method"], link["href"], **kwargs)
 
 
+async def request_async(verb, path, session=None, format="auto", **kwargs):
+    """Send an HTTP request asynchronously.
+
+    Parameters
+    ----------
+    verb : str
+        A valid HTTP request verb.
+    path : str
+        Path portion of URL to request.
+    session : AsyncSession or Session, optional
+        Defaults to an `AsyncSession` using `current_session()`.
+    format : {'auto', 'rest', 'response', 'content', 'json', 'text'}
+        The format of the return response.  See :func:`request`.
+    kwargs : any
+        Additional arguments are passed to the session `request` method.
+
+    Returns
+    -------
+
+    """
+    session = await _get_async_session(session)
+
+    format = "auto" if format is None else str(format).lower()
+    if format not in ("auto", "response", "content", "text", "json", "rest"):
+        raise ValueError
+
+    response = await session.request(verb, path, **kwargs)
+
+    return _format_response(response, format, session.session.json_codec)
+
+
+async def request_link_async(obj, rel, **kwargs):
+    """Request a link from a resource asynchronously.
+
+    Parameters
+    ----------
+    obj : dict
+    rel : str
+    kwargs : any
+        Passed to :function:`request_async`
+
+    Returns
+    -------
+
+    """
+    link = get_link(obj, rel)
+
+    if link is None:
+        raise ValueError("Link '%s' not found in object %s." % (rel, obj))
+
+    return await request_async(link["method"], link["href"], **kwargs)
+
+
+async def _get_async_session(session=None):
+    """Get an `AsyncSession` that shares settings with `session`.
+
+    An `AsyncSession` is only valid on the event loop that created it, so one
+    is cached for each `Session` and running event loop.  It is closed when
+    the loop shuts down its asynchronous generators, which `asyncio.run()`
+    does before closing the loop.
+
+    Parameters
+    ----------
+    session : AsyncSession or Session, optional
+        Defaults to `current_session()`.
+
+    Returns
+    -------
+    AsyncSession
+
+    """
+    import asyncio
+
+    if isinstance(session, AsyncSession):
+        return session
+
+    session = session or current_session()
+
+    if session is None:
+        raise TypeError("No `Session` instance found.")
+
+    # Returns the running loop; get_running_loop() requires Python 3.7
+    loop = asyncio.get_event_loop()
+    sessions = session.__dict__.setdefault(
+        "_async_sessions", weakref.WeakKeyDictionary()
+    )
+    async_session = sessions.get(loop)
+    if async_session is None:
+        async_session = sessions[loop] = AsyncSession(session)
+
+        # The loop finalizes this generator (and closes the client) on shutdown
+        async_session._closer = _close_on_shutdown(async_session)
+        await async_session._closer.__anext__()
+    return async_session
+
+
+async def _close_on_shutdown(async_session):
+    try:
+        yield
+    finally:
+        await async_session.close()
+
+
 def uri_as_str(obj):
     """Get the URI of a resource in string format.
 
@@ -2156,12 +4489,18 @@ def _unwrap(json):
     """
     if "items" in json:
         if len(json["items"]) == 1:
-            return RestObj(json["items"][0])
+            return _as_restobj(json["items"][0])
         if len(json["items"]) > 1:
-            return PagedList(RestObj(json))
+            return PagedList(_as_restobj(json))
         return []
 
-    return RestObj(json)
+    return _as_restobj(json)
+
+
+def _as_restobj(obj):
+    # Responses are usually decoded directly into RestObj instances, so only
+    # copy objects that were decoded as plain dicts.
+    return obj if isinstance(obj, RestObj) else RestObj(obj)
 
 
 def _build_crud_funcs(path, single_term=None, plural_term=None, service_name=None):
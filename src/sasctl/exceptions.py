@@ -26,6 +26,93 @@ class JobTimeoutError(RuntimeError):
     pass
 
 
+class ChecksumMismatchError(ValueError):
+    """Downloaded content doesn't match its expected checksum.
+
+    Attributes
+    ----------
+    path : str
+        The resource that was downloaded.
+    expected : str
+        The expected checksum, formatted as ``"<algorithm>:<hex digest>"``.
+    actual : str
+        Hex digest of the content that was received.
+
+    """
+
+    def __init__(self, path, expected, actual):
+        self.path = path
+        self.expected = expected
+        self.actual = actual
+        super(ChecksumMismatchError, self).__init__(
+            "Checksum of %s was %s but expected %s." % (path, actual, expected)
+        )
+
+
+class ContentChangedError(RuntimeError):
+    """Resource changed while its content was being downloaded.
+
+    Attributes
+    ----------
+    path : str
+        The resource that was downloaded.
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        super(ContentChangedError, self).__init__(
+            "%s changed after part of its content was received." % path
+        )
+
+
+class ContentUploadError(RuntimeError):
+    """One or more files could not be uploaded.
+
+    Attributes
+    ----------
+    results : list
+        One entry per file in the order given: the content that was created,
+        or the exception that prevented the file from being uploaded.
+    rolled_back : list of str
+        Names of the files that were uploaded but then deleted again.
+
+    """
+
+    def __init__(self, results, rolled_back=None):
+        self.results = results
+        self.rolled_back = rolled_back or []
+        failed = [r for r in results if isinstance(r, BaseException)]
+        msg = "%d of %d files could not be uploaded: %s" % (
+            len(failed),
+            len(results),
+            failed[0] if failed else "",
+        )
+        super(ContentUploadError, self).__init__(msg)
+
+
+class DeleteError(RuntimeError):
+    """One or more items could not be deleted.
+
+    Attributes
+    ----------
+    results : list
+        One entry per item in the order given: the server's response (usually
+        None) or the exception that prevented the item from being deleted.
+
+    """
+
+    def __init__(self, results):
+        self.results = results
+        failed = [r for r in results if isinstance(r, BaseException)]
+        msg = "%d of %d items could not be deleted: %s" % (
+            len(failed),
+            len(results),
+            failed[0] if failed else "",
+        )
+        super(DeleteError, self).__init__(msg)
+
+
 class ServiceUnavailableError(RuntimeError):
     """A required SAS service is unavailable.
 
@@ -83,36 +83,13 @@ def get_zipped_model(
         model = mr.list_models(
             filter=f"and(eq(projectName,'{project.name}'),eq(name,'{model}'))"
         )[0]
-    params = {"format": "zip"}
-    model_zip = mr.get(f"models/{model.id}", params=params, format_="content")
     model_name = model.name
     project_name = model.projectName
 
-    # Check to see if project folder exists
-    if (Path(git_path) / project_name).exists():
-        # Check to see if model folder exists
-        if (Path(git_path) / project_name / model_name).exists():
-            with open(
-                Path(git_path) / project_name / model_name / (model_name + ".zip"), "wb"
-            ) as zip_file:
-                zip_file.write(model_zip)
-        else:
-            new_dir = Path(git_path) / project_name / model_name
-            new_dir.mkdir(parents=True, exist_ok=True)
-            with open(
-                Path(git_path) / project_name / model_name / (model_name + ".zip"), "wb"
-            ) as zip_file:
-                zip_file.write(model_zip)
-    else:
-        new_dir = Path(git_path) / project_name
-        new_dir.mkdir(parents=True, exist_ok=True)
-        new_dir = Path(git_path) / project_name / model_name
-        new_dir.mkdir(parents=True, exist_ok=True)
-        with open(
-            Path(git_path) / f"{project_name}/{model_name}/{model_name}.zip",
-            "wb",
-        ) as zip_file:
-            zip_file.write(model_zip)
+    # Create the project and model folders if needed and stream the zip to disk
+    model_dir = Path(git_path) / project_name / model_name
+    model_dir.mkdir(parents=True, exist_ok=True)
+    mr.export_model_to_zip(model, model_dir / (model_name + ".zip"), resume=False)
 
     return model_name, project_name
 
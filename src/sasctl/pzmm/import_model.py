@@ -166,15 +166,14 @@ def model_exists(
                 f"models with the same name."
             )
     elif isinstance(project_models, PagedList):
-        for model in project_models:
-            if model["name"] == name and force:
-                mr.delete_model(model.id)
-            elif model["name"] == name and not force:
-                raise ValueError(
-                    f"A model with the same model name exists in project "
-                    f"{project.name}. Include the force=True argument to overwrite "
-                    f"models with the same name."
-                )
+        matches = [model for model in project_models if model["name"] == name]
+        if matches and not force:
+            raise ValueError(
+                f"A model with the same model name exists in project "
+                f"{project.name}. Include the force=True argument to overwrite "
+                f"models with the same name."
+            )
+        mr.delete_models([model.id for model in matches])
 
 
 class ImportModel:
@@ -36,6 +36,10 @@ class ScoreCode:
         score_cas: Optional[bool] = True,
         score_code_path: Union[Path, str, None] = None,
         target_index: Optional[int] = None,
+        array_input: bool = False,
+        batch_function: bool = False,
+        lazy_load: bool = False,
+        mmap_mode: Optional[str] = None,
         **kwargs,
     ) -> Union[dict, None]:
         """
@@ -135,6 +139,30 @@ class ScoreCode:
             index should match the index of the target outcome in target_values. If target_values
             are not given, this index should indicate whether the the target probability variable
             is the first or second variable returned by the model. The default value is 1.
+        array_input : bool, optional
+            Sets whether single rows are passed to the model as a NumPy array instead
+            of a pandas DataFrame, which is much faster for SAS Micro Analytic Service
+            scoring. Imputation values are written to the score code as constants. Only
+            use with models that accept NumPy arrays. scikit-learn models trained on a
+            DataFrame warn once that "X does not have valid feature names", which is
+            expected and harmless. Ignored for H2O.ai, statsmodels, and TensorFlow
+            models, which always receive a DataFrame. The default value is False.
+        batch_function : bool, optional
+            Sets whether a `score_batch` function is written alongside the score
+            function. It accepts a DataFrame (or an iterable of DataFrames, such as
+            the chunks from `pandas.read_csv(..., chunksize=n)`) and scores all of its
+            rows with a single call to the model, computing the output metrics with
+            NumPy. The default value is False.
+        lazy_load : bool, optional
+            Sets whether SAS Viya 4 score code loads the model the first time it scores
+            instead of when the score code is imported. Loading is thread-safe, and the
+            load time is logged and stored in `model_load_seconds`. Ignored for SAS
+            Viya 3.5 and binary string models. The default value is False.
+        mmap_mode : str, optional
+            Memory map mode, such as "r", passed to `joblib.load()` when loading a SAS
+            Viya 4 model. NumPy arrays in the model are read from the model file on
+            demand and shared between the processes that load it. Requires a
+            pickle_type of "joblib". The default value is None.
         kwargs
             Other keyword arguments are passed to one of the following functions:
             * sasctl.pzmm.ScoreCode._write_imports(pickle_type, mojo_model=None,
@@ -148,6 +176,12 @@ class ScoreCode:
             * sasctl.pzmm.ScoreCode._predictions_to_metrics(output_variables,
               target_values=None, predict_threshold=None, h2o_model=None)
         """
+        if mmap_mode and pickle_type != "joblib":
+            raise ValueError(
+                "Memory mapped model loading requires a model serialized with joblib. "
+                "Set the pickle_type argument to 'joblib' or remove mmap_mode."
+            )
+
         # Extract the variable names and types from the input data
         input_var_list, input_dtypes_list = cls._input_var_lists(input_data)
 
@@ -172,6 +206,9 @@ class ScoreCode:
                 " specified in order to generate the score code."
             )
 
+        # Only SAS Viya 4 models loaded from a file can be loaded on first use
+        lazy_load = lazy_load and not (model_id or binary_string)
+
         # Add the core imports to the score code with the specified model serializer
         cls._write_imports(
             pickle_type,
@@ -179,6 +216,7 @@ class ScoreCode:
             binary_h2o_model="binary_h2o_model" in kwargs,
             tf_model="tf_keras_model" in kwargs or "tf_core_model" in kwargs,
             binary_string=binary_string,
+            lazy_load=lazy_load,
         )
 
         # Generate model loading code for SAS Viya 3.5 models without binary strings
@@ -199,12 +237,36 @@ class ScoreCode:
                 binary_h2o_model="binary_h2o_model" in kwargs,
                 tf_keras_model="tf_keras_model" in kwargs,
                 tf_core_model="tf_core_model" in kwargs,
+                lazy_load=lazy_load,
+                mmap_mode=mmap_mode,
             )
         else:
             model_load = None
 
         model_prefix = cls._check_valid_model_prefix(model_prefix)
 
+        # Models that need a DataFrame (or H2OFrame) can't use an array of inputs
+        array_input = array_input and not any(
+            x in kwargs
+            for x in [
+                "mojo_model",
+                "binary_h2o_model",
+                "statsmodels_model",
+                "tf_keras_model",
+                "tf_core_model",
+            ]
+        )
+        if array_input:
+            cls._write_row_constants(
+                input_var_list,
+                input_dtypes_list,
+                (
+                    cls._impute_values(input_data, missing_values)
+                    if missing_values
+                    else None
+                ),
+            )
+
         # Define the score function using the variables found in input_data
         cls.score_code += f"def score({', '.join(input_var_list)}):\n"
         """
@@ -225,7 +287,9 @@ def score(var1, var2, var3, var4):
         """
 
         # Run a try/except block to catch errors for model loading (skip binary string)
-        if model_load:
+        if lazy_load:
+            cls.score_code += f"{'':4}load_model()\n\n"
+        elif model_load:
             cls.score_code += (
                 f"{'':4}try:\n{'':8}global model\n{'':4}"
                 f"except NameError:\n{model_load}\n"
@@ -261,6 +325,7 @@ def score(var1, var2, var3, var4):
                 missing_values=missing_values,
                 statsmodels_model="statsmodels_model" in kwargs,
                 tf_model="tf_keras_model" in kwargs or "tf_core_model" in kwargs,
+                array_input=array_input,
             )
             # Include check for numpy values and a conversion operation as needed
             cls.score_code += (
@@ -285,6 +350,26 @@ def score(var1, var2, var3, var4):
                 target_index=target_index,
             )
 
+        if batch_function:
+            h2o_model = any(x in ["mojo_model", "binary_h2o_model"] for x in kwargs)
+            statsmodels_model = "statsmodels_model" in kwargs
+            cls._score_batch(
+                predict_method[0],
+                # _predict_method prepends the statsmodels constant to the variables
+                input_var_list[1:] if statsmodels_model else input_var_list,
+                score_metrics,
+                predict_method[1],
+                target_values=target_values,
+                predict_threshold=predict_threshold,
+                target_index=target_index,
+                dtype_list=input_dtypes_list,
+                missing_values=missing_values,
+                h2o_model=h2o_model,
+                statsmodels_model=statsmodels_model,
+                tf_model="tf_keras_model" in kwargs or "tf_core_model" in kwargs,
+                lazy_load=lazy_load,
+            )
+
         if missing_values:
             cls._impute_missing_values(input_data, missing_values)
 
@@ -406,6 +491,7 @@ def score(var1, var2, var3, var4):
         binary_h2o_model: Optional[bool] = False,
         tf_model: Optional[bool] = False,
         binary_string: Optional[str] = None,
+        lazy_load: Optional[bool] = False,
     ) -> None:
         """
         Write the import section of the Python score code.
@@ -430,11 +516,16 @@ def score(var1, var2, var3, var4):
         binary_string : str, optional
             A binary representation of the Python model object. The default value is
             None.
+        lazy_load : bool, optional
+            Flag to indicate that the model is loaded on first use, which requires the
+            logging, threading, and time modules. The default value is False.
         """
         pickle_type = pickle_type if pickle_type else "pickle"
+        cls.score_code += f"import math\nimport {pickle_type}\n"
+        if lazy_load:
+            cls.score_code += "import logging\nimport threading\nimport time\n"
         cls.score_code += (
-            f"import math\nimport {pickle_type}\nimport pandas as pd\n"
-            "import numpy as np\nfrom pathlib import Path\n\n"
+            "import pandas as pd\nimport numpy as np\nfrom pathlib import Path\n\n"
         )
         """
 import math
@@ -579,11 +670,18 @@ with open(model_path / "model.pickle", "rb") as pickle_model:
         binary_h2o_model: Optional[bool] = False,
         tf_keras_model: Optional[bool] = False,
         tf_core_model: Optional[bool] = False,
-    ) -> str:
+        lazy_load: Optional[bool] = False,
+        mmap_mode: Optional[str] = None,
+    ) -> Union[str, None]:
         """
         Write the model load section of the score code assuming the model is being
         uploaded to SAS Viya 4.
 
+        By default, the model is loaded when the score code is imported. If lazy_load
+        is set, a `load_model()` function is written instead, which loads the model
+        the first time it is called and records the time taken in
+        `model_load_seconds`.
+
         Parameters
         ----------
         model_file_name : string
@@ -603,9 +701,34 @@ with open(model_path / "model.pickle", "rb") as pickle_model:
         tf_core_model : boolean, optional
             Flag to indicate that the model is a tensorflow core model. The default
             value is False.
+        lazy_load : boolean, optional
+            Flag to indicate that the model should be loaded on first use by a
+            thread-safe `load_model()` function. The default value is False.
+        mmap_mode : string, optional
+            Memory map mode passed to `joblib.load()` for models serialized with joblib,
+            such as "r". NumPy arrays in the model are then read from the model file as
+            needed and their pages are shared by every process that loads the model.
+            The default value is None.
+
+        Returns
+        -------
+        str or None
+            Preformatted string for the next section of score code, or None if
+            lazy_load is set.
         """
         pickle_type = pickle_type if pickle_type else "pickle"
 
+        if lazy_load:
+            cls._lazy_model_load(
+                model_file_name,
+                pickle_type=pickle_type,
+                mojo_model=mojo_model,
+                binary_h2o_model=binary_h2o_model,
+                tf_keras_model=tf_keras_model,
+                mmap_mode=mmap_mode,
+            )
+            return None
+
         if mojo_model:
             cls.score_code += (
                 f"model = h2o.import_mojo(str(Path(settings.pickle_path"
@@ -647,6 +770,19 @@ model = tf.keras.models.load_model(Path(settings.pickle_path) / "model.h5", safe
                 f"/ \"{str(Path(model_file_name).with_suffix('.h5'))}\", "
                 f"safe_mode=True)\n"
             )
+        elif mmap_mode:
+            cls.score_code += (
+                f"model = joblib.load(Path(settings.pickle_path) / "
+                f'"{model_file_name}", mmap_mode="{mmap_mode}")\n\n'
+            )
+            """
+model = joblib.load(Path(settings.pickle_path) / "model.pickle", mmap_mode="r")
+
+            """
+            return (
+                f"{'':8}model = joblib.load(Path(settings.pickle_path) / "
+                f'"{model_file_name}", mmap_mode="{mmap_mode}")\n\n'
+            )
         else:
             cls.score_code += (
                 f"with open(Path(settings.pickle_path) / "
@@ -664,6 +800,104 @@ with open(Path(settings.pickle_path) / "model.pickle", "rb") as pickle_model:
                 f"{'':12}model = {pickle_type}.load(pickle_model)\n\n"
             )
 
+    @classmethod
+    def _lazy_model_load(
+        cls,
+        model_file_name: str,
+        pickle_type: Optional[str] = None,
+        mojo_model: Optional[bool] = False,
+        binary_h2o_model: Optional[bool] = False,
+        tf_keras_model: Optional[bool] = False,
+        mmap_mode: Optional[str] = None,
+    ) -> None:
+        """
+        Write a `load_model()` function that loads a SAS Viya 4 model on first use.
+
+        Importing the score code no longer deserializes the model, so health checks
+        and processes that never score stay cheap. Concurrent callers wait on a lock
+        for a single load. The load time is stored in `model_load_seconds` and logged,
+        so that it can be measured separately from scoring.
+
+        Parameters
+        ----------
+        model_file_name : string
+            Name of the model file that contains the model.
+        pickle_type : string, optional
+            Indicator for the package used to serialize the model file to be uploaded to
+            SAS Model Manager. The default value is `pickle`.
+        mojo_model : boolean, optional
+            Flag to indicate that the model is a H2O.ai MOJO model. The default value is
+            None.
+        binary_h2o_model : boolean, optional
+            Flag to indicate that the model is a H2O.ai binary model. The default value
+            is None.
+        tf_keras_model : boolean, optional
+            Flag to indicate that the model is a tensorflow keras model. The default
+            value is False.
+        mmap_mode : string, optional
+            Memory map mode passed to `joblib.load()`. The default value is None.
+        """
+        pickle_type = pickle_type if pickle_type else "pickle"
+        model_path = f'Path(settings.pickle_path) / "{model_file_name}"'
+
+        if mojo_model:
+            load = f"model = h2o.import_mojo(str({model_path}))\n"
+        elif binary_h2o_model:
+            load = f"model = h2o.load(str({model_path}))\n"
+        elif tf_keras_model:
+            model_path = model_path.replace(
+                model_file_name, str(Path(model_file_name).with_suffix(".h5"))
+            )
+            load = f"model = tf.keras.models.load_model({model_path}, safe_mode=True)\n"
+        elif mmap_mode:
+            load = f'model = joblib.load({model_path}, mmap_mode="{mmap_mode}")\n'
+        else:
+            load = (
+                f'with open({model_path}, "rb") as pickle_model:\n'
+                f"{'':20}model = {pickle_type}.load(pickle_model)\n"
+            )
+
+        cls.score_code += (
+            f"model = None\nmodel_load_seconds = None\n"
+            f"_model_lock = threading.Lock()\n\n\n"
+            f"def load_model():\n"
+            f"{'':4}# Load the model on first use; concurrent callers wait for one load\n"
+            f"{'':4}global model, model_load_seconds\n"
+            f"{'':4}if model is None:\n"
+            f"{'':8}with _model_lock:\n"
+            f"{'':12}if model is None:\n"
+            f"{'':16}start = time.perf_counter()\n"
+            f"{'':16}{load}"
+            f"{'':16}model_load_seconds = time.perf_counter() - start\n"
+            f"{'':16}logging.getLogger(__name__).info(\n"
+            f"{'':20}\"Loaded model in %.3f seconds\", model_load_seconds\n"
+            f"{'':16})\n"
+            f"{'':4}return model\n\n\n"
+        )
+        """
+model = None
+model_load_seconds = None
+_model_lock = threading.Lock()
+
+
+def load_model():
+    # Load the model on first use; concurrent callers wait for one load
+    global model, model_load_seconds
+    if model is None:
+        with _model_lock:
+            if model is None:
+                start = time.perf_counter()
+                with open(Path(settings.pickle_path) / "model.pickle", "rb") as pickle_model:
+                    model = pickle.load(pickle_model)
+                model_load_seconds = time.perf_counter() - start
+                logging.getLogger(__name__).info(
+                    "Loaded model in %.3f seconds", model_load_seconds
+                )
+    return model
+
+
+        """
+
     @classmethod
     def _impute_missing_values(
         cls, data: DataFrame, missing_values: Union[bool, list, dict]
@@ -673,6 +907,13 @@ with open(Path(settings.pickle_path) / "model.pickle", "rb") as pickle_model:
         the score code is optional and is in a separate function at the bottom of the
         generated score code.
 
+        The imputation values are written as module level constants, split into
+        numeric and character values so that each column is filled with a value of
+        its own type. At scoring time, only the columns with imputation values are
+        checked, numeric columns without NaN values are skipped without a scan, and
+        only the columns that contain missing values are filled. Filled numeric
+        columns are cast to float.
+
         Parameters
         ----------
         data : pandas.DataFrame
@@ -680,33 +921,140 @@ with open(Path(settings.pickle_path) / "model.pickle", "rb") as pickle_model:
         missing_values : bool, list, or dict
 
         """
-        cls.score_code += "\n\ndef impute_missing_values(data):\n"
+        impute_values = cls._impute_values(data, missing_values)
+        numeric_values = {
+            col: (
+                "np.nan" if isinstance(value, float) and value != value else repr(value)
+            )
+            for col, value in impute_values.items()
+            if not isinstance(value, str)
+        }
+        character_values = {
+            col: value for col, value in impute_values.items() if isinstance(value, str)
+        }
+
+        # Character values aren't wrapped since that could split a string literal
+        numeric_dict = ", ".join(
+            f"{col!r}: {val}" for col, val in numeric_values.items()
+        )
+        cls.score_code += (
+            "\n\nimpute_numeric = {\n"
+            + cls._wrap_indent_string(numeric_dict, 4)
+            + f"\n}}\nimpute_character = {character_values!r}\n"
+        )
+        """
+
+
+impute_numeric = {
+    'var1': 0.5, 'var2': 12.1
+}
+impute_character = {'var3': ''}
+        """
+        cls.score_code += (
+            f"\n\ndef impute_missing_values(data):\n"
+            f"{'':4}# Only the columns with imputation values are checked\n"
+            f"{'':4}filled = {{}}\n"
+            f"{'':4}for col, value in impute_numeric.items():\n"
+            f"{'':8}missing = _missing_values(data, col)\n"
+            f"{'':8}if missing is not None:\n"
+            f"{'':12}filled[col] = data[col].where(~missing, value).astype(float)\n"
+            f"{'':4}for col, value in impute_character.items():\n"
+            f"{'':8}missing = _missing_values(data, col)\n"
+            f"{'':8}if missing is not None:\n"
+            f"{'':12}filled[col] = data[col].where(~missing, value)\n"
+            f"{'':4}if not filled:\n"
+            f"{'':8}return data\n\n"
+            f"{'':4}data = data.copy()\n"
+            f"{'':4}for col, values in filled.items():\n"
+            f"{'':8}data[col] = values\n"
+            f"{'':4}return data\n"
+            f"\n\ndef _missing_values(data, col):\n"
+            f"{'':4}if col not in data:\n"
+            f"{'':8}return None\n"
+            f"{'':4}values = data[col]\n"
+            f"{'':4}if pd.api.types.is_numeric_dtype(values.dtype):\n"
+            f"{'':8}return values.isna() if values.hasnans else None\n\n"
+            f"{'':4}# SAS passes missing values in character variables as a padded period\n"
+            f"{'':4}missing = values == '           .'\n"
+            f"{'':4}if values.hasnans:\n"
+            f"{'':8}missing |= values.isna()\n"
+            f"{'':4}return missing if missing.any() else None\n"
+        )
         """
 
 
 def impute_missing_values(data):
+    # Only the columns with imputation values are checked
+    filled = {}
+    for col, value in impute_numeric.items():
+        missing = _missing_values(data, col)
+        if missing is not None:
+            filled[col] = data[col].where(~missing, value).astype(float)
+    for col, value in impute_character.items():
+        missing = _missing_values(data, col)
+        if missing is not None:
+            filled[col] = data[col].where(~missing, value)
+    if not filled:
+        return data
+
+    data = data.copy()
+    for col, values in filled.items():
+        data[col] = values
+    return data
+
+
+def _missing_values(data, col):
+    if col not in data:
+        return None
+    values = data[col]
+    if pd.api.types.is_numeric_dtype(values.dtype):
+        return values.isna() if values.hasnans else None
+
+    # SAS passes missing values in character variables as a padded period
+    missing = values == '           .'
+    if values.hasnans:
+        missing |= values.isna()
+    return missing if missing.any() else None
+        """
+
+    @staticmethod
+    def _impute_values(
+        data: DataFrame, missing_values: Union[bool, list, dict]
+    ) -> dict:
+        """
+        Determine the value used in place of missing values for each variable.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            Input dataset for model training or predictions.
+        missing_values : bool, list, or dict
+            If True, numeric variables are imputed with their mean, binary variables
+            with their mode, and character variables with an empty string. A list
+            provides values in the same order as the columns of `data` and a dict maps
+            variable names to values.
+
+        Returns
+        -------
+        dict
+            Imputation value for each variable.
         """
         if isinstance(missing_values, bool):
-            numeric_columns = [
-                col for col in data.columns if pd.api.types.is_numeric_dtype(data[col])
-            ]
-            character_columns = data.columns.difference(numeric_columns).tolist()
-            binary_columns = []
-            for col in data.columns:
-                unique_values = data[col].dropna().unique()
-                if len(unique_values) == 2 and all(
-                    value in [0, 1] for value in unique_values
-                ):
-                    binary_columns.append(col)
-            numeric_columns = list(set(numeric_columns) - set(binary_columns))
-            character_columns = list(set(character_columns) - set(binary_columns))
+            # Binary variables contain exactly the values 0 and 1
+            binary = (data.nunique() == 2) & (data.isin([0, 1]) | data.isna()).all()
+            numeric = data.dtypes.map(pd.api.types.is_numeric_dtype) & ~binary
+            means = data.loc[:, numeric].mean()
+            # Columns' modes are found separately since DataFrame.mode() pads
+            # columns with NaN, which would turn integer modes into floats.
+            modes = {col: data[col].mode().iloc[0] for col in data.columns[binary]}
             impute_values = {}
-            for col in data[numeric_columns]:
-                impute_values[col] = data[col].mean()
-            for col in data[character_columns]:
-                impute_values[col] = ""
-            for col in data[binary_columns]:
-                impute_values[col] = data[col].mode().iloc[0]
+            for col in data.columns:
+                if binary[col]:
+                    impute_values[col] = modes[col]
+                elif numeric[col]:
+                    impute_values[col] = means[col]
+                else:
+                    impute_values[col] = ""
         elif isinstance(missing_values, list):
             impute_values = {}
             for col, imp_val in zip(data.columns.tolist(), missing_values):
@@ -714,16 +1062,57 @@ def impute_missing_values(data):
         else:
             impute_values = missing_values
 
-        cls.score_code += f"{'':4}impute_values = \\\n" + cls._wrap_indent_string(
-            impute_values, 8
-        )
+        # Use Python scalars so the values are written as plain literals
+        return {
+            col: value.item() if hasattr(value, "item") else value
+            for col, value in impute_values.items()
+        }
+
+    @classmethod
+    def _write_row_constants(
+        cls,
+        var_list: List[str],
+        dtype_list: List[str],
+        impute_values: Optional[dict] = None,
+    ) -> None:
         """
-    impute_values = \\\n + {"var1": 0, "var2": "", "var3": 125.3}
+        Write the constants used to convert single rows into a NumPy array before
+        they are passed to the model.
+
+        Building a small array is far faster than building a DataFrame on every call
+        to the score function. The array holds floats if every variable is numeric and
+        Python objects otherwise. A new array is built for each row so that the score
+        function can be called from multiple threads at once.
+
+        Parameters
+        ----------
+        var_list : list of str
+            List of variable names, in the column order expected by the model.
+        dtype_list : list of str
+            List of variable data types.
+        impute_values : dict, optional
+            Value to use in place of a missing value for each variable. The default
+            value is None, which leaves missing values as is.
         """
-        cls.score_code += f"\n{'':4}return data.replace('           .', np.nan).fillna(impute_values).apply(pd.to_numeric, errors='ignore')\n"
+        numeric = all(any(x in dtype for x in ["int", "float"]) for dtype in dtype_list)
+        cls.score_code += f"input_columns = {var_list!r}\n"
+        if impute_values is not None:
+            defaults = [
+                "np.nan" if isinstance(v, float) and v != v else repr(v)
+                for v in (impute_values.get(var) for var in var_list)
+            ]
+            cls.score_code += "impute_defaults = (\n" + cls._wrap_indent_string(
+                ", ".join(defaults) + ",", 4
+            )
+            cls.score_code += "\n)\n"
+        cls.score_code += f"input_dtype = {'float' if numeric else 'object'}\n\n"
         """
-        
-    return data.replace('           .', np.nan).fillna(impute_values).apply(pd.to_numeric, errors='ignore')
+input_columns = ['var1', 'var2', 'var3']
+impute_defaults = (
+    0.5, 12.1, 3.0,
+)
+input_dtype = float
+
         """
 
     # TODO: Needs unit test
@@ -760,6 +1149,7 @@ def impute_missing_values(data):
         missing_values: Optional[Any] = None,
         statsmodels_model: Optional[bool] = False,
         tf_model: Optional[bool] = False,
+        array_input: Optional[bool] = False,
     ) -> None:
         """
         Write the model prediction section of the score code.
@@ -781,6 +1171,11 @@ def impute_missing_values(data):
         tf_model : bool, optional
             Flag to indicate that the model is a tensorflow model. The default value is
             False.
+        array_input : bool, optional
+            Flag to indicate that single rows should be passed to the model as a NumPy
+            array using the constants written by `_write_row_constants` instead of a
+            DataFrame. Only applies to models that are not H2O.ai, statsmodels, or
+            tensorflow models. The default value is False.
         """
         cls.score_code += (
             f"{'':4}index=None\n"
@@ -795,15 +1190,7 @@ if not isinstance(var1, pd.Series):
 
         # H2O models
         if dtype_list:
-            column_types = "{"
-            for var, dtype in zip(var_list, dtype_list):
-                if any(x in dtype for x in ["int", "float"]):
-                    col_type = "numeric"
-                else:
-                    col_type = "string"
-                column_types += f'"{var}": "{col_type}", '
-            column_types = column_types.rstrip(", ")
-            column_types += "}"
+            column_types = cls._h2o_column_types(var_list, dtype_list)
             input_dict = [f'"{var}": {var}' for var in var_list]
 
             cls.score_code += f"{'':4}input_array = pd.DataFrame(\n"
@@ -900,14 +1287,51 @@ if not isinstance(var1, pd.Series):
             """
         else:
             input_dict = [f'"{var}": {var}' for var in var_list]
+            indent = 4
 
-            cls.score_code += f"{'':4}input_array = pd.DataFrame(\n"
+            if array_input:
+                cls.score_code += (
+                    f"{'':4}if index is not None:\n{'':8}row = (\n"
+                    + cls._wrap_indent_string(", ".join(var_list) + ",", 12)
+                    + f"\n{'':8})\n"
+                )
+                if missing_values:
+                    cls.score_code += (
+                        f"{'':8}row = [\n"
+                        f"{'':12}impute_defaults[i]\n"
+                        f"{'':12}if value is None or value != value or "
+                        f"value == '           .'\n"
+                        f"{'':12}else value\n"
+                        f"{'':12}for i, value in enumerate(row)\n"
+                        f"{'':8}]\n"
+                    )
+                cls.score_code += (
+                    f"{'':8}input_array = np.array([row], dtype=input_dtype)\n"
+                    f"{'':4}else:\n"
+                )
+                indent = 8
+                """
+    if index is not None:
+        row = (
+            var1, var2, var3,
+        )
+        row = [
+            impute_defaults[i]
+            if value is None or value != value or value == '           .'
+            else value
+            for i, value in enumerate(row)
+        ]
+        input_array = np.array([row], dtype=input_dtype)
+    else:
+                """
+
+            cls.score_code += f"{'':{indent}}input_array = pd.DataFrame(\n"
             input_frame = f'{{{", ".join(input_dict)}}}, index=index'
-            cls.score_code += cls._wrap_indent_string(input_frame, 8)
-            cls.score_code += f"\n{'':4})\n"
+            cls.score_code += cls._wrap_indent_string(input_frame, indent + 4)
+            cls.score_code += f"\n{'':{indent}})\n"
             if missing_values:
                 cls.score_code += (
-                    f"{'':4}input_array = impute_missing_values(input_array)\n"
+                    f"{'':{indent}}input_array = impute_missing_values(input_array)\n"
                 )
             cls.score_code += (
                 f"{'':4}prediction = model.{method.__name__}(input_array).tolist()\n"
@@ -920,6 +1344,414 @@ if not isinstance(var1, pd.Series):
     prediction = model.predict(input_array)
             """
 
+    @staticmethod
+    def _h2o_column_types(var_list: List[str], dtype_list: List[str]) -> str:
+        """
+        Write the dictionary of H2O.ai column types for the input variables.
+
+        Parameters
+        ----------
+        var_list : list of str
+            List of variable names.
+        dtype_list : list of str
+            List of variable data types.
+
+        Returns
+        -------
+        str
+            Dictionary literal mapping each variable to "numeric" or "string".
+        """
+        column_types = "{"
+        for var, dtype in zip(var_list, dtype_list):
+            if any(x in dtype for x in ["int", "float"]):
+                col_type = "numeric"
+            else:
+                col_type = "string"
+            column_types += f'"{var}": "{col_type}", '
+        column_types = column_types.rstrip(", ")
+        column_types += "}"
+        return column_types
+
+    @classmethod
+    def _score_batch(
+        cls,
+        method: Callable[..., List],
+        var_list: List[str],
+        metrics: List[str],
+        predict_returns: List[Any],
+        target_values: Optional[List[str]] = None,
+        predict_threshold: Optional[float] = None,
+        target_index: Optional[int] = 1,
+        dtype_list: Optional[List[str]] = None,
+        missing_values: Optional[Any] = None,
+        h2o_model: Optional[bool] = False,
+        statsmodels_model: Optional[bool] = False,
+        tf_model: Optional[bool] = False,
+        lazy_load: Optional[bool] = False,
+    ) -> None:
+        """
+        Write the batch scoring function of the score code.
+
+        The `score_batch` function accepts a DataFrame of input rows and returns a
+        DataFrame of score metrics with the same index, computing the metrics for all
+        rows at once with NumPy. It also accepts an iterable of DataFrames, such as the
+        chunks returned by `pandas.read_csv(..., chunksize=n)`, and returns a generator
+        of output DataFrames so that large datasets are never held in memory at once.
+
+        Parameters
+        ----------
+        method : function -> list
+            The Python function used for model predictions.
+        var_list : list of str
+            List of variable names.
+        metrics : list of str
+            A list of strings corresponding to the outputs of the model to SAS Model
+            Manager.
+        predict_returns : list
+            A list of the return types of the prediction method.
+        target_values : list of str, optional
+            A list of target values for the target variable. The default value is None.
+        predict_threshold : float, optional
+            The prediction threshold for normalized probability score_metrics. The
+            default value is None.
+        target_index : int, optional
+            Sets the index of success for a binary model. The default value is 1.
+        dtype_list : list of str, optional
+            List of variable data types, required for H2O.ai models. The default value
+            is None.
+        missing_values : any, optional
+            Flag for indicating if missing values should be imputed. The default value
+            is None.
+        h2o_model : bool, optional
+            Flag to indicate that the model is an H2O.ai model. The default value is
+            False.
+        statsmodels_model : bool, optional
+            Flag to indicate that the model is a statsmodels model. The default value is
+            False.
+        tf_model : bool, optional
+            Flag to indicate that the model is a tensorflow model. The default value is
+            False.
+        lazy_load : bool, optional
+            Flag to indicate that the model is loaded by `load_model()` on first use.
+            The default value is False.
+        """
+        outputs = cls._batch_output_columns(
+            metrics,
+            predict_returns,
+            target_values=target_values,
+            predict_threshold=predict_threshold,
+            target_index=target_index,
+            h2o_model=h2o_model,
+        )
+
+        cls.score_code += (
+            f"\n\ndef score_batch(data):\n"
+            f"{'':4}# Accepts a DataFrame or an iterable of DataFrames (chunks), for which\n"
+            f"{'':4}# a generator of output DataFrames is returned.\n"
+            f"{'':4}if not isinstance(data, pd.DataFrame):\n"
+            f"{'':8}return (score_batch(chunk) for chunk in data)\n\n"
+        )
+        if lazy_load:
+            cls.score_code += f"{'':4}load_model()\n"
+        cls.score_code += f"{'':4}input_array = data[{var_list!r}]\n"
+        if missing_values:
+            cls.score_code += (
+                f"{'':4}input_array = impute_missing_values(input_array)\n"
+            )
+
+        if h2o_model:
+            cls.score_code += (
+                f"{'':4}column_types = {cls._h2o_column_types(var_list, dtype_list)}\n"
+                f"{'':4}h2o_array = h2o.H2OFrame(input_array, "
+                f"column_types=column_types)\n"
+                f"{'':4}prediction = h2o.as_list(model.{method.__name__}(h2o_array), "
+                f"use_pandas=True)\n"
+                f"{'':4}p = prediction.to_numpy(dtype=object)\n"
+            )
+        else:
+            if statsmodels_model:
+                cls.score_code += f"{'':4}input_array.insert(0, 'const', 1)\n"
+            dtype = (
+                "object"
+                if any(cls._determine_returns_type(predict_returns))
+                else "float"
+            )
+            cls.score_code += (
+                f"{'':4}prediction = model.{method.__name__}(input_array)\n"
+                f"{'':4}p = np.asarray(prediction, dtype={dtype})\n"
+            )
+        cls.score_code += f"{'':4}if p.ndim == 1:\n{'':8}p = p.reshape(-1, 1)\n"
+        if tf_model:
+            cls.score_code += (
+                f"{'':4}# Check if model returns logits or probabilities\n"
+                f"{'':4}if not np.allclose(p.sum(axis=1), 1, rtol=0.01):\n"
+                f"{'':8}p = tf.nn.softmax(p).numpy()\n"
+            )
+        if target_values and len(target_values) > 2:
+            cls.score_code += f"{'':4}target_values = np.array({target_values!r})\n"
+
+        cls.score_code += f"\n{'':4}return pd.DataFrame(\n{'':8}{{\n"
+        for metric, expression in outputs:
+            cls.score_code += f"{'':12}{metric!r}: {expression},\n"
+        cls.score_code += f"{'':8}}},\n{'':8}index=data.index,\n{'':4})\n"
+        """
+
+
+def score_batch(data):
+    # Accepts a DataFrame or an iterable of DataFrames (chunks), for which
+    # a generator of output DataFrames is returned.
+    if not isinstance(data, pd.DataFrame):
+        return (score_batch(chunk) for chunk in data)
+
+    input_array = data[['var1', 'var2', 'var3']]
+    input_array = impute_missing_values(input_array)
+    prediction = model.predict_proba(input_array)
+    p = np.asarray(prediction, dtype=float)
+    if p.ndim == 1:
+        p = p.reshape(-1, 1)
+
+    return pd.DataFrame(
+        {
+            'EM_CLASSIFICATION': np.where(p[:, 1] > 0.5, '1', '0'),
+            'EM_EVENTPROBABILITY': p[:, 1],
+        },
+        index=data.index,
+    )
+        """
+
+    @classmethod
+    def _output_layout(
+        cls,
+        metrics: Union[List[str], str],
+        predict_returns: List[Any],
+        target_values: Optional[List[str]] = None,
+        target_index: Optional[int] = 1,
+        h2o_model: Optional[bool] = False,
+    ) -> List[Tuple[str, str, Any]]:
+        """
+        Map each score metric to the prediction output that it is computed from.
+
+        The layout mirrors the outputs written by `_predictions_to_metrics` and is
+        shared by every generated scoring path, so the batch and per-row outputs are
+        derived from the same decisions. Each entry is one of the following operations
+        on the columns of the prediction:
+
+        - ``("value", i)``: the value of column `i`
+        - ``("classify", i)``: the binary target value chosen by thresholding column `i`
+        - ``("complement", i)``: one minus the probability in column `i`
+        - ``("argmax", (start, skip))``: the target value of the largest probability
+        - ``("max", (start, skip))``: the largest probability
+
+        For the last two operations the probabilities are the columns from `start`
+        onwards, excluding the column `skip` when it is not None.
+
+        Parameters
+        ----------
+        metrics : list of str or str
+            A list of strings corresponding to the outputs of the model to SAS Model
+            Manager.
+        predict_returns : list
+            A list of the return types of the prediction method.
+        target_values : list of str, optional
+            A list of target values for the target variable. The default value is None.
+        target_index : int, optional
+            Sets the index of success for a binary model. The default value is 1.
+        h2o_model : bool, optional
+            Flag to indicate that the model is an H2O.ai model. The default value is
+            False.
+
+        Returns
+        -------
+        list of tuple
+            The name of each metric, the operation and the operation argument.
+        """
+        target_index = target_index or 1
+        metrics = [metrics] if isinstance(metrics, str) else list(metrics)
+        returns = cls._determine_returns_type(predict_returns)
+
+        def value(i):
+            return "value", i
+
+        def classify(i):
+            return "classify", i
+
+        def complement(i):
+            return "complement", i
+
+        def argmax(start=0, skip=None):
+            return "argmax", (start, skip)
+
+        def maximum(start=0, skip=None):
+            return "max", (start, skip)
+
+        # Prediction model or no-calculation classification model
+        if not target_values:
+            operations = [value(i) for i in range(len(metrics))]
+        # Binary classification model
+        elif len(target_values) == 2:
+            class_index = returns.index(True) if any(returns) else None
+            if len(metrics) == 1:
+                if h2o_model:
+                    operations = [classify(target_index + 1)]
+                elif class_index is not None:
+                    operations = [value(class_index)]
+                elif len(returns) == 1:
+                    operations = [classify(0)]
+                else:
+                    operations = [classify(target_index)]
+            elif len(metrics) == 2:
+                if h2o_model:
+                    operations = [
+                        classify(target_index + 1),
+                        value(target_index + 1),
+                    ]
+                elif len(returns) == 1:
+                    operations = [classify(0), value(0)]
+                elif class_index is None:
+                    operations = [classify(target_index), value(target_index)]
+                elif len(returns) == 2:
+                    operations = [value(0), value(1)]
+                elif class_index == 0:
+                    operations = [value(0), value(target_index + 1)]
+                else:
+                    operations = [value(class_index), value(target_index)]
+            else:
+                if h2o_model:
+                    operations = [value(0), value(1), value(2)]
+                elif len(returns) == 1:
+                    operations = [classify(0), value(0), complement(0)]
+                elif class_index is None:
+                    operations = [
+                        classify(target_index),
+                        value(target_index),
+                        value(abs(target_index - 1)),
+                    ]
+                elif len(returns) == 2:
+                    proba_index = abs(class_index - 1)
+                    operations = [
+                        value(class_index),
+                        value(proba_index),
+                        complement(proba_index),
+                    ]
+                else:
+                    operations = [value(0), value(1), value(2)]
+        # Multiclass classification model
+        elif h2o_model:
+            if len(metrics) == 1:
+                operations = [argmax(1)]
+            elif len(metrics) == 2:
+                operations = [argmax(1), maximum(1)]
+            elif len(metrics) == len(target_values):
+                operations = [value(i + 1) for i in range(len(metrics))]
+            else:
+                operations = [value(i) for i in range(len(metrics))]
+        elif len(metrics) == len(returns) == 1:
+            operations = [value(0)]
+        elif any(returns):
+            class_index = returns.index(True)
+            if len(metrics) == 1:
+                operations = [value(class_index)]
+            elif len(metrics) == 2:
+                operations = [value(class_index), maximum(skip=class_index)]
+            else:
+                operations = [value(i) for i in range(len(metrics))]
+        elif len(metrics) == 1:
+            operations = [argmax()]
+        elif len(metrics) == 2:
+            operations = [argmax(), maximum()]
+        elif len(metrics) == len(returns):
+            operations = [value(i) for i in range(len(metrics))]
+        else:
+            operations = [argmax()] + [value(i) for i in range(len(returns))]
+        return [
+            (metric, operation, argument)
+            for metric, (operation, argument) in zip(metrics, operations)
+        ]
+
+    @classmethod
+    def _batch_output_columns(
+        cls,
+        metrics: Union[List[str], str],
+        predict_returns: List[Any],
+        target_values: Optional[List[str]] = None,
+        predict_threshold: Optional[float] = None,
+        target_index: Optional[int] = 1,
+        h2o_model: Optional[bool] = False,
+    ) -> List[Tuple[str, str]]:
+        """
+        Determine the NumPy expression used to compute each score metric for a batch.
+
+        The expressions are rendered from the layout returned by `_output_layout`.
+        They operate on `p`, a two-dimensional array with one row per input row and
+        one column per value returned by the prediction method (or per column of the
+        H2O.ai prediction frame). Multiclass expressions also refer to a
+        `target_values` NumPy array.
+
+        Parameters
+        ----------
+        metrics : list of str or str
+            A list of strings corresponding to the outputs of the model to SAS Model
+            Manager.
+        predict_returns : list
+            A list of the return types of the prediction method.
+        target_values : list of str, optional
+            A list of target values for the target variable. The default value is None.
+        predict_threshold : float, optional
+            The prediction threshold for normalized probability score_metrics. The
+            default value is None.
+        target_index : int, optional
+            Sets the index of success for a binary model. The default value is 1.
+        h2o_model : bool, optional
+            Flag to indicate that the model is an H2O.ai model. The default value is
+            False.
+
+        Returns
+        -------
+        list of tuple of str
+            The name of each metric and the expression that computes it.
+        """
+        target_index = target_index or 1
+        layout = cls._output_layout(
+            metrics, predict_returns, target_values, target_index, h2o_model
+        )
+        returns = cls._determine_returns_type(predict_returns)
+        # Classification values are returned as objects alongside probabilities
+        mixed = h2o_model or any(returns)
+
+        def column(i):
+            if h2o_model:
+                return f"p[:, {i}]" if i == 0 else f"p[:, {i}].astype(float)"
+            if i < len(returns) and returns[i]:
+                return f"p[:, {i}]"
+            return f"p[:, {i}].astype(float)" if mixed else f"p[:, {i}]"
+
+        def probabilities(start, skip):
+            probas = "p" if not start else f"p[:, {start}:]"
+            if skip is not None:
+                probas = f"np.delete(p, {skip}, axis=1)"
+            return f"{probas}.astype(float)" if mixed else probas
+
+        outputs = []
+        for metric, operation, argument in layout:
+            if operation == "value":
+                expression = column(argument)
+            elif operation == "classify":
+                expression = (
+                    f"np.where({column(argument)} > {predict_threshold or 0.5}, "
+                    f"{str(target_values[target_index])!r}, "
+                    f"{str(target_values[abs(target_index - 1)])!r})"
+                )
+            elif operation == "complement":
+                expression = f"1 - {column(argument)}"
+            elif operation == "argmax":
+                expression = (
+                    f"target_values[np.argmax({probabilities(*argument)}, axis=1)]"
+                )
+            else:
+                expression = f"{probabilities(*argument)}.max(axis=1)"
+            outputs.append((metric, expression))
+        return outputs
+
     @classmethod
     def _determine_score_metrics(
         cls,
@@ -1058,7 +1890,8 @@ if not isinstance(var1, pd.Series):
         Determine the return type of the prediction method.
 
         Returns a list of equal size to input argument, which contains `True` for
-        classification values and `False` for probability or prediction values.
+        classification values and `False` for probability or prediction values. The
+        input list is not modified.
 
         Parameters
         ----------
@@ -1072,14 +1905,15 @@ if not isinstance(var1, pd.Series):
             classification values and `False` represents probability or prediction
             values.
         """
-        for i, val in enumerate(returns):
+        types = []
+        for val in returns:
             if isinstance(val, str) or val == str:
-                returns[i] = True
+                types.append(True)
             elif isinstance(val, (float, int)) or val in [float, int]:
-                returns[i] = False
+                types.append(False)
             else:
-                returns[i] = True
-        return returns
+                types.append(True)
+        return types
 
     @classmethod
     def _predictions_to_metrics(
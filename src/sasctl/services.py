@@ -4,23 +4,60 @@
 # Copyright © 2019, SAS Institute Inc., Cary, NC, USA.  All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-# Import all of the services from their respective modules to provide
-# a single location for importing services.  All services should utilize
-# classmethods allowing them to be used without instantiation
-from ._services.cas_management import CASManagement as cas_management
-from ._services.concepts import Concepts as concepts
-from ._services.data_sources import DataSources as data_sources
-from ._services.files import Files as files
-from ._services.folders import Folders as folders
-from ._services.microanalytic_score import MicroAnalyticScore as microanalytic_score
-from ._services.model_management import ModelManagement as model_management
-from ._services.model_publish import ModelPublish as model_publish
-from ._services.model_repository import ModelRepository as model_repository
-from ._services.projects import Projects as projects
-from ._services.relationships import Relationships as relationships
-from ._services.report_images import ReportImages as report_images
-from ._services.reports import Reports as reports
-from ._services.saslogon import SASLogon as saslogon
-from ._services.sentiment_analysis import SentimentAnalysis as sentiment_analysis
-from ._services.text_categorization import TextCategorization as text_categorization
-from ._services.text_parsing import TextParsing as text_parsing
+# Provide a single location for importing services.  All services should
+# utilize classmethods allowing them to be used without instantiation.
+# Service modules are only imported the first time they are accessed so that
+# `import sasctl` doesn't pay for services that are never used.
+
+import importlib
+import sys
+
+_SERVICES = {
+    "cas_management": ("cas_management", "CASManagement"),
+    "concepts": ("concepts", "Concepts"),
+    "data_sources": ("data_sources", "DataSources"),
+    "files": ("files", "Files"),
+    "folders": ("folders", "Folders"),
+    "microanalytic_score": ("microanalytic_score", "MicroAnalyticScore"),
+    "model_management": ("model_management", "ModelManagement"),
+    "model_publish": ("model_publish", "ModelPublish"),
+    "model_repository": ("model_repository", "ModelRepository"),
+    "projects": ("projects", "Projects"),
+    "relationships": ("relationships", "Relationships"),
+    "report_images": ("report_images", "ReportImages"),
+    "reports": ("reports", "Reports"),
+    "saslogon": ("saslogon", "SASLogon"),
+    "sentiment_analysis": ("sentiment_analysis", "SentimentAnalysis"),
+    "text_categorization": ("text_categorization", "TextCategorization"),
+    "text_parsing": ("text_parsing", "TextParsing"),
+}
+
+__all__ = sorted(_SERVICES)
+
+
+def __getattr__(name):
+    try:
+        module_name, class_name = _SERVICES[name]
+    except KeyError:
+        raise AttributeError(
+            "module %r has no attribute %r" % (__name__, name)
+        ) from None
+
+    module = importlib.import_module("._services." + module_name, __package__)
+    service = getattr(module, class_name)
+
+    # Cache on the module so __getattr__ is only called once per service.
+    globals()[name] = service
+    return service
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SERVICES))
+
+
+# Module-level __getattr__ (PEP 562) requires Python 3.7, so import every
+# service up front on older versions.
+if sys.version_info < (3, 7):
+    for _name in _SERVICES:
+        __getattr__(_name)
+    del _name
@@ -15,13 +15,6 @@ import re
 import sys
 from warnings import warn
 
-import pandas as pd
-
-try:
-    import swat
-except ImportError:
-    swat = None
-
 from urllib.error import HTTPError
 
 from . import utils
@@ -31,7 +24,6 @@ from .services import model_management as mm
 from .services import model_publish as mp
 from .services import model_repository as mr
 from .utils.misc import installed_packages
-from .utils.pymas import from_pickle
 
 logger = logging.getLogger(__name__)
 
@@ -285,7 +277,8 @@ def register_model(
         A list of dictionaries of the form
         {'name': filename, 'file': filecontent}.
         An optional 'role' key is supported for designating a file as score
-        code, astore, etc.
+        code, astore, etc.  Files are uploaded concurrently using
+        :meth:`model_repository.add_model_contents <.ModelRepository.add_model_contents>`.
     force : bool, optional
         Create dependencies such as projects and repositories if they do not
         already exist.
@@ -298,6 +291,12 @@ def register_model(
     model : RestObj
         The newly registered model as an instance of ``RestObj``
 
+    Raises
+    ------
+    ContentUploadError
+        If any of `files` could not be uploaded.  Files that were uploaded
+        are removed from the model.
+
     Notes
     -----
     If the specified model is a CAS table the model data and metadata will be
@@ -358,10 +357,13 @@ def register_model(
 
     # If model is a CASTable then assume it holds an ASTORE model.  Import these via a ZIP file.
     if "swat.cas.table.CASTable" in str(type(model)):
-        if swat is None:
+        try:
+            import swat
+        except ImportError:
             raise RuntimeError(
                 "The 'swat' package is required to work with SAS models."
             )
+
         if not isinstance(model, swat.CASTable):
             raise ValueError(
                 "Parameter 'table' should be an instance of '%r' but "
@@ -491,6 +493,8 @@ def register_model(
 
         # Generate PyMAS wrapper
         try:
+            from .utils.pymas import from_pickle
+
             mas_module = from_pickle(
                 model_pkl, target_funcs, input_types=input, array_input=True
             )
@@ -554,6 +558,10 @@ def register_model(
                 "Model not found." % (version, name)
             )
         model = mr.create_model_version(name)
+
+        # Existing files are removed concurrently.  A DeleteError stops the
+        # upload if any remain since uploading files with the same names
+        # would fail.
         mr.delete_model_contents(model)
     else:
         # Assume new model to create
@@ -565,18 +573,32 @@ def register_model(
             "instead." % (RestObj, model)
         )
 
-    # Upload any additional files
+    # Upload any additional files.  Anything that isn't a dict or an open file
+    # is passed to add_model_content() as-is, one at a time.
+    files = list(files)
+    mr.add_model_contents(
+        model, [f for f in files if isinstance(f, dict) or _is_open_file(f)]
+    )
     for file in files:
-        if isinstance(file, dict):
-            mr.add_model_content(model, **file)
-        else:
+        if not (isinstance(file, dict) or _is_open_file(file)):
             mr.add_model_content(model, file)
 
     return model
 
 
+def _is_open_file(obj):
+    return hasattr(obj, "read") and hasattr(obj, "name")
+
+
 def publish_model(
-    model, destination, code=None, name=None, max_retries=60, replace=False, **kwargs
+    model,
+    destination,
+    code=None,
+    name=None,
+    max_retries=None,
+    replace=False,
+    timeout=None,
+    **kwargs,
 ):
     """Publish a model to a configured publishing destination.
 
@@ -590,9 +612,13 @@ def publish_model(
     name : str, optional
         Name of custom publish name for publish calls that do not have code. Default is None.
     max_retries : int, optional
+        Deprecated.  Use `timeout` instead.
     replace : bool, optional
         Whether to overwrite the model if it already exists in
         the `destination`
+    timeout : float, optional
+        Maximum number of seconds to wait for publishing to complete.
+        Defaults to 300.
     kwargs : optional
         additional arguments will be passed to the underlying publish
         functions.
@@ -622,34 +648,89 @@ def publish_model(
     """
 
     def submit_request():
-        # Submit a publishing request
-        if code is None:
-            dest_obj = mp.get_destination(destination)
-
-            if dest_obj and dest_obj.destinationType == "cas":
-                publish_req = mm.publish_model(
-                    model,
-                    destination,
-                    force=replace,
-                    name=name,
-                    reload_model_table=True,
-                )
-            else:
-                publish_req = mm.publish_model(
-                    model, destination, force=replace, name=name
-                )
-        else:
-            publish_req = mp.publish_model(model, destination, code=code, **kwargs)
+        publish_req = _submit_publish(model, destination, code, name, replace, **kwargs)
 
         # A successfully submitted request doesn't mean a successfully
         # published model.  Response for publish request includes link to
         # check publish log
-        result = mr._monitor_job(publish_req, max_retries=max_retries)
-        return result
+        return mr._monitor_job(publish_req, max_retries=max_retries, timeout=timeout)
 
     # Submit and wait for status
-    job = submit_request()
+    return _publish_result(model, submit_request(), submit_request, replace)
+
+
+def publish_models(models, destination, replace=False, timeout=None):
+    """Publish several registered models to a destination at once.
 
+    All publishing requests are submitted before waiting on any of them, and
+    the resulting jobs are polled together from a single background thread.
+
+    Parameters
+    ----------
+    models : iterable of str or dict
+        The name or id of each model, or a dictionary representation of each
+        model.
+    destination : str
+    replace : bool, optional
+        Whether to overwrite models that already exist in the `destination`.
+    timeout : float, optional
+        Maximum number of seconds to wait for each model to be published.
+        Defaults to 300.
+
+    Returns
+    -------
+    list of RestObj
+        The published models, in the same order as `models`.
+
+    Raises
+    ------
+    RuntimeError
+        If a model fails to publish.
+
+    See Also
+    --------
+    publish_model
+
+    """
+    models = list(models)
+    jobs = [_submit_publish(m, destination, None, None, replace) for m in models]
+    futures = [mr._watch_job(job, timeout=timeout) for job in jobs]
+
+    results = []
+    for model, future in zip(models, futures):
+
+        def resubmit(model=model):
+            job = _submit_publish(model, destination, None, None, replace)
+            return mr._monitor_job(job, timeout=timeout)
+
+        results.append(_publish_result(model, future.result(), resubmit, replace))
+    return results
+
+
+def _submit_publish(model, destination, code, name, replace, **kwargs):
+    """Submit a publishing request without waiting for it to complete."""
+    if code is None:
+        dest_obj = mp.get_destination(destination)
+
+        if dest_obj and dest_obj.destinationType == "cas":
+            return mm.publish_model(
+                model,
+                destination,
+                force=replace,
+                name=name,
+                reload_model_table=True,
+            )
+        return mm.publish_model(model, destination, force=replace, name=name)
+    return mp.publish_model(model, destination, code=code, **kwargs)
+
+
+def _publish_result(model, job, resubmit, replace):
+    """Get the published model from a finished publishing job.
+
+    `resubmit` is called to publish the model again if publishing to MAS
+    failed and `replace` is set.
+
+    """
     # If model was successfully published and it isn't a MAS module, we're done
     if (
         job.state.lower() == "completed"
@@ -669,7 +750,7 @@ def publish_model(
         mas.delete_module(job.publishName)
 
         # Resubmit the request
-        job = submit_request()
+        job = resubmit()
 
     # Raise exception if still failing
     if job.state.lower() == "failed":
@@ -936,6 +1017,8 @@ def get_project_kpis(
     """
     from distutils.version import StrictVersion
 
+    import pandas as pd
+
     from .core import is_uuid
 
     # Check the pandas version for where the json_normalize function exists
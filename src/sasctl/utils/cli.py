@@ -5,17 +5,21 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import argparse
+import hashlib
 import inspect
 import json
 import logging
 import os
 import pkgutil
+import sys
+import types
 import warnings
 from collections import defaultdict, namedtuple
 from importlib import import_module
 from pprint import pprint
 
 ArgInfo = namedtuple("ArgInfo", ["name", "type", "required", "default", "doc"])
+CommandSpec = namedtuple("CommandSpec", ["location", "help", "arguments"])
 
 
 def sasctl_command(name, subname=None):
@@ -79,44 +83,15 @@ def sasctl_command(name, subname=None):
                 defaults
             )
             defaults = [None] * (len(arg_spec.args) - len(defaults)) + defaults
-            types = []
-            help_doc = []
-
-            doc = inspect.getdoc(func)
-            if doc and doc.find("Parameters\n"):
-                doc_lines = doc[doc.find("Parameters\n") :].splitlines()
-                doc_lines.pop(0)  # First line is "Parameters"
-
-                if doc_lines and doc_lines[0].startswith("---"):
-                    doc_lines.pop(
-                        0
-                    )  # Discard ----------- line under "Parameters" heading
-
-                while doc_lines:
-                    var = doc_lines.pop(0)
-
-                    if var.startswith("Returns") or var.strip() == "":
-                        break
-
-                    if ":" in var:
-                        types.append(var.split(":")[-1].strip())
-                    else:
-                        types.append("str")
-
-                    if doc_lines and doc_lines[0].startswith("    "):
-                        help_doc.append(doc_lines.pop(0).strip())
-                    else:
-                        help_doc.append("")
-            else:
-                types = ["str"] * len(arg_spec.args)
-                help_doc = [None] * len(arg_spec.args)
+            params = _parse_parameters(inspect.getdoc(func))
 
-            return [
-                ArgInfo(n, t, r, d, o)
-                for n, t, r, d, o in zip(
-                    arg_spec.args, types, required, defaults, help_doc
-                )
-            ]
+            # Match documentation to arguments by name since class and
+            # instance methods don't document `cls` or `self`.
+            args = []
+            for n, r, d in zip(arg_spec.args, required, defaults):
+                t, o = params.get(n, ("str", None))
+                args.append(ArgInfo(n, t, r, d, o))
+            return args
 
         func._cli_command = command_name
         func._cli_service = service_name
@@ -130,26 +105,100 @@ def sasctl_command(name, subname=None):
     return decorator
 
 
+def _parse_parameters(doc):
+    """Read the type and description of each parameter in a docstring.
+
+    Parameters
+    ----------
+    doc : str or None
+        A docstring using the numpydoc format.
+
+    Returns
+    -------
+    dict
+        Maps each parameter name to a tuple of its type and the first line of
+        its description.
+
+    """
+    params = {}
+    if not doc or "Parameters\n" not in doc:
+        return params
+
+    doc_lines = doc[doc.find("Parameters\n") :].splitlines()
+    doc_lines.pop(0)  # First line is "Parameters"
+
+    if doc_lines and doc_lines[0].startswith("---"):
+        doc_lines.pop(0)  # Discard ----------- line under "Parameters" heading
+
+    while doc_lines:
+        var = doc_lines.pop(0)
+
+        if var.startswith("Returns") or var.strip() == "":
+            break
+
+        if ":" in var:
+            var_name, _, var_type = var.partition(":")
+            var_type = var_type.strip()
+        else:
+            var_name, var_type = var, "str"
+
+        if doc_lines and doc_lines[0].startswith("    "):
+            var_doc = doc_lines.pop(0).strip()
+
+            # Only the first line of a description is used
+            while doc_lines and doc_lines[0].startswith("    "):
+                doc_lines.pop(0)
+        else:
+            var_doc = ""
+
+        # Docstrings may document several parameters at once
+        for n in var_name.split(","):
+            params[n.strip()] = (var_type, var_doc)
+
+    return params
+
+
 def _find_services(module="sasctl"):
     """Recursively find all functions in all modules that have been decorated as CLI commands."""
+    services = defaultdict(dict)
+
+    for func, _ in _walk_commands(module):
+        services[func._cli_service][func._cli_command] = func
+
+    return services
+
+
+def _walk_commands(module="sasctl"):
+    """Import every module in a package and yield each CLI command found.
+
+    Yields
+    ------
+    (function, str)
+        The command and its location as "<module>:<attribute path>".
+
+    """
     m = __import__(module, fromlist=[""])  # returns a module
 
-    def find_recurse(module, services):
-        for obj in dir(module):
-            obj = getattr(module, obj)
+    def find_recurse(module):
+        for name in dir(module):
+            obj = getattr(module, name)
 
             source_module = getattr(obj, "__module__", type(obj).__module__)
 
             # Module-level functions that are tagged as commands
             if hasattr(obj, "_cli_command") and hasattr(obj, "_cli_service"):
-                services[obj._cli_service][obj._cli_command] = obj
+                yield obj, "%s:%s" % (module.__name__, name)
 
             # Check methods on service classes
             elif source_module.startswith("sasctl._services"):
-                for atr in dir(obj):
-                    atr = getattr(obj, atr)
+                for atr_name in dir(obj):
+                    atr = getattr(obj, atr_name)
                     if hasattr(atr, "_cli_command") and hasattr(atr, "_cli_service"):
-                        services[atr._cli_service][atr._cli_command] = atr
+                        yield atr, "%s:%s.%s" % (
+                            source_module,
+                            getattr(obj, "__name__", name),
+                            atr_name,
+                        )
 
         # recurse into submodules
         submodules = pkgutil.iter_modules(getattr(module, "__path__", []))
@@ -164,18 +213,139 @@ def _find_services(module="sasctl"):
                 continue
 
             submodule = import_module("." + submodule_name, package=module.__name__)
-            # if hasattr(submodule, 'name'):
-            #     # ModuleInfo returned py 3.6
-            #     submodule = import_module('.' + submodule.name, package=module.__name__)
-            # else:
-            #     # Tuple of (module_loader, name, ispkg) returned by older versions
-            #     submodule = import_module('.' + submodule[1], package=module.__name__)
-            services = find_recurse(submodule, services)
+            yield from find_recurse(submodule)
 
-        return services
+    yield from find_recurse(m)
 
-    services = find_recurse(m, defaultdict(dict))
-    return services
+
+def _manifest_path():
+    """Location of the cached command manifest.
+
+    Defaults to ~/.sas/sasctl-cli-commands.json and can be overridden with the
+    SASCTL_CLI_CACHE environment variable.  Set SASCTL_CLI_CACHE to an empty
+    string to disable caching.
+
+    """
+    path = os.environ.get("SASCTL_CLI_CACHE")
+    if path is None:
+        path = os.path.join("~", ".sas", "sasctl-cli-commands.json")
+    return os.path.expanduser(path)
+
+
+def _package_fingerprint():
+    """Identify the installed version of sasctl.
+
+    Combines the version number with the modification times of the modules
+    in the package and its `_services` subpackage, which define the commands.
+    Editing a module in an editable install, reinstalling, or upgrading the
+    package invalidates the manifest.
+
+    """
+    from sasctl import __version__
+
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    stamps = []
+    for directory in (package_dir, os.path.join(package_dir, "_services")):
+        with os.scandir(directory) as entries:
+            stamps.extend(
+                (directory, entry.name, entry.stat().st_mtime_ns)
+                for entry in entries
+                if entry.name.endswith(".py")
+            )
+    digest = hashlib.sha1(repr(sorted(stamps)).encode("utf-8")).hexdigest()
+
+    return "%s:%s:%s" % (__version__, package_dir, digest)
+
+
+def _build_manifest(module="sasctl"):
+    """Collect everything needed to build the parser for each command.
+
+    Returns
+    -------
+    dict
+        Maps each service to its commands.  Each command is a `CommandSpec`.
+
+    """
+    manifest = defaultdict(dict)
+
+    for func, location in _walk_commands(module):
+        manifest[func._cli_service][func._cli_command] = CommandSpec(
+            location,
+            _get_func_description(func),
+            [ArgInfo(*arg) for arg in func._cli_arguments()],
+        )
+
+    return dict(manifest)
+
+
+def _load_manifest(path=None):
+    """Load the cached command manifest, rebuilding it if it is out of date.
+
+    Parameters
+    ----------
+    path : str, optional
+        File containing the cached manifest.  Defaults to `_manifest_path()`.
+
+    Returns
+    -------
+    dict
+
+    """
+    path = _manifest_path() if path is None else path
+    fingerprint = _package_fingerprint()
+
+    if path:
+        try:
+            with open(path) as f:
+                cached = json.load(f)
+            if cached.get("fingerprint") == fingerprint:
+                return {
+                    service: {
+                        command: CommandSpec(
+                            spec[0], spec[1], [ArgInfo(*arg) for arg in spec[2]]
+                        )
+                        for command, spec in commands.items()
+                    }
+                    for service, commands in cached["services"].items()
+                }
+        except (OSError, ValueError, KeyError, TypeError, IndexError):
+            pass  # Missing or corrupt cache.  Rebuild it.
+
+    manifest = _build_manifest()
+
+    if path:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = "%s.%d.tmp" % (path, os.getpid())
+            try:
+                with open(temp_path, "w") as f:
+                    json.dump({"fingerprint": fingerprint, "services": manifest}, f)
+                os.replace(temp_path, path)
+            finally:
+                # Only left behind if the manifest couldn't be written.
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+        except (OSError, TypeError, ValueError):
+            pass  # Caching is an optimization.  Continue without it.
+
+    return manifest
+
+
+def _resolve_command(spec):
+    """Import the module containing a command and return the command."""
+    module_name, _, attributes = spec.location.partition(":")
+    obj = import_module(module_name)
+    for attribute in attributes.split("."):
+        obj = getattr(obj, attribute)
+    return obj
+
+
+def _requested_service(args, services):
+    """Name of the service on the command line, if it can be determined."""
+    for arg in args:
+        if not arg.startswith("-"):
+            return arg if arg in services else None
+    return None
 
 
 def _get_func_description(func):
@@ -187,7 +357,33 @@ def _get_func_description(func):
         return lines[0]
 
 
-def _build_parser(services):
+def _parse_bool(value):
+    """Convert a command line value to a bool."""
+    value = value.strip().lower()
+    if value in ("true", "t", "yes", "y", "1"):
+        return True
+    if value in ("false", "f", "no", "n", "0"):
+        return False
+    raise argparse.ArgumentTypeError("expected a boolean value, got '%s'" % value)
+
+
+def _build_parser(services, service=None):
+    """Create the argument parser.
+
+    Parameters
+    ----------
+    services : dict
+        Maps each service to its commands.  Commands may be either functions
+        or `CommandSpec` instances.
+    service : str, optional
+        Only add arguments for the commands of this service.  Other services
+        are listed but cannot be parsed.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+
+    """
     from sasctl import __version__
 
     # TODO: Set command docstring
@@ -209,27 +405,43 @@ def _build_parser(services):
     subparsers = parser.add_subparsers(title="service", dest="service")
     subparsers.required = True
 
-    for service, commands in services.items():
-        service_parser = subparsers.add_parser(service)
+    for service_name, commands in services.items():
+        service_parser = subparsers.add_parser(service_name)
         service_subparser = service_parser.add_subparsers(
             title="command", dest="command"
         )
         service_subparser.required = True
 
+        if service is not None and service_name != service:
+            continue
+
         # Add the command and arguments for each command
-        for command in commands:
-            func = services[service][command]
+        for command, func in commands.items():
+            if isinstance(func, CommandSpec):
+                description, arguments = func.help, func.arguments
+            else:
+                description = _get_func_description(func)
+                arguments = func._cli_arguments()
 
-            cmd_parser = service_subparser.add_parser(
-                command, help=_get_func_description(func)
-            )
+            cmd_parser = service_subparser.add_parser(command, help=description)
 
-            for arg in func._cli_arguments():
+            for arg in arguments:
                 if arg.name in ("self", "cls"):
                     continue
 
                 if arg.required:
                     cmd_parser.add_argument(arg.name, help=arg.doc)
+                elif arg.type.partition(",")[0].strip() == "bool":
+                    # Allow both "--flag" and "--flag false" since any
+                    # non-empty string would otherwise be truthy.
+                    cmd_parser.add_argument(
+                        "--" + arg.name,
+                        type=_parse_bool,
+                        nargs="?",
+                        const=True,
+                        default=arg.default,
+                        help=arg.doc,
+                    )
                 else:
                     cmd_parser.add_argument(
                         "--" + arg.name,
@@ -245,10 +457,13 @@ def main(args=None):
     """Main entry point when executed as a command line utility."""
     from sasctl import Session, current_session
 
-    # Find all services and associated commands
-    services = _find_services()
+    args = sys.argv[1:] if args is None else args
 
-    parser = _build_parser(services)
+    # Find all services and associated commands.  The command itself is only
+    # imported once it's known which one is being executed.
+    services = _load_manifest()
+
+    parser = _build_parser(services, _requested_service(args, services))
     args = parser.parse_args(args)
 
     if args.verbose is None or args.verbose == 0:
@@ -265,7 +480,7 @@ def main(args=None):
 
     warnings.simplefilter("ignore")
 
-    func = services[args.service][args.command]
+    func = _resolve_command(services[args.service][args.command])
     kwargs = vars(args).copy()
 
     # Remove args that shouldn't be passed to the underlying command
@@ -291,6 +506,9 @@ def main(args=None):
             server, username, password, verify_ssl=verify_ssl
         ):
             result = func(**kwargs)
+            if isinstance(result, types.GeneratorType):
+                result = list(result)
+
             if isinstance(result, list):
                 pprint([str(x) for x in result])
             elif isinstance(result, dict) and args.format == "json":
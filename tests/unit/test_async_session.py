@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright © 2019, SAS Institute Inc., Cary, NC, USA.  All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+from sasctl import HTTPError, RestObj, Session
+from sasctl.core import AsyncSession, OAuth2Token, request_async
+from sasctl.services import microanalytic_score as mas
+
+httpx = pytest.importorskip("httpx")
+
+
+@pytest.fixture
+def session():
+    with mock.patch("sasctl.core.Session._get_authorization_token") as auth:
+        auth.return_value = OAuth2Token("token1", refresh_token="refresh")
+        with Session("example.com", "user", "password") as s:
+            yield s
+
+
+def test_request_async(session):
+    def handler(request):
+        assert request.headers["Authorization"] == "Bearer token1"
+        assert request.url.host == "example.com"
+
+        if request.url.path == "/missing":
+            return httpx.Response(404, text="Not found")
+        return httpx.Response(200, json={"id": "1", "name": "spam"})
+
+    async def run():
+        async with AsyncSession(session, transport=httpx.MockTransport(handler)) as s:
+            result = await request_async("get", "/spam", session=s)
+            assert isinstance(result, RestObj)
+            assert result.name == "spam"
+
+            with pytest.raises(HTTPError):
+                await request_async("get", "/missing", session=s)
+
+    asyncio.run(run())
+
+
+def test_token_refresh(session):
+    def handler(request):
+        if request.headers["Authorization"] == "Bearer token1":
+            return httpx.Response(
+                401, headers={"WWW-Authenticate": "Bearer, access token expired"}
+            )
+        return httpx.Response(200, json={"name": "spam"})
+
+    async def run():
+        async with AsyncSession(session, transport=httpx.MockTransport(handler)) as s:
+            return await request_async("get", "/spam", session=s)
+
+    with mock.patch(
+        "sasctl.core.Session._request_token_with_oauth",
+        return_value=OAuth2Token("token2"),
+    ) as refresh:
+        result = asyncio.run(run())
+
+    assert result.name == "spam"
+    assert refresh.call_count == 1
+    assert session.auth.access_token == "token2"
+
+
+def test_execute_module_step_async(session):
+    module = RestObj(name="unittestmodule", id="unittestmodule")
+
+    def handler(request):
+        assert (
+            request.url.path == "/microanalyticScore/modules/unittestmodule/steps/score"
+        )
+        return httpx.Response(200, json={"outputs": [{"name": "out", "value": "A "}]})
+
+    async def run():
+        async with AsyncSession(session, transport=httpx.MockTransport(handler)) as s:
+            calls = [
+                mas.execute_module_step_async(module, "score", session=s, x=i)
+                for i in range(10)
+            ]
+            return await asyncio.gather(*calls)
+
+    results = asyncio.run(run())
+    assert results == [{"out": "A"}] * 10
+
+
+def test_default_async_session_per_loop(session):
+    """Each event loop should get its own client, closed when the loop ends."""
+    clients = []
+    AsyncClient = httpx.AsyncClient
+
+    def client(**kwargs):
+        def handler(request):
+            return httpx.Response(200, json={"name": "spam"})
+
+        clients.append(AsyncClient(transport=httpx.MockTransport(handler), **kwargs))
+        return clients[-1]
+
+    async def run():
+        first = await request_async("get", "/spam", session=session)
+        second = await request_async("get", "/spam", session=session)
+        return first, second
+
+    with mock.patch("httpx.AsyncClient", side_effect=client):
+        assert asyncio.run(run())[0].name == "spam"
+        assert asyncio.run(run())[1].name == "spam"
+
+    # One client per loop, reused for requests on the same loop
+    assert len(clients) == 2
+    assert all(c.is_closed for c in clients)
@@ -29,6 +29,30 @@ def test_build_parser():
     assert args.insecure
 
 
+def test_bool_arguments():
+    """Boolean options should accept a flag or an explicit true/false value."""
+    import pytest
+
+    from sasctl.utils.cli import ArgInfo, _build_parser
+
+    func = mock.MagicMock()
+    func._cli_arguments.return_value = [
+        ArgInfo("stream", "bool, optional", False, False, "")
+    ]
+    func.__doc__ = "docstring for a mock function."
+
+    parser = _build_parser({"models": {"list": func}})
+
+    assert parser.parse_args("models list".split()).stream is False
+    assert parser.parse_args("models list --stream".split()).stream is True
+    assert parser.parse_args("models list --stream True".split()).stream is True
+    assert parser.parse_args("models list --stream False".split()).stream is False
+    assert parser.parse_args("models list --stream 0".split()).stream is False
+
+    with pytest.raises(SystemExit):
+        parser.parse_args("models list --stream maybe".split())
+
+
 def test_get_func_description():
     """Verify that function descriptions are correctly extracted from docstrings."""
     from sasctl.utils.cli import _get_func_description
@@ -146,3 +170,136 @@ def test_decorator():
         )
         == args[1]
     )
+
+
+def test_arguments_matched_by_name():
+    """Documentation should be matched to arguments even if `cls` is undocumented."""
+    from sasctl.utils.cli import sasctl_command
+
+    @sasctl_command("widgets", "get")
+    def get_widget(cls, name, refresh=False):
+        """Get a widget.
+
+        Parameters
+        ----------
+        name : str
+            name of the widget
+            which may span lines
+        refresh : bool, optional
+
+        """
+
+    args = {arg.name: arg for arg in get_widget._cli_arguments()}
+
+    assert ["cls", "name", "refresh"] == list(args)
+    assert args["name"].doc == "name of the widget"
+    assert args["refresh"].type == "bool, optional"
+    assert args["refresh"].doc == ""
+    assert args["cls"].doc is None
+
+
+def test_parse_parameters():
+    import inspect
+
+    from sasctl.utils.cli import _parse_parameters
+
+    assert _parse_parameters(None) == {}
+    assert _parse_parameters("No parameters.") == {}
+
+    doc = """Do something.
+
+    Parameters
+    ----------
+    x, y : int
+        coordinates
+        of the point
+    label
+    name : str, optional
+        display name
+
+    Returns
+    -------
+    None
+    """
+    assert _parse_parameters(inspect.cleandoc(doc)) == {
+        "x": ("int", "coordinates"),
+        "y": ("int", "coordinates"),
+        "label": ("str", ""),
+        "name": ("str, optional", "display name"),
+    }
+
+
+def test_manifest_cache(tmp_path):
+    """Commands should be loaded from the cache until sasctl changes."""
+    from sasctl.utils import cli
+
+    path = str(tmp_path / "commands.json")
+    manifest = cli._load_manifest(path)
+    spec = manifest["folders"]["list"]
+
+    assert spec.location == "sasctl._services.folders:Folders.list_folders"
+    assert spec.help.startswith("List all folders")
+
+    # Cached manifest is used without searching for commands
+    with mock.patch("sasctl.utils.cli._build_manifest") as build:
+        assert manifest == cli._load_manifest(path)
+    build.assert_not_called()
+
+    # Manifest is rebuilt if the installed package changes
+    with mock.patch(
+        "sasctl.utils.cli._package_fingerprint", return_value="changed"
+    ), mock.patch("sasctl.utils.cli._build_manifest", return_value={}) as build:
+        assert {} == cli._load_manifest(path)
+    build.assert_called_once()
+
+
+def test_package_fingerprint():
+    """Editing a service module should change the fingerprint."""
+    import os
+
+    from sasctl._services import folders
+    from sasctl.utils import cli
+
+    before = cli._package_fingerprint()
+    assert before == cli._package_fingerprint()
+
+    stat = os.stat(folders.__file__)
+    try:
+        os.utime(folders.__file__, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert before != cli._package_fingerprint()
+    finally:
+        os.utime(folders.__file__, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+def test_manifest_cache_write_failure(tmp_path):
+    """A manifest that can't be written shouldn't leave a temporary file."""
+    from sasctl.utils import cli
+
+    path = str(tmp_path / "commands.json")
+    with mock.patch("sasctl.utils.cli._build_manifest", return_value={}), mock.patch(
+        "json.dump", side_effect=TypeError
+    ):
+        assert {} == cli._load_manifest(path)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_main_resolves_requested_command(tmp_path, monkeypatch):
+    """Only the requested command is imported and executed."""
+    from sasctl.utils import cli
+
+    spec = cli.CommandSpec(
+        "sasctl._services.folders:Folders.list_folders",
+        "List all folders",
+        [cli.ArgInfo("filter", "str", False, None, "")],
+    )
+    monkeypatch.setenv("SASCTL_SERVER_NAME", "example.com")
+
+    with mock.patch(
+        "sasctl.utils.cli._load_manifest", return_value={"folders": {"list": spec}}
+    ), mock.patch("sasctl.current_session"), mock.patch(
+        "sasctl._services.folders.Folders.list_folders", return_value=[]
+    ) as list_folders:
+        cli.main(["folders", "list", "--filter", "eq(name,'Public')"])
+
+    list_folders.assert_called_once_with(filter="eq(name,'Public')")
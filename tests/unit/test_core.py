@@ -242,3 +242,428 @@ def test_version_info():
     assert VersionInfo(major=4, release="2022.09") == 4
     assert VersionInfo(major=4) >= 4
     assert VersionInfo(major=3) <= 4
+
+
+@pytest.mark.parametrize("codec_name", ["JSONCodec", "OrjsonCodec"])
+def test_json_codec(codec_name):
+    import json
+
+    import sasctl.core
+
+    if codec_name == "OrjsonCodec":
+        pytest.importorskip("orjson")
+    np = pytest.importorskip("numpy")
+
+    codec = getattr(sasctl.core, codec_name)()
+
+    obj = {
+        "int": np.int64(3),
+        "float": np.float32(0.5),
+        "bool": np.bool_(True),
+        "array": np.array([[1, 2], [3, 4]]),
+    }
+    result = json.loads(codec.dumps(obj))
+    assert result == {
+        "int": 3,
+        "float": 0.5,
+        "bool": True,
+        "array": [[1, 2], [3, 4]],
+    }
+
+    assert codec.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+    with pytest.raises(ValueError):
+        codec.loads(b"")
+
+
+def test_session_json_codec():
+    """Session should encode JSON bodies and decode responses with its codec."""
+    from requests import Response
+
+    from sasctl.core import JSONCodec, RestObj, Session, request
+
+    class Codec(JSONCodec):
+        dumps = mock.Mock(return_value=b'{"encoded": true}')
+        loads = mock.Mock(return_value={"name": "decoded"})
+
+    with mock.patch("sasctl.core.Session._get_authorization_token"):
+        s = Session("example.com", "user", "password", json_codec=Codec())
+
+    response = Response()
+    response.status_code = 200
+    response._content = b'{"name": "test"}'
+
+    with mock.patch("requests.Session.send", return_value=response) as send:
+        result = request("post", "/widgets", session=s, json={"a": 1})
+
+    Codec.dumps.assert_called_once_with({"a": 1})
+    prepared = send.call_args[0][0]
+    assert prepared.body == b'{"encoded": true}'
+    assert prepared.headers["Content-Type"] == "application/json"
+
+    assert isinstance(result, RestObj)
+    assert result.name == "decoded"
+
+
+def test_default_json_codec():
+    """orjson should only be used when requested."""
+    import sasctl.core
+    from sasctl.core import JSONCodec, OrjsonCodec, default_json_codec
+
+    with mock.patch.dict("os.environ", {}, clear=True):
+        assert type(default_json_codec()) is JSONCodec
+
+    with mock.patch.dict("os.environ", {"SASCTL_JSON_CODEC": "orjson"}):
+        with mock.patch.object(sasctl.core, "orjson", None):
+            with pytest.raises(RuntimeError):
+                default_json_codec()
+
+        pytest.importorskip("orjson")
+        assert isinstance(default_json_codec(), OrjsonCodec)
+
+    # The codecs differ in how they serialize NaN
+    assert JSONCodec().dumps({"a": float("nan")}) == b'{"a":NaN}'
+    assert OrjsonCodec().dumps({"a": float("nan")}) == b'{"a":null}'
+
+
+@pytest.mark.parametrize("codec_name", ["JSONCodec", "OrjsonCodec"])
+def test_decode_response(codec_name):
+    """Responses should be decoded into RestObj and honor declared charsets."""
+    from requests import Response
+
+    import sasctl.core
+    from sasctl.core import RestObj, _format_response
+
+    if codec_name == "OrjsonCodec":
+        pytest.importorskip("orjson")
+    codec = getattr(sasctl.core, codec_name)()
+
+    response = Response()
+    response.status_code = 200
+    response._content = '{"name": "caf\u00e9", "nested": {"a": 1}}'.encode("latin-1")
+    response.headers["Content-Type"] = "application/json; charset=ISO-8859-1"
+    response.encoding = "ISO-8859-1"
+
+    decoded = []
+    loads = codec.loads
+
+    def record_loads(*args, **kwargs):
+        decoded.append(loads(*args, **kwargs))
+        return decoded[-1]
+
+    with mock.patch.object(codec, "loads", side_effect=record_loads):
+        result = _format_response(response, codec=codec)
+
+    # Decoded directly into a RestObj rather than copied from a dict
+    assert result is decoded[0]
+    assert isinstance(result, RestObj)
+    assert result.name == "caf\u00e9"
+    assert result.nested.a == 1
+
+    # Plain JSON is still returned when requested
+    result = _format_response(response, format="json", codec=codec)
+    assert type(result) is dict
+
+
+def test_endpoint_name():
+    from sasctl.core import _endpoint_name
+
+    assert (
+        _endpoint_name(
+            "GET",
+            "https://example.com/files/files/0b7a4cb1-5b5e-4b5c-a28c-6b48a5e1a0f1"
+            "/content?limit=10",
+        )
+        == "GET /files/files/{id}/content"
+    )
+    assert _endpoint_name("DELETE", "/jobs/42") == "DELETE /jobs/{id}"
+    assert _endpoint_name("GET", "/folders/folders/@myFolder") == (
+        "GET /folders/folders/@myFolder"
+    )
+
+
+def test_metrics_recorder_percentiles():
+    from sasctl.core import MetricsEvent, MetricsRecorder
+
+    recorder = MetricsRecorder()
+    for i in range(1, 101):
+        recorder(MetricsEvent("request", "GET /files", i / 1000.0, status=200))
+    recorder(MetricsEvent("request", "GET /files", 1.0, error=ValueError()))
+
+    stats = recorder.summary()[("request", "GET /files")]
+    assert stats["count"] == 101
+    assert stats["errors"] == 1
+    assert stats["p50"] == 0.051
+    assert stats["p99"] == 0.1
+    assert stats["max"] == 1.0
+
+    # Memory is bounded by sampling once the limit is reached
+    recorder = MetricsRecorder(max_samples=10)
+    for i in range(100):
+        recorder(MetricsEvent("request", "GET /files", 0.01))
+    assert len(recorder._stats[("request", "GET /files")]["samples"]) == 10
+    assert recorder.summary()[("request", "GET /files")]["count"] == 100
+
+
+def _parse_multipart(content_type, body):
+    import email.parser
+
+    message = email.parser.BytesParser().parsebytes(
+        b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + body
+    )
+    return {
+        part.get_param("name", header="content-disposition"): (
+            part.get_filename(),
+            part.get_payload(decode=True),
+        )
+        for part in message.get_payload()
+    }
+
+
+def test_multipart_stream():
+    import io
+
+    import requests
+
+    from sasctl.core import MultipartStream
+
+    content = b"a,b\n1,2\n" * 10000
+    progress = []
+    body = MultipartStream(
+        {"file": ("data.csv", io.BytesIO(content), "text/csv")},
+        fields={"tableName": "TEST", "containsHeaderRow": True},
+        progress=lambda n, total: progress.append((n, total)),
+        chunk_size=1024,
+    )
+    request = requests.Request(
+        "POST", "http://example.com", data=body, headers=body.headers
+    ).prepare()
+
+    # Sent with a Content-Length instead of chunked encoding
+    assert request.headers["Content-Length"] == str(body.len)
+    assert "Transfer-Encoding" not in request.headers
+
+    data = b"".join(body)
+    assert len(data) == body.len
+    assert len(progress) == len(content) // 1024 + 1
+    assert progress[-1] == (len(content), len(content))
+
+    parts = _parse_multipart(body.headers["Content-Type"], data)
+    assert parts["tableName"] == (None, b"TEST")
+    assert parts["containsHeaderRow"] == (None, b"True")
+    assert parts["file"] == ("data.csv", content)
+
+    # Body can be sent again, e.g. after refreshing an expired token
+    body.rewind()
+    assert body.read() == data
+
+
+def test_multipart_stream_compressed():
+    import gzip
+    import io
+
+    import requests
+
+    from sasctl.core import MultipartStream
+
+    text = "x,y\n" * 1000
+    body = MultipartStream({"file": ("data.csv", io.StringIO(text))}, compress=True)
+    request = requests.Request(
+        "POST", "http://example.com", data=body, headers=body.headers
+    ).prepare()
+
+    # Compressed size isn't known in advance
+    assert not hasattr(body, "len")
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert request.headers["Transfer-Encoding"] == "chunked"
+
+    data = gzip.decompress(body.read())
+    parts = _parse_multipart(body.headers["Content-Type"], data)
+    assert parts["file"] == ("data.csv", text.encode())
+
+
+def test_multipart_stream_memory(tmp_path):
+    import tracemalloc
+
+    from sasctl.core import MultipartStream
+
+    size = 16 * 1024 * 1024
+    path = tmp_path / "large.bin"
+    with open(path, "wb") as f:
+        f.truncate(size)
+
+    with open(path, "rb") as f:
+        body = MultipartStream({"file": f})
+        tracemalloc.start()
+        try:
+            sent = sum(len(chunk) for chunk in body)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    assert sent == body.len > size
+    assert peak < 1024 * 1024
+
+
+def _streamed_response(status_code, content, fail_after=None, headers=None):
+    import io
+
+    import requests
+
+    class Raw(io.BytesIO):
+        def read(self, size=-1):
+            if fail_after is None:
+                return super().read(size)
+            if self.tell() >= fail_after:
+                raise requests.exceptions.ChunkedEncodingError("Connection reset")
+            return super().read(min(size, fail_after - self.tell()))
+
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = "https://example.com/files/files/abc/content"
+    response.raw = Raw(content)
+    response.headers.update(headers or {})
+    return response
+
+
+def test_iter_content_resumes_after_failure():
+    from sasctl.core import iter_content
+
+    content = bytes(range(256)) * 4000
+    session = mock.Mock()
+    session.request.side_effect = [
+        _streamed_response(200, content, fail_after=300000),
+        _streamed_response(206, content[300000:]),
+    ]
+
+    chunks = list(iter_content("/files/abc", session=session, chunk_size=65536))
+
+    assert b"".join(chunks) == content
+    assert max(len(c) for c in chunks) <= 65536
+    assert session.request.call_count == 2
+    assert session.request.call_args[1]["stream"] is True
+    assert session.request.call_args[1]["headers"]["Range"] == "bytes=300000-"
+
+    # Give up after too many failures
+    session.request.side_effect = [
+        _streamed_response(200, content, fail_after=1000),
+        _streamed_response(206, content[1000:], fail_after=0),
+    ]
+    with pytest.raises(Exception, match="Connection reset"):
+        list(iter_content("/files/abc", session=session, retries=1))
+
+
+def test_download(tmp_path):
+    import hashlib
+
+    from sasctl.core import download
+    from sasctl.exceptions import ChecksumMismatchError
+
+    content = bytes(range(256)) * 1000
+    checksum = "sha256:" + hashlib.sha256(content).hexdigest()
+    dest = tmp_path / "model.zip"
+    session = mock.Mock()
+
+    # Earlier partial downloads are only resumed if requested
+    (tmp_path / "model.zip.part").write_bytes(b"garbage")
+    session.request.return_value = _streamed_response(200, content)
+    assert download("/files/abc", dest, session=session, checksum=checksum) == str(dest)
+    assert "Range" not in session.request.call_args[1]["headers"]
+    assert dest.read_bytes() == content
+
+    # Resume from an earlier partial download.  The server ignores the
+    # Range header so the download starts over.
+    (tmp_path / "model.zip.part").write_bytes(b"garbage")
+    session.request.return_value = _streamed_response(200, content)
+    download("/files/abc", dest, session=session, checksum=checksum, resume=True)
+    assert session.request.call_args[1]["headers"]["Range"] == "bytes=7-"
+    assert dest.read_bytes() == content
+    assert not (tmp_path / "model.zip.part").exists()
+
+    # Corrupt content is removed instead of being resumed later
+    (tmp_path / "model.zip.part").write_bytes(b"garbage")
+    session.request.return_value = _streamed_response(206, content[7:])
+    with pytest.raises(ChecksumMismatchError):
+        download(
+            "/files/abc",
+            tmp_path / "model.zip",
+            session=session,
+            checksum=checksum,
+            resume=True,
+        )
+    assert not (tmp_path / "model.zip.part").exists()
+
+    with pytest.raises(ValueError):
+        download("/files/abc", dest, session=session, checksum="sha256")
+
+
+def test_download_resume_validated(tmp_path):
+    """Resumed downloads should start over if the resource changed."""
+    from sasctl.core import download
+
+    old, new = b"a" * 5000, b"b" * 3000
+    dest = tmp_path / "model.zip"
+    partial = tmp_path / "model.zip.part"
+    session = mock.Mock()
+
+    # The ETag of the partial content is kept so it can be sent in If-Range
+    session.request.side_effect = [
+        _streamed_response(200, old, fail_after=2000, headers={"ETag": '"v1"'}),
+    ]
+    with pytest.raises(Exception, match="Connection reset"):
+        download("/files/abc", dest, session=session, retries=0)
+    assert partial.read_bytes() == old[:2000]
+    assert (tmp_path / "model.zip.part.etag").read_text() == '"v1"'
+
+    # Resource changed, so the server sends all of the new content
+    session.request.side_effect = [
+        _streamed_response(200, new, headers={"ETag": '"v2"'}),
+    ]
+    download("/files/abc", dest, session=session, resume=True)
+    headers = session.request.call_args[1]["headers"]
+    assert headers["Range"] == "bytes=2000-"
+    assert headers["If-Range"] == '"v1"'
+    assert dest.read_bytes() == new
+    assert not (tmp_path / "model.zip.part.etag").exists()
+
+    # Partial content longer than the resource isn't treated as complete
+    partial.write_bytes(old)
+    session.request.side_effect = [
+        _streamed_response(416, b"", headers={"Content-Range": "bytes */3000"}),
+        _streamed_response(200, new),
+    ]
+    download("/files/abc", dest, session=session, resume=True)
+    assert "Range" not in session.request.call_args[1]["headers"]
+    assert dest.read_bytes() == new
+
+    # Partial content that is all of the resource is complete
+    partial.write_bytes(new)
+    session.request.side_effect = [
+        _streamed_response(416, b"", headers={"Content-Range": "bytes */3000"}),
+    ]
+    download("/files/abc", dest, session=session, resume=True)
+    assert dest.read_bytes() == new
+
+
+def test_iter_content_resource_changed():
+    """Content shouldn't be continued from a different version of a resource."""
+    from sasctl.core import iter_content
+    from sasctl.exceptions import ContentChangedError
+
+    content = b"a" * 5000
+    session = mock.Mock()
+    session.request.side_effect = [
+        _streamed_response(200, content, fail_after=2000, headers={"ETag": '"v1"'}),
+        _streamed_response(200, b"b" * 5000, headers={"ETag": '"v2"'}),
+    ]
+
+    with pytest.raises(ContentChangedError):
+        list(iter_content("/files/abc", session=session))
+    assert session.request.call_args[1]["headers"]["If-Range"] == '"v1"'
+
+    # Content received so far is longer than the resource
+    session.request.side_effect = [
+        _streamed_response(200, content, fail_after=2000),
+        _streamed_response(416, b"", headers={"Content-Range": "bytes */1000"}),
+    ]
+    with pytest.raises(ContentChangedError):
+        list(iter_content("/files/abc", session=session))
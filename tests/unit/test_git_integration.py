@@ -30,7 +30,7 @@ from sasctl.pzmm import GitIntegrate as GI
 def get_zipped_model_mocks():
     with patch.multiple(
         "sasctl._services.model_repository.ModelRepository",
-        get=DEFAULT,
+        export_model_to_zip=DEFAULT,
         get_model=DEFAULT,
         get_project=DEFAULT,
         list_models=DEFAULT,
@@ -71,7 +71,9 @@ def test_get_zipped_model(tmp_path_factory, get_zipped_model_mocks):
         {"name": "mtest", "id": "123abc", "projectName": "ptest"}
     )
     get_zipped_model_mocks["get_project"].return_value = RestObj({"name": "ptest"})
-    get_zipped_model_mocks["get"].return_value = bytes(b"789xyz")
+    get_zipped_model_mocks["export_model_to_zip"].side_effect = (
+        lambda model, dest, **kwargs: Path(dest).write_bytes(b"789xyz")
+    )
     get_zipped_model_mocks["list_models"].return_value = [
         RestObj({"name": "mtest", "id": "123abc", "projectName": "ptest"})
     ]
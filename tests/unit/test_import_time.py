@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright © 2019, SAS Institute Inc., Cary, NC, USA.  All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+# Maximum time (in milliseconds) that `import sasctl` may add on top of
+# importing `requests`, which sasctl can't avoid.  Measured relative to
+# `requests` so the test isn't sensitive to the speed of the machine.
+IMPORT_BUDGET_MS = float(os.environ.get("SASCTL_IMPORT_BUDGET_MS", 400))
+
+HEAVY_MODULES = ("numpy", "pandas", "swat", "sasctl.pzmm", "sasctl.tasks")
+
+
+def _import_sasctl():
+    code = "import sys, sasctl; print(' '.join(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    # Each line of -X importtime output looks like:
+    #   import time:   self [us] | cumulative | imported package
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+\s+\|\s+(\d+)\s+\|\s+(\S+)", line)
+        if match:
+            cumulative[match.group(2)] = int(match.group(1)) / 1000
+
+    return set(result.stdout.split()), cumulative
+
+
+# Python 3.6 has no module-level __getattr__, so everything is imported eagerly.
+lazy_imports = pytest.mark.skipif(
+    sys.version_info < (3, 7), reason="Lazy imports require Python 3.7"
+)
+
+
+@lazy_imports
+def test_import_does_not_load_heavy_dependencies():
+    modules, _ = _import_sasctl()
+
+    assert not modules.intersection(HEAVY_MODULES)
+
+
+def test_lazy_attributes():
+    import sasctl
+    from sasctl import services
+
+    assert sasctl.register_model.__module__ == "sasctl.tasks"
+    assert services.model_repository.__name__ == "ModelRepository"
+    assert "model_repository" in dir(services)
+
+    with pytest.raises(AttributeError):
+        _ = services.not_a_service
+
+    with pytest.raises(AttributeError):
+        _ = sasctl.not_an_attribute
+
+
+def test_eager_imports_without_module_getattr():
+    # Simulate Python 3.6, which ignores module-level __getattr__.
+    code = (
+        "import sys; sys.version_info = (3, 6, 15)\n"
+        "import sasctl\n"
+        "from sasctl import services\n"
+        "assert 'sasctl.tasks' in sys.modules\n"
+        "assert 'register_model' in vars(sasctl)\n"
+        "assert 'model_repository' in vars(services)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@lazy_imports
+def test_import_time_budget():
+    # Take the best of a few runs to smooth out noise from other processes.
+    overheads = []
+    for _ in range(3):
+        _, cumulative = _import_sasctl()
+        overheads.append(cumulative["sasctl"] - cumulative.get("requests", 0))
+
+    assert (
+        min(overheads) < IMPORT_BUDGET_MS
+    ), "import sasctl took %.0f ms longer than import requests" % min(overheads)
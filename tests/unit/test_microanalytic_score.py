@@ -225,3 +225,226 @@ def test_define_steps_invalid_name():
 
     for step in get_step.side_effect:
         assert hasattr(result, step.id)
+
+
+def test_execute_module_step_caches_module():
+    """Repeated calls should only look up the module once."""
+    module = RestObj(name="Unit Test Module", id="unittestmodule")
+
+    mas.clear_module_cache()
+    with mock.patch(
+        "sasctl._services.microanalytic_score.MicroAnalyticScore.get_module"
+    ) as get_module:
+        with mock.patch(
+            "sasctl._services.microanalytic_score.MicroAnalyticScore.post"
+        ) as post:
+            get_module.return_value = module
+            post.return_value = RestObj(outputs=[{"name": "out", "value": 1}])
+
+            for _ in range(3):
+                result = mas.execute_module_step("Unit Test Module", "score", x=1)
+                assert result == {"out": 1}
+
+            # Lookup by id should also be served from cache
+            mas.execute_module_step("unittestmodule", "score", x=1)
+
+    assert get_module.call_count == 1
+    assert post.call_count == 4
+    assert post.call_args[0][0] == "/modules/unittestmodule/steps/score"
+
+
+def test_module_cache_invalidation():
+    module = RestObj(name="Unit Test Module", id="unittestmodule")
+
+    mas.clear_module_cache()
+    with mock.patch(
+        "sasctl._services.microanalytic_score.MicroAnalyticScore.get_module"
+    ) as get_module:
+        with mock.patch(
+            "sasctl._services.microanalytic_score.MicroAnalyticScore.post"
+        ) as post:
+            with mock.patch(
+                "sasctl._services.microanalytic_score.MicroAnalyticScore.delete"
+            ):
+                get_module.return_value = module
+                post.return_value = RestObj(outputs=[])
+
+                mas.execute_module_step("Unit Test Module", "score")
+                mas.delete_module(module)
+                mas.execute_module_step("Unit Test Module", "score")
+                assert get_module.call_count == 2
+
+                # Expired entries should be requested again
+                with mock.patch.object(mas, "module_cache_ttl", 0):
+                    mas.clear_module_cache()
+                    mas.execute_module_step("Unit Test Module", "score")
+                    mas.execute_module_step("Unit Test Module", "score")
+                assert get_module.call_count == 4
+
+    mas.clear_module_cache()
+
+
+def test_module_cache_thread_safe():
+    """Concurrent reads, writes and clears of the cache shouldn't fail."""
+    import threading
+
+    mas.clear_module_cache()
+    errors = []
+
+    def use_cache(n):
+        try:
+            for i in range(500):
+                key = ("module", "module%d_%d" % (n, i % 20))
+                mas._cache_store(key, RestObj(id=key[1], name=key[1]))
+                mas._cache_lookup(key)
+                if i % 50 == 0:
+                    mas.clear_module_cache("module%d_0" % ((n + 1) % 4))
+        except Exception as e:  # skipcq PYL-W0703
+            errors.append(e)
+
+    threads = [threading.Thread(target=use_cache, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert mas._cache_lookup(("module", "module0_19")) is not None
+    mas.clear_module_cache()
+
+
+def test_execute_module_step_batch():
+    import numpy as np
+    import pandas as pd
+
+    module = RestObj(name="unittestmodule", id="unittestmodule")
+    step = RestObj(
+        id="score",
+        inputs=[{"name": "x", "type": "decimal"}, {"name": "y", "type": "integer"}],
+    )
+    df = pd.DataFrame({"x": [1.5, np.nan, 3.5], "y": [1, 2, 3]}, index=[10, 20, 30])
+
+    def fake_post(url, json=None):
+        inputs = {i["name"]: i["value"] for i in json["inputs"]}
+        assert url == "/modules/unittestmodule/steps/score"
+
+        # Values must be cast to the input types with NaN converted to null
+        assert set(inputs) == {"x", "y"}
+        assert type(inputs["y"]) is int
+        assert inputs["x"] is None or type(inputs["x"]) is float
+        return RestObj(
+            outputs=[
+                {"name": "y2", "value": inputs["y"] * 2},
+                {"name": "label", "value": "A   "},
+            ]
+        )
+
+    with mock.patch(
+        "sasctl._services.microanalytic_score.MicroAnalyticScore.post"
+    ) as post, mock.patch(
+        "sasctl._services.microanalytic_score.MicroAnalyticScore.get_module_step"
+    ) as get_step:
+        post.side_effect = fake_post
+        get_step.return_value = step
+
+        # Columns are matched ignoring case and extra columns are not sent
+        df = df.rename(columns={"y": "Y"}).assign(extra="z")
+        result = mas.execute_module_step_batch(module, "score", df, max_workers=2)
+        assert post.call_count == 3
+        assert list(result.index) == [10, 20, 30]
+        assert result["y2"].tolist() == [2, 4, 6]
+        assert result["label"].tolist() == ["A"] * 3
+        assert post.call_args_list[1][1]["json"]["inputs"][0]["value"] is None
+
+        # Records and arrays should produce the same results
+        result = mas.execute_module_step_batch(
+            module, "score", [{"x": 1.0, "y": 1}, {"x": 2.0, "y": 2}]
+        )
+        assert result["y2"].tolist() == [2, 4]
+
+        # Floats in an array are sent as integers to integer inputs
+        result = mas.execute_module_step_batch(
+            module, "score", np.array([[1.0, 4], [2.0, 5]])
+        )
+        assert result["y2"].tolist() == [8, 10]
+
+
+def test_execute_module_step_batch_bounded():
+    """Only a few rows per worker should be submitted before results are read."""
+    import concurrent.futures
+
+    import pandas as pd
+
+    module = RestObj(name="unittestmodule", id="unittestmodule")
+    step = RestObj(id="score", inputs=[{"name": "x", "type": "integer"}])
+    df = pd.DataFrame({"x": range(50)})
+
+    received = []
+
+    def fake_post(url, json=None):
+        x = json["inputs"][0]["value"]
+        received.append(x)
+        return RestObj(outputs=[{"name": "y", "value": x}])
+
+    submitted = []
+    submit = concurrent.futures.ThreadPoolExecutor.submit
+
+    def counting_submit(pool, *args, **kwargs):
+        submitted.append(len(received))
+        return submit(pool, *args, **kwargs)
+
+    with mock.patch(
+        "sasctl._services.microanalytic_score.MicroAnalyticScore.post",
+        side_effect=fake_post,
+    ), mock.patch(
+        "sasctl._services.microanalytic_score.MicroAnalyticScore.get_module_step",
+        return_value=step,
+    ), mock.patch.object(
+        concurrent.futures.ThreadPoolExecutor, "submit", counting_submit
+    ):
+        result = mas.execute_module_step_batch(module, "score", df, max_workers=2)
+
+    assert result["y"].tolist() == list(range(50))
+    # Never more than max_workers * 2 rows submitted ahead of those completed
+    assert all(i - done <= 4 for i, done in enumerate(submitted))
+
+
+def test_define_steps_batch():
+    """Multi-row DataFrames should be scored like single rows."""
+    import pandas as pd
+
+    module = RestObj(name="unittestmodule", id="unittestmodule", stepIds=["score"])
+    step = RestObj(
+        id="score",
+        inputs=[{"name": "x", "type": "decimal"}, {"name": "y", "type": "integer"}],
+    )
+
+    def fake_post(url, json=None):
+        inputs = {i["name"]: i["value"] for i in json["inputs"]}
+        assert set(inputs) == {"x", "y"}
+        assert type(inputs["x"]) is float and type(inputs["y"]) is int
+        return RestObj(
+            outputs=[
+                {"name": "rc", "value": 0},
+                {"name": "msg", "value": ""},
+                {"name": "total", "value": inputs["x"] + inputs["y"]},
+            ]
+        )
+
+    with mock.patch(
+        "sasctl._services.microanalytic_score.MicroAnalyticScore.get_module"
+    ) as get_module, mock.patch(
+        "sasctl._services.microanalytic_score.MicroAnalyticScore.get_module_step"
+    ) as get_step, mock.patch(
+        "sasctl._services.microanalytic_score.MicroAnalyticScore.post"
+    ) as post:
+        get_module.return_value = module
+        get_step.return_value = step
+        post.side_effect = fake_post
+
+        module = mas.define_steps(None)
+        df = pd.DataFrame({"X": [1, 2], "Y": [3.0, 4.0], "other": ["a", "b"]})
+        result = module.score(df)
+
+    assert list(result.columns) == ["total"]
+    assert result["total"].tolist() == [4.0, 6.0]
@@ -183,6 +183,84 @@ def test_get_model_by_name():
     assert result["name"] == MODEL_NAME
 
 
+def test_list_models_stream():
+    """Streaming should yield every item across pages and pass `fields`."""
+    import re
+
+    from sasctl.core import RestObj
+
+    with mock.patch("sasctl.core.Session._get_authorization_token"):
+        current_session("example.com", "user", "password")
+
+    models = [{"id": str(i), "name": "Model %d" % i} for i in range(7)]
+
+    def side_effect(verb, path, *args, **kwargs):
+        if "params" in kwargs:
+            # Initial request for the collection
+            assert "fields=id,name" in kwargs["params"]
+            assert "limit=3" in kwargs["params"]
+            return {
+                "items": models[:3],
+                "count": len(models),
+                "links": [
+                    {"rel": "next", "href": "/modelRepository/models?start=3&limit=3"}
+                ],
+            }
+        start = int(re.search(r"(?<=start=)[\d]+", path).group())
+        return RestObj(items=models[start : start + 3])
+
+    with mock.patch("sasctl.core.request") as request:
+        request.side_effect = side_effect
+        results = mr.list_models(stream=True, limit=3, fields=["id", "name"])
+
+        # Nothing should be requested until iteration starts
+        assert request.call_count == 0
+        names = [m.name for m in results]
+
+    assert names == [m["name"] for m in models]
+    assert request.call_count == 3
+
+
+def test_get_project_name_index():
+    """Repeated lookups by name should request the project by id."""
+    from sasctl import Session
+    from sasctl.core import RestObj
+
+    with mock.patch("sasctl.core.Session._get_authorization_token"):
+        current_session(Session("example.com", "user", "password", index_names=True))
+
+    PROJECT_ID = "a1b2c3d4-0000-0000-0000-000000000000"
+    PROJECT = {"id": PROJECT_ID, "name": "Project"}
+
+    def side_effect(verb, path, *args, **kwargs):
+        if path == "/modelRepository/projects":
+            return RestObj(PROJECT)
+        if path == "/modelRepository/projects/" + PROJECT_ID:
+            if verb == "delete":
+                return None
+            return RestObj(PROJECT)
+        raise AssertionError("Unexpected request %s" % path)
+
+    with mock.patch("sasctl.core.request") as request:
+        request.side_effect = side_effect
+
+        assert mr.get_project("Project").id == PROJECT_ID
+        assert mr.get_project("Project").id == PROJECT_ID
+
+        paths = [c[0][1] for c in request.call_args_list]
+
+        # Second lookup should skip the search by name
+        assert paths[-1] == "/modelRepository/projects/" + PROJECT_ID
+        assert paths.count("/modelRepository/projects") == 1
+        assert mr.name_index_stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+        # Deleting the project removes it from the index
+        mr.delete_project(RestObj(PROJECT))
+        mr.get_project("Project")
+        paths = [c[0][1] for c in request.call_args_list]
+        assert paths.count("/modelRepository/projects") == 2
+
+
 def test_add_model_content():
     with mock.patch(
         "sasctl._services.model_repository.ModelRepository.get_model",
@@ -230,3 +308,160 @@ def test_add_model_content():
             assert post.call_args[1]["files"] == {
                 "files": ("test.pkl", binary_data, "application/image")
             }
+
+
+def test_add_model_contents():
+    """Files should be uploaded concurrently and returned in order."""
+    import io
+    import threading
+
+    from sasctl.core import HTTPError
+
+    attempts = {}
+    lock = threading.Lock()
+
+    def post(url, files=None, params=None, **kwargs):
+        name, file, _ = files["files"]
+        data = file.read() if hasattr(file, "read") else file
+        with lock:
+            attempts[name] = attempts.get(name, 0) + 1
+            if name == "flaky.txt" and attempts[name] == 1:
+                raise HTTPError(url, 503, "Service Unavailable", {}, None)
+        assert data == b"stream"
+        return {"id": "content-" + name, "name": name}
+
+    files = [
+        {"name": "a.txt", "file": b"stream"},
+        {"name": "flaky.txt", "file": io.BytesIO(b"stream")},
+        {"name": "c.txt", "file": b"stream", "role": "score"},
+    ]
+
+    with mock.patch(
+        "sasctl._services.model_repository.ModelRepository.post", side_effect=post
+    ), mock.patch("time.sleep"):
+        results = mr.add_model_contents({"id": "123"}, files, max_workers=3)
+
+    assert [r["name"] for r in results] == ["a.txt", "flaky.txt", "c.txt"]
+    assert attempts == {"a.txt": 1, "flaky.txt": 2, "c.txt": 1}
+
+
+def test_add_model_contents_rollback():
+    """Uploaded files should be removed if any file fails."""
+    from sasctl.core import HTTPError, RestObj
+    from sasctl.exceptions import ContentUploadError
+
+    conflicts = []
+
+    def post(url, files=None, params=None, **kwargs):
+        name = files["files"][0]
+        if name == "bad.txt":
+            raise HTTPError(url, 400, "Bad Request", {}, None)
+        if name == "existing.txt" and not conflicts:
+            conflicts.append(name)
+            raise HTTPError(url, 409, "Conflict", {}, None)
+        return {"id": "content-" + name, "name": name}
+
+    files = [
+        {"name": "good.txt", "file": "x"},
+        {"name": "existing.txt", "file": "x"},
+        {"name": "bad.txt", "file": "x"},
+    ]
+
+    with mock.patch(
+        "sasctl._services.model_repository.ModelRepository.post", side_effect=post
+    ) as post_mock, mock.patch(
+        "sasctl._services.model_repository.ModelRepository.get_model_contents",
+        return_value=[RestObj(id="old", name="existing.txt")],
+    ), mock.patch(
+        "sasctl._services.model_repository.ModelRepository.delete"
+    ) as delete:
+        with pytest.raises(ContentUploadError) as e:
+            mr.add_model_contents({"id": "123"}, files, max_workers=1)
+
+    # Client errors are not retried
+    assert post_mock.call_count == 4
+    assert e.value.results[0]["name"] == "good.txt"
+    assert e.value.results[1]["name"] == "existing.txt"
+    assert isinstance(e.value.results[2], HTTPError)
+
+    # Content that replaced an existing file is kept since the original
+    # content can't be restored.
+    assert e.value.rolled_back == ["good.txt"]
+    assert delete.call_args_list == [
+        mock.call("/models/123/contents/old"),
+        mock.call("/models/123/contents/content-good.txt"),
+    ]
+
+
+def test_delete_model_contents():
+    """Files should be deleted concurrently and failures raised together."""
+    import threading
+    import time
+
+    from sasctl.core import HTTPError, RestObj
+    from sasctl.exceptions import DeleteError
+
+    contents = [
+        RestObj(
+            name="file%d" % i,
+            links=[{"rel": "delete", "uri": "/models/123/contents/%d" % i}],
+        )
+        for i in range(6)
+    ]
+    in_flight = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    def delete(uri):
+        with lock:
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        try:
+            time.sleep(0.05)
+            if uri.endswith("/5"):
+                raise HTTPError(uri, 500, "Server Error", {}, None)
+        finally:
+            with lock:
+                in_flight["now"] -= 1
+
+    with mock.patch(
+        "sasctl._services.model_repository.ModelRepository.get_model_contents",
+        return_value=contents,
+    ), mock.patch("sasctl._services.model_repository.delete", side_effect=delete):
+        results = mr.delete_model_contents("123", max_workers=3, return_exceptions=True)
+
+        assert results[:5] == [None] * 5
+        assert isinstance(results[5], HTTPError)
+        assert in_flight["max"] >= 2
+
+        # Failures are raised together by default
+        with pytest.raises(DeleteError) as e:
+            mr.delete_model_contents("123", max_workers=3)
+        assert e.value.results[:5] == [None] * 5
+        assert isinstance(e.value.__cause__, HTTPError)
+
+
+def test_delete_models():
+    from sasctl.exceptions import DeleteError
+
+    with mock.patch(
+        "sasctl._services.model_repository.ModelRepository.delete_model",
+        side_effect=[None, ValueError("failed")],
+    ) as delete_model:
+        results = mr.delete_models(["a", "b"], max_workers=1, return_exceptions=True)
+
+    assert delete_model.call_count == 2
+    assert results[0] is None
+    assert isinstance(results[1], ValueError)
+
+    with mock.patch(
+        "sasctl._services.model_repository.ModelRepository.delete_model",
+        side_effect=[None, ValueError("failed")],
+    ):
+        with pytest.raises(DeleteError, match="1 of 2 items"):
+            mr.delete_models(["a", "b"], max_workers=1)
+
+    with mock.patch(
+        "sasctl._services.model_repository.ModelRepository.delete_model",
+        return_value=None,
+    ):
+        assert mr.delete_models(["a", "b"]) == [None, None]
@@ -240,3 +240,22 @@ def test_copy(paging):
 
     for i, item in enumerate(actual):
         assert item.name == RestObj(target[i]).name
+
+
+def test_close():
+    """Closing the list should stop requests for further pages."""
+    obj = RestObj(
+        items=[{"name": "a"}],
+        count=3,
+        links=[{"rel": "next", "href": "/moaritems?start=1&limit=1"}],
+    )
+
+    with mock.patch("sasctl.core.request") as req:
+        req.return_value = RestObj(items=[{"name": "b"}])
+        with PagedList(obj, threads=1) as l:
+            pass
+
+        pager = l._paged_items._pager
+        assert pager._closed
+        assert not pager._requested
+        assert l[0].name == "a"
@@ -97,3 +97,147 @@ class TestPageIterator:
                     item_idx = init_count + (i - 1) * pager._limit + j
                 target = RestObj(items[item_idx])
                 assert item.name == target.name
+
+
+def test_stops_at_count():
+    """No pages past the reported count should be requested."""
+    import re
+
+    items = [{"name": str(i)} for i in range(25)]
+    obj = RestObj(
+        items=items[:5],
+        count=len(items),
+        links=[{"rel": "next", "href": "/moaritems?start=5&limit=5"}],
+    )
+
+    with mock.patch("sasctl.core.request") as req:
+
+        def side_effect(_, link, **kwargs):
+            start = int(re.search(r"(?<=start=)[\d]+", link).group())
+            limit = int(re.search(r"(?<=limit=)[\d]+", link).group())
+            return RestObj(items=items[start : start + limit])
+
+        req.side_effect = side_effect
+        pages = list(PageIterator(obj, threads=8))
+
+    assert sum(len(p) for p in pages) == len(items)
+    assert req.call_count == 4
+
+
+def test_custom_limit():
+    """Page size used for additional requests can be overridden."""
+    import re
+
+    items = [{"name": str(i)} for i in range(25)]
+    obj = RestObj(
+        items=items[:5],
+        count=len(items),
+        links=[{"rel": "next", "href": "/moaritems?start=5&limit=5"}],
+    )
+
+    with mock.patch("sasctl.core.request") as req:
+
+        def side_effect(_, link, **kwargs):
+            assert "limit=10" in link
+            start = int(re.search(r"(?<=start=)[\d]+", link).group())
+            return RestObj(items=items[start : start + 10])
+
+        req.side_effect = side_effect
+        pages = list(PageIterator(obj, limit=10))
+
+    assert [len(p) for p in pages] == [5, 10, 10]
+    assert req.call_count == 2
+
+
+def test_close_cancels_requests():
+    """Requests that haven't started should be cancelled when closed."""
+    import threading
+
+    release = threading.Event()
+    obj = RestObj(
+        items=[{"name": "a"}],
+        links=[{"rel": "next", "href": "/moaritems?start=1&limit=1"}],
+    )
+
+    with mock.patch("sasctl.core._PAGING_MAX_WORKERS", 1), mock.patch(
+        "sasctl.core._paging_executor", None
+    ), mock.patch("sasctl.core.request") as req:
+
+        def side_effect(*args, **kwargs):
+            release.wait(5)
+            return RestObj(items=[{"name": "b"}])
+
+        req.side_effect = side_effect
+        pager = PageIterator(obj, threads=4)
+        next(pager)
+        futures = list(pager._requested)
+        pager.close()
+        release.set()
+
+        # Only the request already running on the single worker completes.
+        assert sum(f.cancelled() for f in futures) == 3
+        futures[0].result()
+        assert req.call_count == 1
+
+
+def test_context_manager_releases_iterator():
+    """Pending requests shouldn't keep the iterator alive after it's closed."""
+    import gc
+    import threading
+    import weakref
+
+    release = threading.Event()
+    obj = RestObj(
+        items=[{"name": "a"}],
+        links=[{"rel": "next", "href": "/moaritems?start=1&limit=1"}],
+    )
+
+    with mock.patch("sasctl.core._PAGING_MAX_WORKERS", 1), mock.patch(
+        "sasctl.core._paging_executor", None
+    ), mock.patch("sasctl.core.request") as req:
+
+        def side_effect(*args, **kwargs):
+            release.wait(5)
+            return RestObj(items=[{"name": "b"}])
+
+        req.side_effect = side_effect
+        with PageIterator(obj, threads=4) as pager:
+            next(pager)
+            futures = list(pager._requested)
+
+        assert sum(f.cancelled() for f in futures) == 3
+
+        ref = weakref.ref(pager)
+        del pager
+        gc.collect()
+        assert ref() is None
+
+        release.set()
+        futures[0].result()
+
+
+def test_page_metrics():
+    """Each page downloaded by a worker should be reported to listeners."""
+    import re
+
+    from sasctl.core import MetricsRecorder
+
+    items = [{"name": str(i)} for i in range(12)]
+    obj = RestObj(
+        items=items[:4],
+        count=len(items),
+        links=[{"rel": "next", "href": "/files/files?start=4&limit=4"}],
+    )
+    session = mock.Mock(listeners=(MetricsRecorder(),))
+
+    with mock.patch("sasctl.core.request") as req:
+
+        def side_effect(_, link, **kwargs):
+            start = int(re.search(r"(?<=start=)[\d]+", link).group())
+            return RestObj(items=items[start : start + 4])
+
+        req.side_effect = side_effect
+        list(PageIterator(obj, session=session))
+
+    stats = session.listeners[0].summary("page")[("page", "GET /files/files")]
+    assert stats["count"] == 2
@@ -53,3 +53,60 @@ def test_pickle():
     new_obj = pickle.loads(pickled)
 
     assert obj == new_obj
+
+
+def test_nested_object_cached():
+    """Nested dictionaries should only be wrapped once."""
+    o = RestObj(nested={"a": 1})
+
+    assert isinstance(o.nested, RestObj)
+    assert o.nested is o.nested
+    assert o.nested.a == 1
+
+    # Changes to the nested object are visible through the dictionary
+    o.nested["b"] = 2
+    assert o["nested"]["b"] == 2
+
+
+def test_get_link_index():
+    from sasctl.core import get_link
+
+    links = [
+        {"rel": "self", "href": "/a"},
+        {"rel": "alternate", "href": "/b"},
+        {"rel": "alternate", "href": "/c"},
+    ]
+    o = RestObj(links=links)
+
+    assert get_link(o, "self")["href"] == "/a"
+    assert [l["href"] for l in get_link(o, "alternate")] == ["/b", "/c"]
+    assert get_link(o, "missing") is None
+
+    # Index should be updated if links change
+    o["links"].append({"rel": "up", "href": "/d"})
+    assert get_link(o, "up")["href"] == "/d"
+    o["links"] = [{"rel": "self", "href": "/e"}]
+    assert get_link(o, "self")["href"] == "/e"
+
+    # Objects with the same links share a single index
+    other = RestObj(links=[{"rel": "self", "href": "/f"}])
+    get_link(other, "self")
+    assert other._link_index[2] is o._link_index[2]
+
+
+def test_compact_links():
+    import json
+
+    from sasctl.core import _compact_links
+
+    text = json.dumps(
+        [
+            {"links": [{"rel": "self", "method": "GET", "href": "/%d" % i}]}
+            for i in range(2)
+        ]
+    )
+    a, b = [_compact_links(x) for x in json.loads(text)]
+
+    assert a["links"][0]["rel"] is b["links"][0]["rel"]
+    assert a["links"][0]["method"] is b["links"][0]["method"]
+    assert a["links"][0]["href"] == "/0"
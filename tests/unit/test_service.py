@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright © 2019, SAS Institute Inc., Cary, NC, USA.  All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest import mock
+
+import pytest
+
+from sasctl._services.service import JobMonitor, Service
+from sasctl.core import RestObj
+from sasctl.exceptions import JobTimeoutError
+
+
+def _job(name, state="running"):
+    return RestObj(
+        name=name, state=state, links=[{"rel": "self", "href": "/jobs/" + name}]
+    )
+
+
+def test_monitor_job_backoff():
+    """Wait between polls should increase up to the maximum."""
+    states = ["running", "running", "running", "completed"]
+
+    with mock.patch.object(
+        Service, "request_link", side_effect=[_job("a", s) for s in states]
+    ), mock.patch("time.sleep") as sleep:
+        job = Service._monitor_job(_job("a"), interval=0.5, max_interval=1.5)
+
+    assert job.state == "completed"
+    assert [c[0][0] for c in sleep.call_args_list] == [0.5, 1.0, 1.5, 1.5]
+
+
+def test_monitor_job_metrics():
+    """Listeners should be told how long a job was polled."""
+    events = []
+    session = mock.Mock(listeners=(events.append,))
+
+    with mock.patch.object(
+        Service, "request_link", side_effect=[_job("a"), _job("a", "completed")]
+    ), mock.patch("time.sleep"), mock.patch(
+        "sasctl.core.current_session", return_value=session
+    ):
+        Service._monitor_job(_job("a"))
+
+    assert len(events) == 1
+    assert events[0].kind == "job"
+    assert events[0].endpoint == "GET /jobs/a"
+    assert events[0].status == "completed"
+    assert events[0].retries == 2
+
+
+def test_monitor_job_timeout():
+    with mock.patch.object(Service, "request_link", return_value=_job("a")):
+        with pytest.raises(JobTimeoutError):
+            Service._monitor_job(_job("a"), timeout=0.05, interval=0.01)
+
+        # Deprecated `max_retries` polls at a fixed interval
+        with mock.patch("time.sleep") as sleep:
+            with pytest.raises(JobTimeoutError):
+                Service._monitor_job(_job("a"), max_retries=3)
+        assert [c[0][0] for c in sleep.call_args_list] == [0.5] * 3
+
+
+def test_job_monitor_multiple_jobs():
+    """A single monitor should track multiple jobs and run callbacks."""
+    polls = {"a": 0, "b": 0, "c": 0}
+
+    def request_link(job, rel, **kwargs):
+        polls[job.name] += 1
+        if job.name == "c":
+            return _job("c")
+        state = "completed" if polls[job.name] >= 2 else "running"
+        return _job(job.name, state)
+
+    monitor = JobMonitor(interval=0.01, max_interval=0.02)
+    callback = mock.Mock()
+
+    with mock.patch("sasctl.core.request_link", side_effect=request_link):
+        a = monitor.watch(_job("a"), callback=callback)
+        b = monitor.watch(_job("b"))
+        c = monitor.watch(_job("c"), timeout=0.1)
+
+        assert [j.state for j in monitor.wait([_job("d", "failed")])] == ["failed"]
+        assert a.result(5).state == "completed"
+        assert b.result(5).state == "completed"
+        with pytest.raises(JobTimeoutError):
+            c.result(5)
+
+    monitor.close()
+
+    callback.assert_called_once_with(a)
+    assert polls["a"] == polls["b"] == 2
+
+
+def test_job_monitor_cancelled_job():
+    """Cancelling a job while it's being polled shouldn't stop the monitor."""
+    import threading
+
+    polling = threading.Event()
+    release = threading.Event()
+
+    def request_link(job, rel, **kwargs):
+        if job.name == "a":
+            polling.set()
+            release.wait(5)
+        return _job(job.name, "completed")
+
+    monitor = JobMonitor(interval=0.01, max_interval=0.02)
+
+    with mock.patch("sasctl.core.request_link", side_effect=request_link):
+        a = monitor.watch(_job("a"))
+        assert polling.wait(5)
+        assert a.cancel()
+        release.set()
+
+        b = monitor.watch(_job("b"))
+        assert b.result(5).state == "completed"
+
+    monitor.close()
+    assert a.cancelled()
@@ -10,6 +10,7 @@ import os
 from unittest import mock
 
 import pytest
+import requests as requests_lib
 
 from sasctl import Session, current_session
 
@@ -73,6 +74,32 @@ def test_from_authinfo(tmpdir_factory):
     assert s._settings["password"] == PASSWORD
 
 
+def test_swat_only_imported_for_authinfo(tmpdir_factory):
+    filename = str(tmpdir_factory.mktemp("tmp").join("authinfo"))
+
+    # No authinfo file to read, so swat isn't needed
+    with mock.patch("sasctl.core._import_swat") as import_swat:
+        with mock.patch("sasctl.core.Session._get_authorization_token"):
+            Session("example.com", authinfo=filename)
+    import_swat.assert_not_called()
+
+    with open(filename, "w") as f:
+        f.write("machine example.com login user password password")
+
+    # Token sessions don't need credentials
+    with mock.patch("sasctl.core._import_swat") as import_swat:
+        with mock.patch("sasctl.core.Session._get_authorization_token"):
+            Session("example.com", token="token", authinfo=filename)
+    import_swat.assert_not_called()
+
+    with mock.patch("sasctl.core._import_swat") as import_swat:
+        with mock.patch("sasctl.core.Session._get_authorization_token"):
+            Session("example.com", authinfo=filename)
+    import_swat.assert_called_once()
+
+    current_session(None)
+
+
 def test_new_session(missing_packages):
     HOST = "example.com"
     USERNAME = "user"
@@ -240,6 +267,83 @@ def test_log_filtering(caplog):
                         assert d not in r.message
 
 
+def test_log_body_capped(caplog):
+    """DEBUG logging should truncate bodies and never deep copy messages."""
+    caplog.set_level(logging.DEBUG, logger="sasctl.core.session")
+
+    body = json.dumps({"access_token": "secretaccesstoken", "data": "x" * 100000})
+
+    with mock.patch("requests.Session.send") as mocked:
+        mocked.return_value.status_code = 200
+        mocked.return_value.url = "http://example.com/fakeurl"
+        mocked.return_value.headers = {}
+        mocked.return_value._content = body.encode("utf-8")
+
+        with mock.patch("sasctl.core.Session._get_authorization_token"):
+            with Session("example.com", "user", "password") as s:
+                with mock.patch("copy.deepcopy") as deepcopy:
+                    s.get("/fakeurl")
+                deepcopy.assert_not_called()
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert len(messages) == 2
+    for m in messages:
+        assert "secretaccesstoken" not in m
+        assert len(m) < Session.LOG_BODY_LIMIT + 500
+    assert "more bytes]" in messages[1]
+
+
+def test_log_filters_receive_request_and_response():
+    """Filters should be able to read any attribute of the request or response."""
+    import io
+
+    seen = []
+
+    def custom_filter(r):
+        if hasattr(r, "status_code"):
+            seen.append((r.status_code, r.url, r.text))
+            r._content = r._content.replace(b"private", b"[hidden]")
+        else:
+            seen.append((r.method, r.url))
+        return r
+
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+
+    with mock.patch("requests.Session.send") as mocked:
+        mocked.return_value.status_code = 200
+        mocked.return_value.url = "http://example.com/fakeurl"
+        mocked.return_value.headers = {}
+        mocked.return_value._content = b'{"value": "private"}'
+
+        with mock.patch("sasctl.core.Session._get_authorization_token"):
+            with Session("example.com", "user", "password") as s:
+                s.filters = [custom_filter]
+                s.add_logger(handler, level=logging.DEBUG)
+                s.get("/fakeurl")
+                s.message_log.removeHandler(handler)
+
+    assert ("GET", "https://example.com/fakeurl") in seen
+    assert (200, "http://example.com/fakeurl", '{"value": "private"}') in seen
+    assert "[hidden]" in stream.getvalue()
+    assert "private" not in stream.getvalue()
+
+
+def test_log_disabled_skips_formatting():
+    """Filters should not run when the message log is disabled."""
+    f = mock.Mock(side_effect=lambda r: r)
+
+    with mock.patch("requests.Session.send") as mocked:
+        with mock.patch("sasctl.core.Session._get_authorization_token"):
+            with Session("example.com", "user", "password") as s:
+                s.filters = [f]
+                s.message_log.setLevel(logging.WARNING)
+                s.get("/fakeurl")
+
+    assert mocked.call_count == 1
+    f.assert_not_called()
+
+
 def test_ssl_context():
     import os
 
@@ -469,3 +573,385 @@ def test_version_info_invalid_response(get, _):
 
     version = s.version_info()
     assert version is None
+
+
+def test_retries_and_pool_stats():
+    """Verify retryable responses are retried and pool usage is counted."""
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from sasctl.core import RetryPolicy
+
+    responses = {"/flaky": [503, 200], "/slow": [200] * 10}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/slow":
+                time.sleep(0.2)
+            status = responses[self.path].pop(0)
+            self.send_response(status)
+            self.send_header("Content-Length", "2")
+            if status == 503:
+                self.send_header("Retry-After", "0")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        do_POST = do_GET
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        with Session(
+            "http://127.0.0.1",
+            port=server.server_port,
+            token="token",
+            pool_maxsize=1,
+            pool_block=True,
+            max_retries=RetryPolicy(total=2, backoff_factor=0),
+        ) as s:
+            assert s.get("/flaky").status_code == 200
+            assert s.connection_stats.retries == 1
+
+            # Non-idempotent requests are not retried
+            responses["/flaky"] = [503, 200]
+            assert s.post("/flaky").status_code == 503
+            assert s.connection_stats.retries == 1
+
+            threads = [
+                threading.Thread(target=s.get, args=("/slow",)) for _ in range(3)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            assert s.connection_stats.pool_waits >= 1
+    finally:
+        server.shutdown()
+
+
+def test_retry_policy_backoff():
+    """Backoff should grow, include jitter, and be capped on any urllib3 version."""
+    from urllib3.util.retry import RequestHistory, Retry
+
+    from sasctl.core import RetryPolicy
+
+    history = tuple(RequestHistory("GET", "/", None, 503, None) for _ in range(3))
+    retry = RetryPolicy(total=5, backoff_factor=0.1, jitter=0.05).new(history=history)
+    assert 0.4 <= retry.get_backoff_time() <= 0.45
+
+    retry = RetryPolicy(total=20, backoff_factor=10).new(history=history * 5)
+    assert retry.get_backoff_time() == Retry.DEFAULT_BACKOFF_MAX
+
+    # urllib3 < 2 has no `backoff_max` attribute
+    retry.__dict__.pop("backoff_max", None)
+    with mock.patch.object(Retry, "get_backoff_time", return_value=500):
+        assert retry.get_backoff_time() == Retry.DEFAULT_BACKOFF_MAX
+
+    # Retries are opt-in
+    s = Session("example.com", token="token")
+    assert not isinstance(s.get_adapter("https://example.com").max_retries, RetryPolicy)
+
+
+def test_response_cache():
+    """GET responses should be revalidated with ETags and invalidated on PUT."""
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from sasctl.core import ResponseCache
+
+    requests = []
+    etag = {"value": '"v1"'}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests.append(("GET", self.path, self.headers.get("If-None-Match")))
+            if self.headers.get("If-None-Match") == etag["value"]:
+                self.send_response(304)
+                self.end_headers()
+                return
+            body = json.dumps({"etag": etag["value"]}).encode()
+            self.send_response(200)
+            self.send_header("ETag", etag["value"])
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_PUT(self):
+            requests.append(("PUT", self.path, None))
+            etag["value"] = '"v2"'
+            self.send_response(204)
+            self.end_headers()
+
+        def do_OPTIONS(self):
+            requests.append(("OPTIONS", self.path, None))
+            self.send_response(204)
+            self.send_header("Allow", "GET, PUT")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    cache = ResponseCache(ttls={"/ttl": 60})
+    try:
+        with Session(
+            "http://127.0.0.1", port=server.server_port, token="token", cache=cache
+        ) as s:
+            first = s.get("/models/1")
+            assert first.json() == {"etag": '"v1"'}
+
+            # Revalidated using the ETag and served from the cache.  Each caller
+            # gets its own copy of the response.
+            second = s.get("/models/1")
+            assert second is not first
+            assert second.json() == first.json()
+            assert second.headers["ETag"] == '"v1"'
+            assert requests[-1] == ("GET", "/models/1", '"v1"')
+            assert cache.stats["revalidations"] == 1
+
+            # Requests that don't modify the resource keep the cached copy
+            s.options("/models/1")
+            assert len(cache) == 1
+
+            # Updating the resource invalidates the cached copy
+            s.put("/models/1")
+            assert len(cache) == 0
+            assert s.get("/models/1").json() == {"etag": '"v2"'}
+            assert requests[-1] == ("GET", "/models/1", None)
+
+            # Within the TTL no request is made at all
+            count = len(requests)
+            s.get("/ttl/a")
+            s.get("/ttl/a").headers["ETag"] = "modified"
+            assert len(requests) == count + 1
+            assert cache.stats["hits"] == 1
+            assert s.get("/ttl/a").headers["ETag"] == '"v2"'
+    finally:
+        server.shutdown()
+
+
+def test_response_cache_refresh():
+    """Revalidated responses should keep their entry and pick up a new ETag."""
+    from sasctl.core import ResponseCache
+
+    cache = ResponseCache(ttl=60)
+    response = requests_lib.Response()
+    response.status_code = 200
+    response.headers["ETag"] = '"v1"'
+    response._content = b"{}"
+    key = ("http://example.com/models/1", None)
+    cache.put(key, response)
+    entry = cache.get(key)
+    entry.expires = 0
+    assert entry.expired
+
+    not_modified = requests_lib.Response()
+    not_modified.status_code = 304
+    not_modified.headers["ETag"] = '"v2"'
+    assert cache.refresh(key, not_modified) is entry
+    assert not entry.expired
+    assert entry.etag == '"v2"'
+    assert entry.to_response().content == b"{}"
+    assert cache.refresh(("http://example.com/other", None), not_modified) is None
+
+
+def test_response_cache_stats_thread_safe():
+    """Concurrent updates to cache statistics shouldn't be lost."""
+    import threading
+
+    from sasctl.core import ResponseCache
+
+    cache = ResponseCache()
+
+    def record():
+        for _ in range(1000):
+            cache.record("hits")
+
+    threads = [threading.Thread(target=record) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert cache.stats["hits"] == 8000
+
+
+def test_single_flight_token_refresh():
+    """Only one thread should refresh an expired token."""
+    import threading
+    import time
+
+    import requests
+
+    from sasctl.core import OAuth2Token
+
+    old_token = OAuth2Token("old", refresh_token="refresh")
+    new_token = OAuth2Token("new", refresh_token="refresh")
+
+    def refresh(*args, **kwargs):
+        time.sleep(0.1)
+        return new_token
+
+    def send(self, *args, **kwargs):
+        response = requests.Response()
+        if self.auth.access_token == "old":
+            response.status_code = 401
+            response.headers["WWW-Authenticate"] = "Bearer, access token expired"
+        else:
+            response.status_code = 200
+        return response
+
+    with mock.patch("sasctl.core.Session._get_authorization_token") as auth:
+        auth.return_value = old_token
+        s = Session("example.com")
+
+    with mock.patch(
+        "sasctl.core.Session._request_token_with_oauth", side_effect=refresh
+    ) as mock_refresh:
+        with mock.patch("requests.Session.request", send):
+            results = []
+            threads = [
+                threading.Thread(target=lambda: results.append(s.get("/spam")))
+                for _ in range(16)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+    assert mock_refresh.call_count == 1
+    assert s.auth is new_token
+    assert [r.status_code for r in results] == [200] * 16
+
+
+def test_proactive_token_refresh():
+    """Tokens about to expire should be refreshed before sending the request."""
+    from sasctl.core import OAuth2Token
+
+    old_token = OAuth2Token("old", refresh_token="refresh", expires_in=5)
+    new_token = OAuth2Token("new", refresh_token="refresh", expires_in=3600)
+
+    with mock.patch("sasctl.core.Session._get_authorization_token") as auth:
+        auth.return_value = old_token
+        s = Session("example.com")
+
+    with mock.patch(
+        "sasctl.core.Session._request_token_with_oauth", return_value=new_token
+    ) as mock_refresh:
+        with mock.patch("requests.Session.request") as mock_request:
+            mock_request.return_value.status_code = 200
+            s.get("/spam")
+            s.get("/spam")
+
+    assert mock_refresh.call_count == 1
+    assert mock_request.call_count == 2
+    assert s.auth is new_token
+
+
+def test_instrument_metrics():
+    """Listeners should receive latency, size, status, and retry counts."""
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from sasctl.core import RetryPolicy
+
+    attempts = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            attempts.append(self.path)
+            if self.path == "/files/flaky" and attempts.count(self.path) == 1:
+                status = 503
+            else:
+                status = 200
+            if self.path == "/files/slow":
+                time.sleep(0.05)
+            self.send_response(status)
+            self.send_header("Content-Length", "2")
+            if status == 503:
+                self.send_header("Retry-After", "0")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    events = []
+    try:
+        with Session(
+            "http://127.0.0.1",
+            port=server.server_port,
+            token="token",
+            max_retries=RetryPolicy(total=2, backoff_factor=0),
+        ) as s:
+            s.add_listener(events.append)
+
+            with s.instrument() as metrics:
+                for _ in range(5):
+                    s.get("/files/files/0b7a4cb1-5b5e-4b5c-a28c-6b48a5e1a0f1")
+                s.get("/files/slow")
+                s.get("/files/flaky")
+                s.post("/models", json={"name": "x"})
+
+            # Listeners are only called within the block
+            s.get("/files/slow")
+            assert metrics.summary()[("request", "GET /files/slow")]["count"] == 1
+
+            s.remove_listener(events.append)
+            s.get("/files/slow")
+    finally:
+        server.shutdown()
+
+    assert len(events) == 9
+    assert all(e.kind == "request" and e.service == "files" for e in events[:7])
+
+    summary = metrics.summary()
+    item = summary[("request", "GET /files/files/{id}")]
+    assert item["count"] == 5
+    assert item["bytes_received"] == 10
+    assert item["p50"] <= item["p95"] <= item["p99"] <= item["max"]
+
+    assert summary[("request", "GET /files/flaky")]["retries"] == 1
+    post = summary[("request", "POST /models")]
+    assert post["errors"] == 1
+    assert post["bytes_sent"] == len(b'{"name":"x"}')
+
+    assert metrics.slowest(1)[0][0] == "GET /files/slow"
+    assert "GET /files/slow" in metrics.report()
+
+
+def test_failing_listener_ignored(caplog):
+    """A broken listener must not break the request."""
+    with mock.patch("sasctl.core.Session._get_authorization_token"):
+        s = Session("example.com", "user", "password")
+
+    def broken(event):
+        raise ValueError()
+
+    response = mock.Mock(status_code=200, headers={}, raw=None)
+    response.__dict__["_content"] = b"{}"
+    s.add_listener(broken)
+
+    with mock.patch("sasctl.core.Session._transmit", return_value=response):
+        request = mock.Mock(method="GET", url="https://example.com/files", body=None)
+        assert s._send(request) is response
+
+    assert "Metrics listener" in caplog.text
+    current_session(None)
@@ -162,6 +162,43 @@ def test_register_model_403_error(get_project, list_repositories):
         register_model(None, "model name", "project name")
 
 
+def test_publish_models():
+    """Publishing jobs for multiple models should be monitored together."""
+    from sasctl.tasks import publish_models
+
+    def job(name, state):
+        return RestObj(
+            name=name,
+            state=state,
+            destination={"destinationType": "cas"},
+            links=[{"rel": "self", "href": "/jobs/" + name}],
+        )
+
+    submitted = []
+
+    def publish(model, destination, **kwargs):
+        submitted.append(model)
+        return job(model, "running")
+
+    with mock.patch(
+        "sasctl._services.model_publish.ModelPublish.get_destination"
+    ), mock.patch(
+        "sasctl._services.model_management.ModelManagement.publish_model",
+        side_effect=publish,
+    ), mock.patch(
+        "sasctl.core.request_link",
+        side_effect=lambda j, rel, **kwargs: job(j.name, "completed"),
+    ) as poll, mock.patch(
+        "sasctl.tasks.request_link", side_effect=lambda j, rel: j.name
+    ):
+        results = publish_models(["a", "b", "c"], "maslocal", timeout=30)
+
+    # All requests are submitted before any job is polled
+    assert submitted == ["a", "b", "c"]
+    assert poll.call_count == 3
+    assert results == ["a", "b", "c"]
+
+
 class TestFormatProperties(TestCase):
     _VARIABLE_PROPERTIES = ["name", "role", "type", "level", "length"]
     MODEL_PROPERTIES = [
@@ -165,11 +165,81 @@ def test_viya4_model_load():
     assert "tf.keras.models.load_model" in keras_text
 
 
+def test_lazy_model_load():
+    """
+    Test Cases:
+    - model is not loaded until load_model() is called
+    - concurrent callers load the model once
+    - load time is recorded
+    - joblib memory mapped loading
+    - mmap_mode without joblib raises an error
+    """
+    import threading
+    import time
+    from types import SimpleNamespace
+
+    joblib = pytest.importorskip("joblib")
+
+    class CountingPickle:
+        loads = 0
+
+        @classmethod
+        def load(cls, file):
+            cls.loads += 1
+            time.sleep(0.05)
+            return pickle.load(file)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with open(Path(tmp_dir) / "model.pickle", "wb") as f:
+            pickle.dump({"weights": [1, 2]}, f)
+        joblib.dump({"weights": np.arange(10.0)}, Path(tmp_dir) / "model.joblib")
+        settings = SimpleNamespace(pickle_path=tmp_dir)
+
+        sc.score_code = "import logging\nimport threading\nimport time\n"
+        sc.score_code += "from pathlib import Path\n"
+        assert sc._viya4_model_load("model.pickle", lazy_load=True) is None
+        namespace = {"pickle": CountingPickle, "settings": settings}
+        exec(sc.score_code, namespace)
+        sc.score_code = ""
+        assert namespace["model"] is None
+
+        threads = [threading.Thread(target=namespace["load_model"]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert CountingPickle.loads == 1
+        assert namespace["model"] == {"weights": [1, 2]}
+        assert namespace["model_load_seconds"] >= 0.05
+
+        sc.score_code = "import logging\nimport threading\nimport time\n"
+        sc.score_code += "import joblib\nfrom pathlib import Path\n"
+        sc._viya4_model_load(
+            "model.joblib", pickle_type="joblib", lazy_load=True, mmap_mode="r"
+        )
+        namespace = {"settings": settings}
+        exec(sc.score_code, namespace)
+        sc.score_code = ""
+        assert isinstance(namespace["load_model"]()["weights"], np.memmap)
+
+    with pytest.raises(ValueError):
+        sc.write_score_code(
+            "TestModel",
+            pd.DataFrame({"A": [1.0]}),
+            [lambda x: x, [1.0]],
+            model_file_name="model.pickle",
+            mmap_mode="r",
+        )
+
+
 def test_impute_missing_values():
     """
     Test Cases:
     - numeric data
     - character data
+    - generated function fills missing values by type
+    - no missing values
+    - only columns with imputation values are filled
     """
     test_df = pd.DataFrame(
         data=[[0, "a", 1], [2, "b", 0]], columns=["num", "char", "bin"]
@@ -178,6 +248,35 @@ def test_impute_missing_values():
     assert "'num': 1" in sc.score_code
     assert "'char': ''" in sc.score_code
     assert "'bin': 0" in sc.score_code
+    assert "apply(pd.to_numeric" not in sc.score_code
+
+    namespace = {"np": np, "pd": pd}
+    exec(sc.score_code, namespace)
+    impute_missing_values = namespace["impute_missing_values"]
+    row = pd.DataFrame({"num": None, "char": "           .", "bin": 1}, index=[0])
+    imputed = impute_missing_values(row)
+    assert imputed.loc[0, "num"] == 1.0
+    assert imputed["num"].dtype == float
+    assert imputed.loc[0, "char"] == ""
+    assert imputed.loc[0, "bin"] == 1
+    assert row.loc[0, "char"] == "           ."
+    assert impute_missing_values(test_df) is test_df
+
+    # Columns without imputation values are left alone
+    extra = row.assign(other=[None])
+    assert impute_missing_values(extra)["other"].isna().all()
+    subset = test_df[["num", "char"]]
+    assert impute_missing_values(subset) is subset
+    floats = pd.DataFrame({"num": [np.nan, 3.0], "char": ["x", np.nan]})
+    imputed = impute_missing_values(floats)
+    assert imputed["num"].tolist() == [1.0, 3.0]
+    assert imputed["char"].tolist() == ["x", ""]
+
+    # Integer modes stay integers when another column has several modes
+    binary_df = pd.DataFrame({"tie": [0, 1, 0, 1], "ones": [1, 1, 0, 1]})
+    modes = sc._impute_values(binary_df, True)
+    assert modes == {"tie": 0, "ones": 1}
+    assert isinstance(modes["ones"], int)
 
     sc._impute_missing_values(test_df, [5, "test", 1])
     assert "'num': 5" in sc.score_code
@@ -212,6 +311,243 @@ def test_predict_method():
     sc.score_code = ""
 
 
+def test_write_row_constants():
+    """
+    Test Cases:
+    - numeric variables
+    - mixed variables with imputation
+    """
+    sc.score_code = ""
+    sc._write_row_constants(["first", "second"], ["int64", "float64"])
+    assert "input_columns = ['first', 'second']" in sc.score_code
+    assert "input_dtype = float" in sc.score_code
+    assert "impute_defaults" not in sc.score_code
+    sc.score_code = ""
+
+    sc._write_row_constants(
+        ["first", "second", "third"],
+        ["object", "float64", "float64"],
+        {"first": "", "second": float("nan"), "third": 1.5},
+    )
+    assert "impute_defaults = (\n    '', np.nan, 1.5,\n)" in sc.score_code
+    assert "input_dtype = object" in sc.score_code
+    sc.score_code = ""
+
+
+def test_predict_method_array_input():
+    """
+    Test Cases:
+    - single row is converted to an array with imputation
+    - batches of rows still use a DataFrame
+    - concurrent calls don't share the array
+    """
+    import threading
+    import time
+
+    data = pd.DataFrame({"first": [1.0, 3.0], "second": [2.0, 4.0]})
+
+    class Model:
+        def predict(self, x):
+            self.input = x
+            return np.asarray(x, dtype=float).sum(axis=1)
+
+    sc.score_code = "import numpy as np\nimport pandas as pd\n\n"
+    sc._write_row_constants(
+        ["first", "second"], ["float64", "float64"], sc._impute_values(data, True)
+    )
+    sc.score_code += "def score(first, second):\n"
+    sc._predict_method(
+        Model.predict, ["first", "second"], missing_values=True, array_input=True
+    )
+    sc.score_code += "    return prediction\n"
+    assert "impute_missing_values(input_array)" in sc.score_code
+
+    namespace = {"model": Model(), "impute_missing_values": lambda df: df.fillna(0)}
+    exec(sc.score_code, namespace)
+    score = namespace["score"]
+    sc.score_code = ""
+
+    assert score(1.0, 5.0) == [6.0]
+    assert isinstance(namespace["model"].input, np.ndarray)
+    assert score(None, float("nan")) == [5.0]
+
+    assert score(pd.Series([1.0, 2.0]), pd.Series([3.0, None])) == [4.0, 2.0]
+    assert isinstance(namespace["model"].input, pd.DataFrame)
+
+    class SlowModel:
+        def predict(self, x):
+            time.sleep(0.001)
+            return np.asarray(x, dtype=float).sum(axis=1)
+
+    namespace["model"] = SlowModel()
+    results = {}
+
+    def run(i):
+        results[i] = [score(float(i), float(j)) for j in range(20)]
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == {i: [[i + j] for j in range(20)] for i in range(8)}
+
+
+def test_batch_output_columns():
+    """
+    Test Cases:
+    - prediction model
+    - binary model with probabilities and threshold
+    - binary model with a classification and a probability
+    - multiclass model with probabilities
+    - multiclass H2O.ai model
+    """
+    assert sc._batch_output_columns(["EM_PREDICTION"], [1.5]) == [
+        ("EM_PREDICTION", "p[:, 0]")
+    ]
+    assert sc._batch_output_columns(
+        ["I_Target", "P_1"], [0.4, 0.6], ["0", "1"], predict_threshold=0.3
+    ) == [
+        ("I_Target", "np.where(p[:, 1] > 0.3, '1', '0')"),
+        ("P_1", "p[:, 1]"),
+    ]
+    assert sc._batch_output_columns(["I_Target", "P_1"], ["1", 0.6], ["0", "1"]) == [
+        ("I_Target", "p[:, 0]"),
+        ("P_1", "p[:, 1].astype(float)"),
+    ]
+    assert sc._batch_output_columns(
+        ["I_Target", "P_A"], [0.2, 0.3, 0.5], ["A", "B", "C"]
+    ) == [
+        ("I_Target", "target_values[np.argmax(p, axis=1)]"),
+        ("P_A", "p.max(axis=1)"),
+    ]
+    assert sc._batch_output_columns(
+        "I_Target", [0.2, 0.3, 0.5], ["A", "B", "C"], h2o_model=True
+    ) == [("I_Target", "target_values[np.argmax(p[:, 1:].astype(float), axis=1)]")]
+
+
+def test_score_batch():
+    """
+    Test Cases:
+    - binary model matches per-row outputs
+    - multiclass model with classification and probabilities
+    - iterable of DataFrames returns a generator of outputs
+    """
+    data = pd.DataFrame({"first": [0.1, 0.7, 0.4], "second": [1.0, 2.0, 3.0]})
+
+    class Model:
+        def predict_proba(self, x):
+            proba = np.asarray(x["first"], dtype=float)
+            return np.column_stack([1 - proba, proba])
+
+        def predict_multi(self, x):
+            proba = np.asarray(x["first"], dtype=float) / 2
+            return np.column_stack([proba, 1 - 2 * proba, proba])
+
+    sc.score_code = "import numpy as np\nimport pandas as pd\n"
+    sc._score_batch(
+        Model.predict_proba,
+        ["first", "second"],
+        ["I_Target", "P_1"],
+        [0.5, 0.5],
+        target_values=["0", "1"],
+    )
+    namespace = {"model": Model()}
+    exec(sc.score_code, namespace)
+    sc.score_code = ""
+
+    output = namespace["score_batch"](data)
+    assert list(output.columns) == ["I_Target", "P_1"]
+    assert output["I_Target"].tolist() == ["0", "1", "0"]
+    assert np.allclose(output["P_1"], [0.1, 0.7, 0.4])
+
+    sc.score_code = "import numpy as np\nimport pandas as pd\n"
+    sc._score_batch(
+        Model.predict_multi,
+        ["first", "second"],
+        ["I_Target", "P_A", "P_B", "P_C"],
+        [0.2, 0.6, 0.2],
+        target_values=["A", "B", "C"],
+    )
+    namespace = {"model": Model()}
+    exec(sc.score_code, namespace)
+    sc.score_code = ""
+
+    output = namespace["score_batch"](data)
+    assert output["I_Target"].tolist() == ["B", "A", "B"]
+    assert np.allclose(output["P_B"], [0.9, 0.3, 0.6])
+
+    chunks = namespace["score_batch"](data.iloc[i : i + 2] for i in range(0, 3, 2))
+    chunks = list(chunks)
+    assert len(chunks) == 2
+    assert chunks[1].index.tolist() == [2]
+
+
+def test_score_batch_matches_score():
+    """
+    Test Cases:
+    - binary model returning string labels
+    - binary model returning probabilities
+    - multiclass model returning string labels
+    - regression model
+    - the return types passed in are not modified
+    """
+    data = pd.DataFrame({"first": [0.1, 0.7, 0.4], "second": [1.0, 2.0, 3.0]})
+
+    class Model:
+        def predict_binary(self, x):
+            return np.where(np.asarray(x["first"]) > 0.5, "B", "A")
+
+        def predict_proba(self, x):
+            proba = np.asarray(x["first"], dtype=float)
+            return np.column_stack([1 - proba, proba])
+
+        # The per-row outputs of these models expect a column of predictions
+        def predict_multi(self, x):
+            labels = np.asarray(["A", "B", "C"])[np.asarray(x["second"], dtype=int) - 1]
+            return labels.reshape(-1, 1)
+
+        def predict_regression(self, x):
+            return (np.asarray(x["first"], dtype=float) * 2).reshape(-1, 1)
+
+    cases = [
+        (Model.predict_binary, ["I_y"], ["B"], ["A", "B"]),
+        (Model.predict_proba, ["I_y", "P_B"], [0.5, 0.5], ["A", "B"]),
+        (Model.predict_multi, ["I_y"], ["B"], ["A", "B", "C"]),
+        (Model.predict_regression, ["EM_PREDICTION"], [1.5], None),
+    ]
+    for method, metrics, returns, target_values in cases:
+        expected_returns = list(returns)
+        sc.score_code = "import numpy as np\nimport pandas as pd\n\n"
+        sc.score_code += "def score(first, second):\n"
+        sc._predict_method(method, ["first", "second"])
+        sc.score_code += (
+            "    if isinstance(prediction, np.ndarray):\n"
+            "        prediction = prediction.tolist()\n"
+        )
+        sc._predictions_to_metrics(metrics, returns, target_values=target_values)
+        sc._score_batch(
+            method, ["first", "second"], metrics, returns, target_values=target_values
+        )
+        namespace = {"model": Model()}
+        exec(sc.score_code, namespace)
+        sc.score_code = ""
+
+        batch = namespace["score_batch"](data)
+        rows = [namespace["score"](*row) for row in data.itertuples(index=False)]
+        rows = [row if isinstance(row, tuple) else (row,) for row in rows]
+        assert list(batch.columns) == metrics
+        for i, row in enumerate(rows):
+            for metric, expected in zip(metrics, row):
+                actual = batch[metric].iloc[i]
+                if isinstance(expected, str):
+                    assert actual == expected
+                else:
+                    assert np.isclose(actual, expected)
+        assert returns == expected_returns
+
+
 def test_determine_returns_type():
     """
     Test cases:
@@ -225,6 +561,10 @@ def test_determine_returns_type():
     assert sc._determine_returns_type(["TestReturn", int, str]) == [True, False, True]
     assert sc._determine_returns_type([dict]) == [True]
 
+    returns = ["TestReturn", 1.2]
+    sc._determine_returns_type(returns)
+    assert returns == ["TestReturn", 1.2]
+
 
 def test_yield_score_metrics():
     """